@@ -3,14 +3,14 @@ This module provides base class for different deployment
 platforms like AWS, VMWare, Baremetal etc.
 """
 
-from copy import deepcopy
-import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, zip_longest
 import logging
-import tempfile
 import time
 
 import requests
-import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ocs_ci.deployment.ocp import OCPDeployment as BaseOCPDeployment
 
@@ -24,7 +24,6 @@ from ocs_ci.ocs.cluster import (
 from ocs_ci.ocs.exceptions import (
     CephHealthException,
     CommandFailed,
-    ResourceWrongStatusException,
     UnavailableResourceException,
     UnsupportedPlatformError,
     ExternalClusterDetailsException,
@@ -35,7 +34,7 @@ from ocs_ci.ocs.monitoring import (
     validate_pvc_created_and_bound_on_monitoring_pods,
     validate_pvc_are_mounted_on_monitoring_pods,
 )
-from ocs_ci.ocs.node import get_nodes, get_compute_node_names
+from ocs_ci.ocs.node import get_nodes
 from ocs_ci.ocs.resources.catalog_source import CatalogSource
 from ocs_ci.ocs.resources.csv import CSV
 from ocs_ci.ocs.resources.install_plan import wait_for_install_plan_and_approve
@@ -45,17 +44,17 @@ from ocs_ci.ocs.resources.packagemanifest import (
 )
 from ocs_ci.ocs.resources.pod import (
     get_all_pods,
-    validate_pods_are_respinned_and_running_state,
+    wait_for_pods_to_be_respinned,
 )
 from ocs_ci.ocs.uninstall import uninstall_ocs
 from ocs_ci.ocs.utils import setup_ceph_toolbox, collect_ocs_logs
 from ocs_ci.utility import templating
 from ocs_ci.utility.deployment import get_ocp_ga_version
 from ocs_ci.utility.localstorage import get_lso_channel
-from ocs_ci.utility.openshift_console import OpenshiftConsole
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import (
     ceph_health_check,
+    ceph_health_check_base,
     get_latest_ds_olm_tag,
     get_ocp_version,
     is_cluster_running,
@@ -65,12 +64,24 @@ from ocs_ci.utility.utils import (
     add_stage_cert,
     modify_csv,
     wait_for_machineconfigpool_status,
+    wait_for_machineconfigpool_update_start,
 )
 from ocs_ci.utility.vsphere_nodes import update_ntp_compute_nodes
 from ocs_ci.helpers import helpers
 
 logger = logging.getLogger(__name__)
 
+# HTTP session with connection pooling and retries used for quay.io API calls
+quay_session = requests.Session()
+quay_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
+
 
 class Deployment(object):
     """
@@ -97,6 +108,10 @@ class Deployment(object):
     is not needed), or point to a yaml file with custom storage class.
     """
 
+    # PackageManifest of OCS operator, it's looked up only once during
+    # deployment, see get_ocs_package_manifest
+    _ocs_package_manifest = None
+
     def __init__(self):
         self.platform = config.ENV_DATA["platform"]
         self.ocp_deployment_type = config.ENV_DATA["deployment_type"]
@@ -178,72 +193,47 @@ class Deployment(object):
         Label and taint worker nodes to be used by OCS operator
         """
 
-        nodes = ocp.OCP(kind="node").get().get("items", [])
-        worker_nodes = [
-            node
-            for node in nodes
-            if "node-role.kubernetes.io/worker" in node["metadata"]["labels"]
-        ]
-        if not worker_nodes:
-            raise UnavailableResourceException("No worker node found!")
+        _ocp = ocp.OCP(kind="node")
+        # let the API server filter out the worker nodes
+        worker_nodes = _ocp.get(selector=constants.WORKER_LABEL).get("items", [])
         az_worker_nodes = {}
         for node in worker_nodes:
             az = node["metadata"]["labels"].get(
                 "failure-domain.beta.kubernetes.io/zone"
             )
-            az_node_list = az_worker_nodes.get(az, [])
-            az_node_list.append(node)
-            az_worker_nodes[az] = az_node_list
-        logger.debug(f"Found the worker nodes in AZ: {az_worker_nodes}")
-        distributed_worker_nodes = []
-        while az_worker_nodes:
-            for az in list(az_worker_nodes.keys()):
-                az_node_list = az_worker_nodes.get(az)
-                if az_node_list:
-                    node_name = az_node_list.pop(0)["metadata"]["name"]
-                    distributed_worker_nodes.append(node_name)
-                else:
-                    del az_worker_nodes[az]
+            az_worker_nodes.setdefault(az, []).append(node)
+        if not worker_nodes:
+            raise UnavailableResourceException("No worker node found!")
+        logger.debug("Found the worker nodes in AZ: %s", az_worker_nodes)
+        # round-robin over AZs, taking one node from each AZ in turn
+        distributed_worker_nodes = [
+            node["metadata"]["name"]
+            for node in chain.from_iterable(zip_longest(*az_worker_nodes.values()))
+            if node is not None
+        ]
         logger.info(f"Distributed worker nodes for AZ: {distributed_worker_nodes}")
         to_label = config.DEPLOYMENT.get("ocs_operator_nodes_to_label", 3)
         to_taint = config.DEPLOYMENT.get("ocs_operator_nodes_to_taint", 0)
         worker_count = len(worker_nodes)
         if worker_count < to_label or worker_count < to_taint:
-            logger.info(f"All nodes: {nodes}")
             logger.info(f"Worker nodes: {worker_nodes}")
             raise UnavailableResourceException(
                 f"Not enough worker nodes: {worker_count} to label: "
                 f"{to_label} or taint: {to_taint}!"
             )
 
-        _ocp = ocp.OCP(kind="node")
+        node_cmds = []
         workers_to_label = " ".join(distributed_worker_nodes[:to_label])
         if workers_to_label:
-
-            logger.info(
-                f"Label nodes: {workers_to_label} with label: "
-                f"{constants.OPERATOR_NODE_LABEL}"
-            )
-            label_cmds = [
-                (
-                    f"label nodes {workers_to_label} "
-                    f"{constants.OPERATOR_NODE_LABEL} --overwrite"
-                )
-            ]
+            labels = [constants.OPERATOR_NODE_LABEL]
             if config.DEPLOYMENT.get("infra_nodes") and not config.ENV_DATA.get(
                 "infra_replicas"
             ):
-                logger.info(
-                    f"Label nodes: {workers_to_label} with label: "
-                    f"{constants.INFRA_NODE_LABEL}"
-                )
-                label_cmds.append(
-                    f"label nodes {workers_to_label} "
-                    f"{constants.INFRA_NODE_LABEL} --overwrite"
-                )
-
-            for cmd in label_cmds:
-                _ocp.exec_oc_cmd(command=cmd)
+                labels.append(constants.INFRA_NODE_LABEL)
+            labels_str = " ".join(labels)
+            logger.info(f"Label nodes: {workers_to_label} with labels: {labels_str}")
+            # all labels are applied to all nodes by one oc call
+            node_cmds.append(f"label nodes {workers_to_label} {labels_str} --overwrite")
 
         workers_to_taint = " ".join(distributed_worker_nodes[:to_taint])
         if workers_to_taint:
@@ -251,10 +241,19 @@ class Deployment(object):
                 f"Taint nodes: {workers_to_taint} with taint: "
                 f"{constants.OPERATOR_NODE_TAINT}"
             )
-            taint_cmd = (
+            node_cmds.append(
                 f"adm taint nodes {workers_to_taint} {constants.OPERATOR_NODE_TAINT}"
             )
-            _ocp.exec_oc_cmd(command=taint_cmd)
+
+        # labels and taints don't conflict with each other, so the commands
+        # can run in parallel
+        if node_cmds:
+            with ThreadPoolExecutor(max_workers=len(node_cmds)) as executor:
+                futures = [
+                    executor.submit(_ocp.exec_oc_cmd, command=cmd) for cmd in node_cmds
+                ]
+            for future in futures:
+                future.result()
 
     def create_stage_operator_source(self):
         """
@@ -268,10 +267,9 @@ class Deployment(object):
                 "password": config.DEPLOYMENT["stage_quay_password"],
             }
         }
-        token = requests.post(
+        token = quay_session.post(
             url="https://quay.io/cnr/api/v1/users/login",
-            data=json.dumps(credentials),
-            headers={"Content-Type": "application/json"},
+            json=credentials,
         ).json()["token"]
         stage_ns = config.DEPLOYMENT["stage_namespace"]
 
@@ -279,15 +277,17 @@ class Deployment(object):
         stage_os_secret = templating.load_yaml(constants.OPERATOR_SOURCE_SECRET_YAML)
         stage_os_secret["metadata"]["name"] = constants.OPERATOR_SOURCE_SECRET_NAME
         stage_os_secret["stringData"]["token"] = token
-        stage_secret_data_yaml = tempfile.NamedTemporaryFile(
-            mode="w+",
-            prefix=constants.OPERATOR_SOURCE_SECRET_NAME,
-            delete=False,
+        stage_secret_data_yaml = templating.dump_data_to_new_temp_yaml(
+            stage_os_secret, constants.OPERATOR_SOURCE_SECRET_NAME
+        )
+        run_cmd(f"oc create -f {stage_secret_data_yaml}")
+        logger.info("Waiting for secret to be available")
+        secret = ocp.OCP(
+            kind=constants.SECRET, namespace=constants.MARKETPLACE_NAMESPACE
+        )
+        secret.get(
+            resource_name=constants.OPERATOR_SOURCE_SECRET_NAME, retry=20, wait=0.5
         )
-        templating.dump_data_to_temp_yaml(stage_os_secret, stage_secret_data_yaml.name)
-        run_cmd(f"oc create -f {stage_secret_data_yaml.name}")
-        logger.info("Waiting 10 secs after secret is created")
-        time.sleep(10)
 
         logger.info("Adding Stage Operator Source")
         # create Operator Source
@@ -296,17 +296,16 @@ class Deployment(object):
         stage_os["spec"]["authorizationToken"][
             "secretName"
         ] = constants.OPERATOR_SOURCE_SECRET_NAME
-        stage_os_data_yaml = tempfile.NamedTemporaryFile(
-            mode="w+", prefix=constants.OPERATOR_SOURCE_NAME, delete=False
+        stage_os_data_yaml = templating.dump_data_to_new_temp_yaml(
+            stage_os, constants.OPERATOR_SOURCE_NAME
         )
-        templating.dump_data_to_temp_yaml(stage_os, stage_os_data_yaml.name)
-        run_cmd(f"oc create -f {stage_os_data_yaml.name}")
+        run_cmd(f"oc create -f {stage_os_data_yaml}")
         catalog_source = CatalogSource(
             resource_name=constants.OPERATOR_SOURCE_NAME,
             namespace=constants.MARKETPLACE_NAMESPACE,
         )
         # Wait for catalog source is ready
-        catalog_source.wait_for_state("READY")
+        catalog_source.wait_for_state("READY", watch=True)
 
     def create_ocs_operator_source(self):
         """
@@ -318,19 +317,35 @@ class Deployment(object):
         else:
             create_catalog_source()
 
+    def get_ocs_package_manifest(self):
+        """
+        Get PackageManifest of OCS operator. The package manifest is waited
+        for on the first call only, following calls return the same object.
+
+        Returns:
+            PackageManifest: PackageManifest object of OCS operator
+
+        """
+        if not self._ocs_package_manifest:
+            operator_selector = get_selector_for_ocs_operator()
+            package_manifest = PackageManifest(
+                resource_name=defaults.OCS_OPERATOR_NAME,
+                selector=operator_selector,
+                subscription_plan_approval=config.DEPLOYMENT.get(
+                    "subscription_plan_approval"
+                ),
+            )
+            # Wait for package manifest is ready
+            package_manifest.wait_for_resource(timeout=300)
+            self._ocs_package_manifest = package_manifest
+        return self._ocs_package_manifest
+
     def subscribe_ocs(self):
         """
         This method subscription manifest and subscribe to OCS operator.
 
         """
-        operator_selector = get_selector_for_ocs_operator()
-        # wait for package manifest
-        package_manifest = PackageManifest(
-            resource_name=defaults.OCS_OPERATOR_NAME,
-            selector=operator_selector,
-        )
-        # Wait for package manifest is ready
-        package_manifest.wait_for_resource(timeout=300)
+        package_manifest = self.get_ocs_package_manifest()
         default_channel = package_manifest.get_default_channel()
         subscription_yaml_data = templating.load_yaml(constants.SUBSCRIPTION_YAML)
         subscription_plan_approval = config.DEPLOYMENT.get("subscription_plan_approval")
@@ -351,14 +366,10 @@ class Deployment(object):
             subscription_yaml_data["spec"]["source"] = config.DEPLOYMENT.get(
                 "live_content_source", defaults.LIVE_CONTENT_SOURCE
             )
-        subscription_manifest = tempfile.NamedTemporaryFile(
-            mode="w+", prefix="subscription_manifest", delete=False
+        subscription_manifest = templating.dump_data_to_new_temp_yaml(
+            subscription_yaml_data, "subscription_manifest"
         )
-        templating.dump_data_to_temp_yaml(
-            subscription_yaml_data, subscription_manifest.name
-        )
-        run_cmd(f"oc create -f {subscription_manifest.name}")
-        subscription_plan_approval = config.DEPLOYMENT.get("subscription_plan_approval")
+        run_cmd(f"oc create -f {subscription_manifest}")
         if subscription_plan_approval == "Manual":
             wait_for_install_plan_and_approve(self.namespace)
 
@@ -368,8 +379,11 @@ class Deployment(object):
         """
         ui_deployment = config.DEPLOYMENT.get("ui_deployment")
         live_deployment = config.DEPLOYMENT.get("live_deployment")
+        local_storage = config.DEPLOYMENT.get("local_storage")
+        platform = self.platform.lower()
+        ocs_version = float(config.ENV_DATA["ocs_version"])
 
-        if config.DEPLOYMENT.get("local_storage"):
+        if local_storage:
             setup_local_storage(storageclass=self.DEFAULT_STORAGECLASS_LSO)
 
         if ui_deployment:
@@ -386,14 +400,7 @@ class Deployment(object):
         if not live_deployment:
             self.create_ocs_operator_source()
         self.subscribe_ocs()
-        operator_selector = get_selector_for_ocs_operator()
-        subscription_plan_approval = config.DEPLOYMENT.get("subscription_plan_approval")
-        package_manifest = PackageManifest(
-            resource_name=defaults.OCS_OPERATOR_NAME,
-            selector=operator_selector,
-            subscription_plan_approval=subscription_plan_approval,
-        )
-        package_manifest.wait_for_resource(timeout=300)
+        package_manifest = self.get_ocs_package_manifest()
         channel = config.DEPLOYMENT.get("ocs_csv_channel")
         csv_name = package_manifest.get_current_csv(channel=channel)
         csv = CSV(resource_name=csv_name, namespace=self.namespace)
@@ -409,13 +416,14 @@ class Deployment(object):
                 replace_to=config.DEPLOYMENT["csv_change_to"],
             )
 
-        # create custom storage class for StorageCluster CR if necessary
+        # custom storage class for StorageCluster CR is created together with
+        # StorageCluster if necessary
+        cluster_manifests = []
         if self.CUSTOM_STORAGE_CLASS_PATH is not None:
-            with open(self.CUSTOM_STORAGE_CLASS_PATH, "r") as custom_sc_fo:
-                custom_sc = yaml.load(custom_sc_fo, Loader=yaml.SafeLoader)
+            custom_sc = templating.load_yaml(self.CUSTOM_STORAGE_CLASS_PATH)
             # set value of DEFAULT_STORAGECLASS to mach the custom storage cls
             self.DEFAULT_STORAGECLASS = custom_sc["metadata"]["name"]
-            run_cmd(f"oc create -f {self.CUSTOM_STORAGE_CLASS_PATH}")
+            cluster_manifests.append(custom_sc)
 
         # creating StorageCluster
         if self.platform == constants.IBM_POWER_PLATFORM:
@@ -427,50 +435,45 @@ class Deployment(object):
 
         if self.platform == constants.IBM_POWER_PLATFORM:
             numberofstoragenodes = config.ENV_DATA["number_of_storage_nodes"]
-            deviceset = [None] * numberofstoragenodes
+            device_size = int(config.ENV_DATA.get("device_size", defaults.DEVICE_SIZE))
 
-            for i in range(numberofstoragenodes):
-                deviceset_data = cluster_data["spec"]["storageDeviceSets"][i]
-                device_size = int(
-                    config.ENV_DATA.get("device_size", defaults.DEVICE_SIZE)
+            # size of request for storage is the same for all device sets
+            if platform == "powervs":
+                pv_size_list = helpers.get_pv_size(
+                    storageclass=self.DEFAULT_STORAGECLASS_LSO
                 )
+                storage_request = f"{min(pv_size_list)}"
+            else:
+                storage_request = f"{device_size}Gi"
 
-                # set size of request for storage
-                if self.platform.lower() == "powervs":
-                    pv_size_list = helpers.get_pv_size(
-                        storageclass=self.DEFAULT_STORAGECLASS_LSO
-                    )
-                    pv_size_list.sort()
-                    deviceset_data["dataPVCTemplate"]["spec"]["resources"]["requests"][
-                        "storage"
-                    ] = f"{pv_size_list[0]}"
-                else:
-                    deviceset_data["dataPVCTemplate"]["spec"]["resources"]["requests"][
-                        "storage"
-                    ] = f"{device_size}Gi"
-
-                # set storage class to OCS default on current platform
-                if self.DEFAULT_STORAGECLASS_LSO:
-                    deviceset_data["dataPVCTemplate"]["spec"][
-                        "storageClassName"
-                    ] = self.DEFAULT_STORAGECLASS_LSO
+            # StorageCluster tweaks for LSO
+            if local_storage:
+                cluster_data["spec"]["manageNodes"] = False
+                cluster_data["spec"]["monDataDirHostPath"] = "/var/lib/rook"
+
+            deviceset = [
+                cluster_data["spec"]["storageDeviceSets"][i]
+                for i in range(numberofstoragenodes)
+            ]
+            # set storage class to OCS default on current platform, LSO
+            # deployments always use the LSO storage class
+            storage_class = self.DEFAULT_STORAGECLASS_LSO
+            set_storage_class = bool(storage_class) or local_storage
+            for deviceset_data in deviceset:
+                pvc_spec = deviceset_data["dataPVCTemplate"]["spec"]
+                pvc_spec["resources"]["requests"]["storage"] = storage_request
+                if set_storage_class:
+                    pvc_spec["storageClassName"] = storage_class
 
                 # StorageCluster tweaks for LSO
-                if config.DEPLOYMENT.get("local_storage"):
-                    cluster_data["spec"]["manageNodes"] = False
-                    cluster_data["spec"]["monDataDirHostPath"] = "/var/lib/rook"
+                if local_storage:
                     deviceset_data["portable"] = False
-                    deviceset_data["dataPVCTemplate"]["spec"][
-                        "storageClassName"
-                    ] = self.DEFAULT_STORAGECLASS_LSO
-
-                deviceset[i] = deviceset_data
         else:
             deviceset_data = cluster_data["spec"]["storageDeviceSets"][0]
             device_size = int(config.ENV_DATA.get("device_size", defaults.DEVICE_SIZE))
 
             # set size of request for storage
-            if self.platform.lower() == constants.BAREMETAL_PLATFORM:
+            if platform == constants.BAREMETAL_PLATFORM:
                 pv_size_list = helpers.get_pv_size(
                     storageclass=self.DEFAULT_STORAGECLASS_LSO
                 )
@@ -489,18 +492,17 @@ class Deployment(object):
                     "storageClassName"
                 ] = self.DEFAULT_STORAGECLASS
 
-            ocs_version = float(config.ENV_DATA["ocs_version"])
             ocp_version = float(get_ocp_version())
 
             # StorageCluster tweaks for LSO
-            if config.DEPLOYMENT.get("local_storage"):
+            if local_storage:
                 cluster_data["spec"]["manageNodes"] = False
                 cluster_data["spec"]["monDataDirHostPath"] = "/var/lib/rook"
                 deviceset_data["portable"] = False
                 deviceset_data["dataPVCTemplate"]["spec"][
                     "storageClassName"
                 ] = self.DEFAULT_STORAGECLASS_LSO
-                if self.platform.lower() == constants.AWS_PLATFORM:
+                if platform == constants.AWS_PLATFORM:
                     deviceset_data["count"] = 2
                 if ocs_version >= 4.5:
                     deviceset_data["resources"] = {
@@ -516,8 +518,7 @@ class Deployment(object):
             # The resources we need to change can be found here:
             # https://github.com/openshift/ocs-operator/blob/release-4.5/pkg/deploy-manager/storagecluster.go#L88-L116
             if config.DEPLOYMENT.get("allow_lower_instance_requirements"):
-                none_resources = {"Requests": None, "Limits": None}
-                deviceset_data["resources"] = deepcopy(none_resources)
+                deviceset_data["resources"] = {"Requests": None, "Limits": None}
                 resources = [
                     "mon",
                     "mds",
@@ -529,33 +530,31 @@ class Deployment(object):
                 if ocs_version >= 4.5:
                     resources.append("noobaa-endpoint")
                 cluster_data["spec"]["resources"] = {
-                    resource: deepcopy(none_resources) for resource in resources
+                    resource: {"Requests": None, "Limits": None}
+                    for resource in resources
                 }
                 if ocs_version >= 4.5:
                     cluster_data["spec"]["resources"]["noobaa-endpoint"] = {
                         "limits": {"cpu": 1, "memory": "500Mi"},
                         "requests": {"cpu": 1, "memory": "500Mi"},
                     }
-            else:
-                local_storage = config.DEPLOYMENT.get("local_storage")
-                platform = config.ENV_DATA.get("platform", "").lower()
-                if local_storage and platform == "aws":
-                    resources = {
-                        "mds": {
-                            "limits": {"cpu": 3, "memory": "8Gi"},
-                            "requests": {"cpu": 1, "memory": "8Gi"},
-                        }
+            elif local_storage and platform == constants.AWS_PLATFORM:
+                resources = {
+                    "mds": {
+                        "limits": {"cpu": 3, "memory": "8Gi"},
+                        "requests": {"cpu": 1, "memory": "8Gi"},
+                    }
+                }
+                if ocs_version < 4.5:
+                    resources["noobaa-core"] = {
+                        "limits": {"cpu": 2, "memory": "8Gi"},
+                        "requests": {"cpu": 1, "memory": "8Gi"},
                     }
-                    if ocs_version < 4.5:
-                        resources["noobaa-core"] = {
-                            "limits": {"cpu": 2, "memory": "8Gi"},
-                            "requests": {"cpu": 1, "memory": "8Gi"},
-                        }
-                        resources["noobaa-db"] = {
-                            "limits": {"cpu": 2, "memory": "8Gi"},
-                            "requests": {"cpu": 1, "memory": "8Gi"},
-                        }
-                    cluster_data["spec"]["resources"] = resources
+                    resources["noobaa-db"] = {
+                        "limits": {"cpu": 2, "memory": "8Gi"},
+                        "requests": {"cpu": 1, "memory": "8Gi"},
+                    }
+                cluster_data["spec"]["resources"] = resources
         # Enable host network if enabled in config (this require all the
         # rules to be enabled on underlaying platform).
         if config.DEPLOYMENT.get("host_network"):
@@ -576,11 +575,12 @@ class Deployment(object):
                 "enable": True,
             }
 
-        cluster_data_yaml = tempfile.NamedTemporaryFile(
-            mode="w+", prefix="cluster_storage", delete=False
+        cluster_manifests.append(cluster_data)
+        cluster_data_yaml = templating.dump_data_to_new_temp_yaml(
+            cluster_manifests, "cluster_storage"
         )
-        templating.dump_data_to_temp_yaml(cluster_data, cluster_data_yaml.name)
-        run_cmd(f"oc create -f {cluster_data_yaml.name}", timeout=2400)
+        run_cmd(f"oc create -f {cluster_data_yaml}", timeout=2400)
+        helpers.clear_cluster_caches()
         if config.DEPLOYMENT["infra_nodes"]:
             _ocp = ocp.OCP(kind="node")
             _ocp.exec_oc_cmd(
@@ -592,6 +592,9 @@ class Deployment(object):
         """
         This method will deploy OCS with openshift-console UI test.
         """
+        # Importing here as it's needed only for UI deployment
+        from ocs_ci.utility.openshift_console import OpenshiftConsole
+
         logger.info("Deployment of OCS will be done by openshift-console")
         ocp_console = OpenshiftConsole(
             config.DEPLOYMENT.get("deployment_browser", constants.CHROME_BROWSER)
@@ -617,14 +620,7 @@ class Deployment(object):
         if not live_deployment:
             self.create_ocs_operator_source()
         self.subscribe_ocs()
-        operator_selector = get_selector_for_ocs_operator()
-        subscription_plan_approval = config.DEPLOYMENT.get("subscription_plan_approval")
-        package_manifest = PackageManifest(
-            resource_name=defaults.OCS_OPERATOR_NAME,
-            selector=operator_selector,
-            subscription_plan_approval=subscription_plan_approval,
-        )
-        package_manifest.wait_for_resource(timeout=300)
+        package_manifest = self.get_ocs_package_manifest()
         channel = config.DEPLOYMENT.get("ocs_csv_channel")
         csv_name = package_manifest.get_current_csv(channel=channel)
         csv = CSV(resource_name=csv_name, namespace=self.namespace)
@@ -638,20 +634,15 @@ class Deployment(object):
         if not external_cluster_details:
             raise ExternalClusterDetailsException("No external cluster data found")
         secret_data["data"]["external_cluster_details"] = external_cluster_details
-        secret_data_yaml = tempfile.NamedTemporaryFile(
-            mode="w+", prefix="external_cluster_secret", delete=False
-        )
-        templating.dump_data_to_temp_yaml(secret_data, secret_data_yaml.name)
-        logger.info("Creating external cluster secret")
-        run_cmd(f"oc create -f {secret_data_yaml.name}")
 
         cluster_data = templating.load_yaml(constants.EXTERNAL_STORAGE_CLUSTER_YAML)
         cluster_data["metadata"]["name"] = config.ENV_DATA["storage_cluster_name"]
-        cluster_data_yaml = tempfile.NamedTemporaryFile(
-            mode="w+", prefix="external_cluster_storage", delete=False
+        cluster_data_yaml = templating.dump_data_to_new_temp_yaml(
+            [secret_data, cluster_data], "external_cluster_storage"
         )
-        templating.dump_data_to_temp_yaml(cluster_data, cluster_data_yaml.name)
-        run_cmd(f"oc create -f {cluster_data_yaml.name}", timeout=2400)
+        logger.info("Creating external cluster secret and storage cluster")
+        run_cmd(f"oc create -f {cluster_data_yaml}", timeout=2400)
+        helpers.clear_cluster_caches()
         self.external_post_deploy_validation()
         setup_ceph_toolbox()
 
@@ -685,22 +676,26 @@ class Deployment(object):
         self.deploy_ocs_via_operator()
         pod = ocp.OCP(kind=constants.POD, namespace=self.namespace)
         cfs = ocp.OCP(kind=constants.CEPHFILESYSTEM, namespace=self.namespace)
-        # Check for Ceph pods
-        assert pod.wait_for_resource(
-            condition="Running",
-            selector="app=rook-ceph-mon",
-            resource_count=3,
-            timeout=600,
-        )
-        assert pod.wait_for_resource(
-            condition="Running", selector="app=rook-ceph-mgr", timeout=600
-        )
-        assert pod.wait_for_resource(
-            condition="Running",
-            selector="app=rook-ceph-osd",
-            resource_count=3,
-            timeout=600,
+        # Check for Ceph pods, the pods are coming up concurrently so wait for
+        # all of them in parallel
+        ceph_pods = (
+            ("app=rook-ceph-mon", 3),
+            ("app=rook-ceph-mgr", 0),
+            ("app=rook-ceph-osd", 3),
         )
+        with ThreadPoolExecutor(max_workers=len(ceph_pods)) as executor:
+            futures = [
+                executor.submit(
+                    pod.wait_for_resource,
+                    condition="Running",
+                    selector=selector,
+                    resource_count=resource_count,
+                    timeout=600,
+                )
+                for selector, resource_count in ceph_pods
+            ]
+        for future in futures:
+            assert future.result()
 
         # validate ceph mon/osd volumes are backed by pvc
         validate_cluster_on_pvc()
@@ -749,15 +744,8 @@ class Deployment(object):
                 telemeter_server_url=config.ENV_DATA.get("telemeter_server_url"),
             )
 
-            # Take some time to respin the pod
-            waiting_time = 45
-            logger.info(f"Waiting {waiting_time} seconds...")
-            time.sleep(waiting_time)
-
-            # Validate the pods are respinned and in running state
-            retry((CommandFailed, ResourceWrongStatusException), tries=3, delay=15)(
-                validate_pods_are_respinned_and_running_state
-            )(pods_list)
+            # Wait for the pods to be respinned and in running state
+            wait_for_pods_to_be_respinned(pods_list, timeout=600)
 
             # Validate the pvc is created on monitoring pods
             validate_pvc_created_and_bound_on_monitoring_pods()
@@ -775,14 +763,18 @@ class Deployment(object):
                 telemeter_server_url=config.ENV_DATA["telemeter_server_url"]
             )
 
-        # Change registry backend to OCS CEPHFS RWX PVC
-        registry.change_registry_backend_to_ocs()
-
-        # Verify health of ceph cluster
+        # Change registry backend to OCS CEPHFS RWX PVC and verify health of
+        # ceph cluster, these are independent so run them in parallel
         # TODO: move destroy cluster logic to new CLI usage pattern?
         logger.info("Done creating rook resources, waiting for HEALTH_OK")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            registry_future = executor.submit(registry.change_registry_backend_to_ocs)
+            health_future = executor.submit(
+                self.wait_for_ceph_health_ok, tries=30, delay=10
+            )
+        registry_future.result()
         try:
-            ceph_health_check(namespace=self.namespace, tries=30, delay=10)
+            health_future.result()
         except CephHealthException as ex:
             err = str(ex)
             logger.warning(f"Ceph health check failed with {err}")
@@ -828,6 +820,54 @@ class Deployment(object):
         """
         raise NotImplementedError("add node functionality not implemented")
 
+    def wait_for_ceph_health_ok(self, tries=30, delay=10):
+        """
+        Wait for HEALTH_OK of the Ceph cluster. The health reported in the
+        CephCluster status is watched and once it's HEALTH_OK, the health is
+        verified by ceph_health_check_base from the toolbox pod. If the watch
+        ends or the verification fails, ceph_health_check polls for the rest
+        of the tries * delay budget.
+
+        Args:
+            tries (int): Number of retries of ceph_health_check, the whole
+                wait is limited to tries * delay seconds
+            delay (int): Delay in seconds between retries
+
+        Returns:
+            bool: True if HEALTH_OK
+
+        Raises:
+            CephHealthException: If the ceph health is not HEALTH_OK in time
+
+        """
+        deadline = time.time() + tries * delay
+        try:
+            return ceph_health_check_base(namespace=self.namespace)
+        except (CephHealthException, CommandFailed) as ex:
+            logger.info(f"Ceph cluster is not healthy yet: {ex}")
+        ceph_cluster = ocp.OCP(kind="CephCluster", namespace=self.namespace)
+        watch_cmd = "get CephCluster -o jsonpath='{.status.ceph.health}{\"\\n\"}'"
+        watch_timeout = max(int(deadline - time.time()), 1)
+        for health in ceph_cluster.exec_oc_watch(watch_cmd, timeout=watch_timeout):
+            logger.info(f"CephCluster reports health: {health}")
+            if health != "HEALTH_OK":
+                continue
+            try:
+                return ceph_health_check_base(namespace=self.namespace)
+            except (CephHealthException, CommandFailed) as ex:
+                # CephCluster status is refreshed by rook periodically, the
+                # reported health may be stale, the watch won't report it
+                # again so poll instead
+                logger.info(f"Ceph cluster is not healthy yet: {ex}")
+                break
+        remaining_tries = max(int(deadline - time.time()) // delay, 1)
+        logger.info(
+            f"Polling the Ceph health for the remaining {remaining_tries} tries"
+        )
+        return ceph_health_check(
+            namespace=self.namespace, tries=remaining_tries, delay=delay
+        )
+
     def patch_default_sc_to_non_default(self):
         """
         Patch storage class which comes as default with installation to non-default
@@ -872,8 +912,7 @@ def create_catalog_source(image=None, ignore_upgrade=False):
             '["registry-proxy.engineering.redhat.com"]}}}\''
         )
         run_cmd(f"oc apply -f {constants.STAGE_IMAGE_CONTENT_SOURCE_POLICY_YAML}")
-        logger.info("Sleeping for 60 sec to start update machineconfigpool status")
-        time.sleep(60)
+        wait_for_machineconfigpool_update_start(timeout=60)
         wait_for_machineconfigpool_status("all", timeout=1800)
     if not ignore_upgrade:
         upgrade = config.UPGRADE.get("upgrade", False)
@@ -904,17 +943,16 @@ def create_catalog_source(image=None, ignore_upgrade=False):
         catalog_source_data["spec"][
             "image"
         ] = f"{image}:{image_tag if image_tag else 'latest'}"
-    catalog_source_manifest = tempfile.NamedTemporaryFile(
-        mode="w+", prefix="catalog_source_manifest", delete=False
+    catalog_source_manifest = templating.dump_data_to_new_temp_yaml(
+        catalog_source_data, "catalog_source_manifest"
     )
-    templating.dump_data_to_temp_yaml(catalog_source_data, catalog_source_manifest.name)
-    run_cmd(f"oc create -f {catalog_source_manifest.name}", timeout=2400)
+    run_cmd(f"oc create -f {catalog_source_manifest}", timeout=2400)
     catalog_source = CatalogSource(
         resource_name=constants.OPERATOR_CATALOG_SOURCE_NAME,
         namespace=constants.MARKETPLACE_NAMESPACE,
     )
     # Wait for catalog source is ready
-    catalog_source.wait_for_state("READY")
+    catalog_source.wait_for_state("READY", watch=True)
 
 
 def setup_local_storage(storageclass):
@@ -943,25 +981,16 @@ def setup_local_storage(storageclass):
         optional_operators_data = templating.load_yaml(
             constants.LOCAL_STORAGE_OPTIONAL_OPERATORS, multi_document=True
         )
-        logger.info(
-            "Creating temp yaml file with optional operators data:\n %s",
-            optional_operators_data,
-        )
-        optional_operators_yaml = tempfile.NamedTemporaryFile(
-            mode="w+", prefix="optional_operators", delete=False
-        )
-        templating.dump_data_to_temp_yaml(
-            optional_operators_data, optional_operators_yaml.name
+        # the dumped (censored) data are logged by templating
+        logger.info("Creating temp yaml file with optional operators data")
+        optional_operators_yaml = templating.dump_data_to_new_temp_yaml(
+            optional_operators_data, "optional_operators"
         )
-        with open(optional_operators_yaml.name, "r") as f:
-            logger.info(f.read())
         logger.info(
             "Creating optional operators CatalogSource and ImageContentSourcePolicy"
         )
-        run_cmd(f"oc create -f {optional_operators_yaml.name}")
-        logger.info("Sleeping for 60 sec to start update machineconfigpool status")
-        # sleep here to start update machineconfigpool status
-        time.sleep(60)
+        run_cmd(f"oc create -f {optional_operators_yaml}")
+        wait_for_machineconfigpool_update_start(timeout=60)
         wait_for_machineconfigpool_status("all")
 
     logger.info("Retrieving local-storage-operator data from yaml")
@@ -988,17 +1017,12 @@ def setup_local_storage(storageclass):
                 data["spec"]["source"] = "optional-operators"
 
     # Create temp yaml file and create local storage operator
-    logger.info(
-        "Creating temp yaml file with local-storage-operator data:\n %s", lso_data
+    logger.info("Creating temp yaml file with local-storage-operator data")
+    lso_data_yaml = templating.dump_data_to_new_temp_yaml(
+        lso_data, "local_storage_operator"
     )
-    lso_data_yaml = tempfile.NamedTemporaryFile(
-        mode="w+", prefix="local_storage_operator", delete=False
-    )
-    templating.dump_data_to_temp_yaml(lso_data, lso_data_yaml.name)
-    with open(lso_data_yaml.name, "r") as f:
-        logger.info(f.read())
     logger.info("Creating local-storage-operator")
-    run_cmd(f"oc create -f {lso_data_yaml.name}")
+    run_cmd(f"oc create -f {lso_data_yaml}")
 
     local_storage_operator = ocp.OCP(kind=constants.POD, namespace=lso_namespace)
     assert local_storage_operator.wait_for_resource(
@@ -1039,7 +1063,12 @@ def setup_local_storage(storageclass):
         # Set local-volume-discovery namespace
         lvd_data["metadata"]["namespace"] = lso_namespace
 
-        worker_nodes = get_compute_node_names(no_replace=True)
+        # hostnames of the worker nodes, the same as get_compute_node_names()
+        # returns with no_replace=True, taken from the already fetched nodes
+        worker_nodes = [
+            worker.data["metadata"]["labels"][constants.HOSTNAME_LABEL]
+            for worker in workers
+        ]
 
         # Update local volume discovery data with Worker node Names
         logger.info(
@@ -1049,13 +1078,6 @@ def setup_local_storage(storageclass):
         lvd_data["spec"]["nodeSelector"]["nodeSelectorTerms"][0]["matchExpressions"][0][
             "values"
         ] = worker_nodes
-        lvd_data_yaml = tempfile.NamedTemporaryFile(
-            mode="w+", prefix="local_volume_discovery", delete=False
-        )
-        templating.dump_data_to_temp_yaml(lvd_data, lvd_data_yaml.name)
-
-        logger.info("Creating LocalVolumeDiscovery CR")
-        run_cmd(f"oc create -f {lvd_data_yaml.name}")
 
         # Pull local volume set yaml data
         logger.info("Pulling LocalVolumeSet CR data from yaml")
@@ -1088,12 +1110,13 @@ def setup_local_storage(storageclass):
         )
         lvs_data["spec"]["storageClassName"] = storageclass
 
-        lvs_data_yaml = tempfile.NamedTemporaryFile(
-            mode="w+", prefix="local_volume_set", delete=False
+        # LocalVolumeDiscovery and LocalVolumeSet CRs don't depend on each
+        # other, create both of them by one command
+        lvd_lvs_data_yaml = templating.dump_data_to_new_temp_yaml(
+            [lvd_data, lvs_data], "local_volume_discovery_set"
         )
-        templating.dump_data_to_temp_yaml(lvs_data, lvs_data_yaml.name)
-        logger.info("Creating LocalVolumeSet CR")
-        run_cmd(f"oc create -f {lvs_data_yaml.name}")
+        logger.info("Creating LocalVolumeDiscovery and LocalVolumeSet CRs")
+        run_cmd(f"oc create -f {lvd_lvs_data_yaml}")
     else:
         # Retrieve NVME device path ID for each worker node
         device_paths = get_device_paths(worker_names)
@@ -1117,26 +1140,27 @@ def setup_local_storage(storageclass):
         lv_data["spec"]["storageClassDevices"][0]["devicePaths"] = device_paths
 
         # Create temp yaml file and create local volume
-        lv_data_yaml = tempfile.NamedTemporaryFile(
-            mode="w+", prefix="local_volume", delete=False
-        )
-        templating.dump_data_to_temp_yaml(lv_data, lv_data_yaml.name)
+        lv_data_yaml = templating.dump_data_to_new_temp_yaml(lv_data, "local_volume")
         logger.info("Creating LocalVolume CR")
-        run_cmd(f"oc create -f {lv_data_yaml.name}")
+        run_cmd(f"oc create -f {lv_data_yaml}")
     logger.info("Waiting 30 seconds for PVs to create")
     storage_class_device_count = 1
     if platform == constants.AWS_PLATFORM:
         storage_class_device_count = 2
-    verify_pvs_created(len(worker_names) * storage_class_device_count)
+    verify_pvs_created(
+        len(worker_names) * storage_class_device_count, storageclass=storageclass
+    )
 
 
 @retry(AssertionError, 120, 10, 1)
-def verify_pvs_created(expected_pvs):
+def verify_pvs_created(expected_pvs, storageclass=None):
     """
     Verify that PVs were created and are in the Available state
 
     Args:
         expected_pvs (int): number of PVs to verify
+        storageclass (str): verify only PVs of this storage class, if not
+            specified all PVs are verified
 
     Raises:
         AssertionError: if any PVs are not in the Available state or if the
@@ -1144,20 +1168,27 @@ def verify_pvs_created(expected_pvs):
 
     """
     logger.info("Verifying PVs are created")
-    out = run_cmd("oc get pv -o json")
-    pv_json = json.loads(out)
-    assert pv_json["items"], f"No PVs created but we are expecting {expected_pvs}"
+    # get only the name, storage class and phase of PVs instead of whole PV
+    # objects, one PV per line
+    out = run_cmd(
+        'oc get pv -o jsonpath=\'{range .items[*]}{.metadata.name}{" "}'
+        '{.spec.storageClassName}{" "}{.status.phase}{"\\n"}{end}\''
+    )
+    pvs = [line.split() for line in out.splitlines() if line.strip()]
+    if storageclass:
+        pvs = [pv for pv in pvs if len(pv) == 3 and pv[1] == storageclass]
+    assert pvs, f"No PVs created but we are expecting {expected_pvs}"
 
     # check number of PVs created
-    num_pvs = len(pv_json["items"])
+    num_pvs = len(pvs)
     assert (
         num_pvs == expected_pvs
     ), f"{num_pvs} PVs created but we are expecting {expected_pvs}"
 
     # checks the state of PV
-    for pv in pv_json["items"]:
-        pv_state = pv["status"]["phase"]
-        pv_name = pv["metadata"]["name"]
+    for pv in pvs:
+        pv_name = pv[0]
+        pv_state = pv[-1]
         logger.info(f"{pv_name} is in {pv_state} state")
         assert (
             pv_state == "Available"
@@ -1195,9 +1226,12 @@ def get_device_paths(worker_names):
         raise UnsupportedPlatformError(
             "LSO deployment is not supported for platform: %s", platform
         )
-    for worker in worker_names:
-        logger.info("Retrieving device path for node: %s", worker)
-        out = _get_disk_by_id(worker)
+    # each oc debug command starts its own debug pod, run them in parallel
+    logger.info("Retrieving device paths for nodes: %s", worker_names)
+    with ThreadPoolExecutor(max_workers=min(len(worker_names), 16) or 1) as executor:
+        futures = [executor.submit(_get_disk_by_id, worker) for worker in worker_names]
+    for future in futures:
+        out = future.result()
         out_lines = out.split("\n")
         nvme_lines = [
             line
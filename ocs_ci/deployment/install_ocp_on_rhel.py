@@ -3,6 +3,7 @@ This module will install OCP on RHEL nodes
 """
 import logging
 import os
+import posixpath
 
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants
@@ -48,7 +49,7 @@ class OCPINSTALLRHEL(object):
         )
         self.rhel_worker_nodes = rhel_worker_nodes
         self.ssh_key_pem = config.DEPLOYMENT["ssh_key_private"]
-        self.pod_ssh_key_pem = os.path.join(
+        self.pod_ssh_key_pem = posixpath.join(
             constants.POD_UPLOADPATH, self.ssh_key_pem.split("/")[-1]
         )
         self.ops_mirror_pem = os.path.join(f"{constants.DATA_DIR}", constants.OCP_PEM)
@@ -58,10 +59,10 @@ class OCPINSTALLRHEL(object):
         )
         self.pod_name = "rhelpod"
         self.pull_secret_path = os.path.join(constants.TOP_DIR, "data", "pull-secret")
-        self.pod_pull_secret_path = os.path.join(
+        self.pod_pull_secret_path = posixpath.join(
             constants.POD_UPLOADPATH, "pull-secret"
         )
-        self.pod_kubeconfig_path = os.path.join(
+        self.pod_kubeconfig_path = posixpath.join(
             constants.POD_UPLOADPATH,
             config.RUN.get("kubeconfig_location").split("/")[-1],
         )
@@ -202,11 +203,11 @@ class OCPINSTALLRHEL(object):
             self.rhelpod.copy_to_server(
                 node,
                 self.pod_ssh_key_pem,
-                os.path.join(constants.YUM_REPOS_PATH, self.ocp_repo.split("/")[-1]),
+                posixpath.join(constants.YUM_REPOS_PATH, self.ocp_repo.split("/")[-1]),
                 constants.RHEL_TMP_PATH,
                 user=constants.VM_RHEL_USER,
             )
-            ocp_repo_path_in_rhel = os.path.join(
+            ocp_repo_path_in_rhel = posixpath.join(
                 constants.RHEL_TMP_PATH, self.ocp_repo.split("/")[-1]
             )
             cmd = f"sudo cp {ocp_repo_path_in_rhel} {constants.YUM_REPOS_PATH}"
@@ -218,11 +219,13 @@ class OCPINSTALLRHEL(object):
             self.rhelpod.copy_to_server(
                 node,
                 self.pod_ssh_key_pem,
-                os.path.join(constants.PEM_PATH, constants.OCP_PEM),
+                posixpath.join(constants.PEM_PATH, constants.OCP_PEM),
                 constants.RHEL_TMP_PATH,
                 user=constants.VM_RHEL_USER,
             )
-            pem_path_in_rhel = os.path.join(constants.RHEL_TMP_PATH, constants.OCP_PEM)
+            pem_path_in_rhel = posixpath.join(
+                constants.RHEL_TMP_PATH, constants.OCP_PEM
+            )
             cmd = f"sudo cp {pem_path_in_rhel} {constants.PEM_PATH}"
             self.rhelpod.exec_cmd_on_node(
                 node, self.pod_ssh_key_pem, cmd, user=constants.VM_RHEL_USER
@@ -233,7 +236,7 @@ class OCPINSTALLRHEL(object):
         Run ansible-playbook on pod
         """
         cmd = (
-            f"ansible-playbook -i {os.path.join(constants.POD_UPLOADPATH, constants.INVENTORY_FILE)}"
+            f"ansible-playbook -i {posixpath.join(constants.POD_UPLOADPATH, constants.INVENTORY_FILE)}"
             f" {constants.SCALEUP_ANSIBLE_PLAYBOOK}"
             f" --private-key={self.pod_ssh_key_pem} -v"
         )
@@ -4,17 +4,18 @@ Helper functions file for OCS QE
 import base64
 import datetime
 import hashlib
+import itertools
 import json
 import logging
 import os
 import re
+import secrets
 import statistics
 import tempfile
-import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from subprocess import PIPE, TimeoutExpired, run
-from uuid import uuid4
 
 import yaml
 
@@ -27,12 +28,12 @@ from ocs_ci.ocs.exceptions import (
     TimeoutExpiredError,
     UnavailableBuildException,
     UnexpectedBehaviour,
+    UnexpectedVolumeType,
 )
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.resources import pod, pvc
 from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.utility import templating
-from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import (
     TimeoutSampler,
     ocsci_log_path,
@@ -42,11 +43,19 @@ from ocs_ci.utility.utils import (
 
 logger = logging.getLogger(__name__)
 
+# csi-provisioner log lines, e.g.
+# I0101 10:00:00.000000  1 controller.go:1199] provision "ns/pvc-name" class "sc": started
+# I0101 10:00:00.000000  1 controller.go:1453] delete "pvc-uuid": succeeded
+PROVISION_LOG_PATTERN = re.compile(
+    r'provision "(?:[^"]*/)?([^"/]+)"[^:]*: (started|succeeded)'
+)
+DELETE_LOG_PATTERN = re.compile(r'delete "([^"]+)": (started|succeeded)')
+
 
 def create_unique_resource_name(resource_description, resource_type):
     """
     Creates a unique object name by using the object_description,
-    object_type and a random uuid(in hex) as suffix
+    object_type and a random 12 characters long hex string as suffix
 
     Args:
         resource_description (str): The user provided object description
@@ -56,7 +65,7 @@ def create_unique_resource_name(resource_description, resource_type):
     Returns:
         str: A unique name
     """
-    return f"{resource_type}-{resource_description[:23]}-{uuid4().hex}"
+    return f"{resource_type}-{resource_description[:23]}-{secrets.token_hex(6)}"
 
 
 def create_resource(do_reload=True, **kwargs):
@@ -178,139 +187,80 @@ def create_pod(
         pod_data["metadata"]["labels"]["app"] = pod_name
         pod_data["spec"]["template"]["metadata"]["labels"]["name"] = pod_name
         pod_data["spec"]["replicas"] = replica_count
+        pod_spec = pod_data["spec"]["template"]["spec"]
+    else:
+        pod_spec = pod_data["spec"]
+    container = pod_spec["containers"][0]
 
     if pvc_name:
-        if dc_deployment:
-            pod_data["spec"]["template"]["spec"]["volumes"][0]["persistentVolumeClaim"][
-                "claimName"
-            ] = pvc_name
-        else:
-            pod_data["spec"]["volumes"][0]["persistentVolumeClaim"][
-                "claimName"
-            ] = pvc_name
+        pod_spec["volumes"][0]["persistentVolumeClaim"]["claimName"] = pvc_name
 
     if interface_type == constants.CEPHBLOCKPOOL and raw_block_pv:
-        if pod_dict_path in [constants.FEDORA_DC_YAML, constants.FIO_DC_YAML]:
-            temp_dict = [
-                {
-                    "devicePath": raw_block_device,
-                    "name": pod_data.get("spec")
-                    .get("template")
-                    .get("spec")
-                    .get("volumes")[0]
-                    .get("name"),
-                }
-            ]
-            if pod_dict_path == constants.FEDORA_DC_YAML:
-                del pod_data["spec"]["template"]["spec"]["containers"][0][
-                    "volumeMounts"
-                ]
-                security_context = {"capabilities": {"add": ["SYS_ADMIN"]}}
-                pod_data["spec"]["template"]["spec"]["containers"][0][
-                    "securityContext"
-                ] = security_context
-
-            pod_data["spec"]["template"]["spec"]["containers"][0][
-                "volumeDevices"
-            ] = temp_dict
-
-        elif pod_dict_path == constants.NGINX_POD_YAML:
-            temp_dict = [
-                {
-                    "devicePath": raw_block_device,
-                    "name": pod_data.get("spec")
-                    .get("containers")[0]
-                    .get("volumeMounts")[0]
-                    .get("name"),
-                }
-            ]
-            del pod_data["spec"]["containers"][0]["volumeMounts"]
-            pod_data["spec"]["containers"][0]["volumeDevices"] = temp_dict
-        else:
-            pod_data["spec"]["containers"][0]["volumeDevices"][0][
-                "devicePath"
-            ] = raw_block_device
-            pod_data["spec"]["containers"][0]["volumeDevices"][0]["name"] = (
-                pod_data.get("spec").get("volumes")[0].get("name")
-            )
+        # Attach the PVC volume as a raw block device instead of mounting it
+        volume_name = pod_spec["volumes"][0]["name"]
+        volume_mounts = [
+            mount
+            for mount in container.pop("volumeMounts", [])
+            if mount["name"] != volume_name
+        ]
+        if volume_mounts:
+            container["volumeMounts"] = volume_mounts
+        container["volumeDevices"] = [
+            {"devicePath": raw_block_device, "name": volume_name}
+        ]
+        if pod_dict_path == constants.FEDORA_DC_YAML:
+            container["securityContext"] = {"capabilities": {"add": ["SYS_ADMIN"]}}
 
     if command:
-        if dc_deployment:
-            pod_data["spec"]["template"]["spec"]["containers"][0]["command"] = command
-        else:
-            pod_data["spec"]["containers"][0]["command"] = command
+        container["command"] = command
     if command_args:
-        if dc_deployment:
-            pod_data["spec"]["template"]["spec"]["containers"][0]["args"] = command_args
-        else:
-            pod_data["spec"]["containers"][0]["args"] = command_args
+        container["args"] = command_args
 
     if node_name:
-        if dc_deployment:
-            pod_data["spec"]["template"]["spec"]["nodeName"] = node_name
-        else:
-            pod_data["spec"]["nodeName"] = node_name
+        pod_spec["nodeName"] = node_name
 
     if node_selector:
-        if dc_deployment:
-            pod_data["spec"]["template"]["spec"]["nodeSelector"] = node_selector
-        else:
-            pod_data["spec"]["nodeSelector"] = node_selector
+        pod_spec["nodeSelector"] = node_selector
 
     if sa_name and dc_deployment:
-        pod_data["spec"]["template"]["spec"]["serviceAccountName"] = sa_name
+        pod_spec["serviceAccountName"] = sa_name
 
     # overwrite used image (required for disconnected installation)
     update_container_with_mirrored_image(pod_data)
 
     # configure http[s]_proxy env variable, if required
-    try:
-        http_proxy, https_proxy, no_proxy = get_cluster_proxies()
-        if http_proxy:
-            if "containers" in pod_data["spec"]:
-                container = pod_data["spec"]["containers"][0]
-            else:
-                container = pod_data["spec"]["template"]["spec"]["containers"][0]
-            if "env" not in container:
-                container["env"] = []
-            container["env"].append(
-                {
-                    "name": "http_proxy",
-                    "value": http_proxy,
-                }
-            )
-            container["env"].append(
-                {
-                    "name": "https_proxy",
-                    "value": https_proxy,
-                }
-            )
-            container["env"].append(
-                {
-                    "name": "no_proxy",
-                    "value": no_proxy,
-                }
-            )
-    except KeyError as err:
-        logging.warning(
-            "Http(s)_proxy variable wasn't configured, " "'%s' key not found.", err
+    http_proxy, https_proxy, no_proxy = get_cluster_proxies()
+    if http_proxy:
+        container.setdefault("env", []).extend(
+            [
+                {"name": "http_proxy", "value": http_proxy},
+                {"name": "https_proxy", "value": https_proxy},
+                {"name": "no_proxy", "value": no_proxy},
+            ]
         )
 
     if dc_deployment:
         ocs_obj = create_resource(**pod_data)
         logger.info(ocs_obj.name)
-        assert (ocp.OCP(kind="pod", namespace=namespace)).wait_for_resource(
+        ocp_pod_obj = ocp.OCP(kind="pod", namespace=namespace)
+        assert ocp_pod_obj.wait_for_resource(
             condition=deploy_pod_status,
             resource_name=pod_name + "-1-deploy",
             resource_count=0,
             timeout=360,
             sleep=3,
         )
-        dpod_list = pod.get_all_pods(namespace=namespace)
-        for dpod in dpod_list:
-            if "-1-deploy" not in dpod.name:
-                if pod_name in dpod.name:
-                    return dpod
+        # Only pods of the deployment config carry the template label, the
+        # deployer pod doesn't
+        dpod_list = ocp_pod_obj.get(selector=f"name={pod_name}")["items"]
+        return next(
+            (
+                pod.Pod(**dpod)
+                for dpod in dpod_list
+                if "-1-deploy" not in dpod["metadata"]["name"]
+            ),
+            None,
+        )
     else:
         pod_obj = pod.Pod(**pod_data)
         pod_name = pod_data.get("metadata").get("name")
@@ -342,6 +292,9 @@ def create_multilpe_projects(number_of_project):
     """
     Create one or more projects
 
+    The projects are created one by one, 'oc new-project' switches the
+    current project in the shared kubeconfig, so it can't run concurrently.
+
     Args:
         number_of_project (int): Number of projects to be created
 
@@ -522,54 +475,42 @@ def create_storage_class(
         OCS: An OCS instance for the storage class
     """
 
+    namespace = defaults.ROOK_CLUSTER_NAMESPACE
     sc_data = dict()
     if interface_type == constants.CEPHBLOCKPOOL:
         sc_data = templating.load_yaml(constants.CSI_RBD_STORAGECLASS_YAML)
-        sc_data["parameters"]["csi.storage.k8s.io/node-stage-secret-name"] = secret_name
-        sc_data["parameters"][
-            "csi.storage.k8s.io/node-stage-secret-namespace"
-        ] = defaults.ROOK_CLUSTER_NAMESPACE
         interface = constants.RBD_INTERFACE
         sc_data["provisioner"] = (
             provisioner if provisioner else defaults.RBD_PROVISIONER
         )
     elif interface_type == constants.CEPHFILESYSTEM:
         sc_data = templating.load_yaml(constants.CSI_CEPHFS_STORAGECLASS_YAML)
-        sc_data["parameters"]["csi.storage.k8s.io/node-stage-secret-name"] = secret_name
-        sc_data["parameters"][
-            "csi.storage.k8s.io/node-stage-secret-namespace"
-        ] = defaults.ROOK_CLUSTER_NAMESPACE
         interface = constants.CEPHFS_INTERFACE
         sc_data["parameters"]["fsName"] = get_cephfs_name()
         sc_data["provisioner"] = (
             provisioner if provisioner else defaults.CEPHFS_PROVISIONER
         )
-    sc_data["parameters"]["pool"] = interface_name
 
     sc_data["metadata"]["name"] = (
         sc_name
         if sc_name
         else create_unique_resource_name(f"test-{interface}", "storageclass")
     )
-    sc_data["metadata"]["namespace"] = defaults.ROOK_CLUSTER_NAMESPACE
-    sc_data["parameters"]["csi.storage.k8s.io/provisioner-secret-name"] = secret_name
-    sc_data["parameters"][
-        "csi.storage.k8s.io/provisioner-secret-namespace"
-    ] = defaults.ROOK_CLUSTER_NAMESPACE
-    sc_data["parameters"][
-        "csi.storage.k8s.io/controller-expand-secret-name"
-    ] = secret_name
-    sc_data["parameters"][
-        "csi.storage.k8s.io/controller-expand-secret-namespace"
-    ] = defaults.ROOK_CLUSTER_NAMESPACE
-
-    sc_data["parameters"]["clusterID"] = defaults.ROOK_CLUSTER_NAMESPACE
+    sc_data["metadata"]["namespace"] = namespace
+    sc_data["parameters"].update(
+        {
+            "csi.storage.k8s.io/node-stage-secret-name": secret_name,
+            "csi.storage.k8s.io/node-stage-secret-namespace": namespace,
+            "pool": interface_name,
+            "csi.storage.k8s.io/provisioner-secret-name": secret_name,
+            "csi.storage.k8s.io/provisioner-secret-namespace": namespace,
+            "csi.storage.k8s.io/controller-expand-secret-name": secret_name,
+            "csi.storage.k8s.io/controller-expand-secret-namespace": namespace,
+            "clusterID": namespace,
+        }
+    )
+    sc_data["parameters"].pop("userid", None)
     sc_data["reclaimPolicy"] = reclaim_policy
-
-    try:
-        del sc_data["parameters"]["userid"]
-    except KeyError:
-        pass
     return create_resource(**sc_data)
 
 
@@ -623,6 +564,7 @@ def create_multiple_pvcs(
     do_reload=False,
     access_mode=constants.ACCESS_MODE_RWO,
     burst=False,
+    max_workers=16,
 ):
     """
     Create one or more PVC as a bulk or one by one
@@ -635,6 +577,10 @@ def create_multiple_pvcs(
         do_reload (bool): True for wait for reloading PVC after its creation,
             False otherwise
         access_mode (str): The kind of access mode for PVC
+        burst (bool): True for creating all PVCs with a single 'oc create'
+            command, False for creating them one by one
+        max_workers (int): Maximum number of PVCs created concurrently when
+            burst is False
 
     Returns:
          list: List of PVC objects
@@ -644,17 +590,20 @@ def create_multiple_pvcs(
             volume_mode = "Block"
         else:
             volume_mode = None
-        return [
-            create_pvc(
-                sc_name=sc_name,
-                size=size,
-                namespace=namespace,
-                do_reload=do_reload,
-                access_mode=access_mode,
-                volume_mode=volume_mode,
-            )
-            for _ in range(number_of_pvc)
-        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    create_pvc,
+                    sc_name=sc_name,
+                    size=size,
+                    namespace=namespace,
+                    do_reload=do_reload,
+                    access_mode=access_mode,
+                    volume_mode=volume_mode,
+                )
+                for _ in range(number_of_pvc)
+            ]
+        return [future.result() for future in futures]
 
     pvc_data = templating.load_yaml(constants.CSI_PVC_YAML)
     pvc_data["metadata"]["namespace"] = namespace
@@ -707,19 +656,49 @@ def verify_block_pool_exists(pool_name):
     """
     logger.info(f"Verifying that block pool {pool_name} exists")
     ct_pod = pod.get_ceph_tools_pod()
+    # Check right away and back off 1, 2, 4, ... seconds while the pool
+    # is missing, newly created pools usually show up within seconds
+    sampler = TimeoutSampler(60, 1, ct_pod.exec_ceph_cmd, "ceph osd lspools")
     try:
-        for pools in TimeoutSampler(60, 3, ct_pod.exec_ceph_cmd, "ceph osd lspools"):
+        for pools in sampler:
             logger.info(f"POOLS are {pools}")
             for pool in pools:
                 if pool_name in pool.get("poolname"):
                     return True
+            sampler.sleep = min(sampler.sleep * 2, 8)
     except TimeoutExpiredError:
         return False
 
 
 def get_admin_key():
     """
-    Fetches admin key secret from Ceph
+    Fetches admin key secret from Ceph, the key is fetched only once per
+    cluster
+
+    Returns:
+        str: The admin key
+    """
+    return _get_admin_key(config.ENV_DATA["cluster_name"])
+
+
+def clear_cluster_caches():
+    """
+    Clears the values cached per cluster, they have to be fetched again after
+    the storagecluster of the same cluster name is created or deleted
+
+    """
+    _get_admin_key.cache_clear()
+    _get_cephfs.cache_clear()
+    _storagecluster_independent_check.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _get_admin_key(cluster_name):
+    """
+    Fetches admin key secret from Ceph of the given cluster
+
+    Args:
+        cluster_name (str): Name of the cluster, used as the cache key
 
     Returns:
         str: The admin key
@@ -729,16 +708,32 @@ def get_admin_key():
     return out["key"]
 
 
-def get_cephfs_data_pool_name():
+@lru_cache(maxsize=None)
+def _get_cephfs(cluster_name):
     """
-    Fetches ceph fs datapool name from Ceph
+    Fetches name and data pool name of the first ceph fs from Ceph of the
+    given cluster
+
+    Args:
+        cluster_name (str): Name of the cluster, used as the cache key
 
     Returns:
-        str: fs datapool name
+        tuple: CephFS name and its data pool name
     """
     ct_pod = pod.get_ceph_tools_pod()
     out = ct_pod.exec_ceph_cmd("ceph fs ls")
-    return out[0]["data_pools"][0]
+    return out[0]["name"], out[0]["data_pools"][0]
+
+
+def get_cephfs_data_pool_name():
+    """
+    Fetches ceph fs datapool name from Ceph, the name is fetched only once
+    per cluster
+
+    Returns:
+        str: fs datapool name
+    """
+    return _get_cephfs(config.ENV_DATA["cluster_name"])[1]
 
 
 def validate_cephfilesystem(fs_name):
@@ -756,34 +751,24 @@ def validate_cephfilesystem(fs_name):
         kind=constants.CEPHFILESYSTEM, namespace=defaults.ROOK_CLUSTER_NAMESPACE
     )
     ct_pod = pod.get_ceph_tools_pod()
-    ceph_validate = False
-    ocp_validate = False
 
     result = cfs.get(resource_name=fs_name)
     if result.get("metadata").get("name"):
         logger.info("Filesystem %s got created from Openshift Side", fs_name)
-        ocp_validate = True
     else:
         logger.info("Filesystem %s was not create at Openshift Side", fs_name)
         return False
 
+    sampler = TimeoutSampler(60, 1, ct_pod.exec_ceph_cmd, "ceph fs ls")
     try:
-        for pools in TimeoutSampler(60, 3, ct_pod.exec_ceph_cmd, "ceph fs ls"):
-            for out in pools:
-                result = out.get("name")
-                if result == fs_name:
-                    logger.info("FileSystem %s got created from Ceph Side", fs_name)
-                    ceph_validate = True
-                    break
-                else:
-                    logger.error("FileSystem %s was not present at Ceph Side", fs_name)
-                    ceph_validate = False
-            if ceph_validate:
-                break
+        for pools in sampler:
+            if any(out.get("name") == fs_name for out in pools):
+                logger.info("FileSystem %s got created from Ceph Side", fs_name)
+                return True
+            logger.error("FileSystem %s was not present at Ceph Side", fs_name)
+            sampler.sleep = min(sampler.sleep * 2, 8)
     except TimeoutExpiredError:
-        pass
-
-    return True if (ceph_validate and ocp_validate) else False
+        return False
 
 
 def get_all_storageclass_names():
@@ -799,13 +784,11 @@ def get_all_storageclass_names():
     result = sc_obj.get()
     sample = result["items"]
 
+    ignored = (constants.IGNORE_SC_GP2, constants.IGNORE_SC_FLEX)
     storageclass = [
-        item.get("metadata").get("name")
-        for item in sample
-        if (
-            (item.get("metadata").get("name") not in constants.IGNORE_SC_GP2)
-            and (item.get("metadata").get("name") not in constants.IGNORE_SC_FLEX)
-        )
+        name
+        for name in (item["metadata"]["name"] for item in sample)
+        if name not in ignored
     ]
     return storageclass
 
@@ -861,13 +844,12 @@ def delete_cephblockpools(cbp_objs):
 
 def get_cephfs_name():
     """
-    Function to retrive CephFS name
+    Function to retrive CephFS name, the name is fetched only once per
+    cluster
     Returns:
         str: Name of CFS
     """
-    ct_pod = pod.get_ceph_tools_pod()
-    result = ct_pod.exec_ceph_cmd("ceph fs ls")
-    return result[0]["name"]
+    return _get_cephfs(config.ENV_DATA["cluster_name"])[0]
 
 
 def pull_images(image_name):
@@ -882,12 +864,19 @@ def pull_images(image_name):
     """
 
     node_objs = node.get_node_objs(node.get_worker_nodes())
-    for node_obj in node_objs:
+
+    def pull_image(node_obj):
         logging.info(f'pulling image "{image_name}  " on node {node_obj.name}')
-        assert node_obj.ocp.exec_oc_debug_cmd(
+        return node_obj.ocp.exec_oc_debug_cmd(
             node_obj.name, cmd_list=[f"podman pull {image_name}"]
         )
 
+    # Limit the concurrency to not overload the registry on large clusters
+    with ThreadPoolExecutor(max_workers=min(len(node_objs), 16) or 1) as executor:
+        futures = [executor.submit(pull_image, node_obj) for node_obj in node_objs]
+    for node_obj, future in zip(node_objs, futures):
+        assert future.result(), f"Failed to pull {image_name} on {node_obj.name}"
+
 
 def run_io_with_rados_bench(**kw):
     """
@@ -956,55 +945,90 @@ def get_all_pvs():
     return ocp_pv_obj.get()
 
 
-# TODO: revert counts of tries and delay,BZ 1726266
-
-
-@retry(AssertionError, tries=20, delay=10, backoff=1)
-def validate_pv_delete(pv_name):
+# TODO: revert timeout, BZ 1726266
+def validate_pv_delete(pv_name, timeout=200, max_delay=10):
     """
     validates if pv is deleted after pvc deletion
 
+    All given PVs are checked with a single 'oc get' per iteration, the
+    checks are repeated with exponential backoff capped at max_delay seconds
+
     Args:
-        pv_name (str): pv from pvc to validates
+        pv_name (str or list): pv (or list of pvs) from pvc to validates
+        timeout (int): Time in seconds to wait for the pv deletion
+        max_delay (int): Maximum time in seconds between two checks
+
     Returns:
         bool: True if deletion is successful
 
     Raises:
         AssertionError: If pv is not deleted
     """
-    ocp_pv_obj = ocp.OCP(kind=constants.PV, namespace=defaults.ROOK_CLUSTER_NAMESPACE)
-
-    try:
-        if ocp_pv_obj.get(resource_name=pv_name):
-            msg = f"{constants.PV} {pv_name} is not deleted after PVC deletion"
-            raise AssertionError(msg)
-
-    except CommandFailed:
+    pv_names = [pv_name] if isinstance(pv_name, str) else list(pv_name)
+    if not pv_names:
         return True
+    ocp_pv_obj = ocp.OCP(kind=constants.PV)
+    deadline = time.time() + timeout
+    delay = 1
+    while True:
+        out = ocp_pv_obj.exec_oc_cmd(
+            f"get {constants.PV} {' '.join(pv_names)} --ignore-not-found -o name",
+            out_yaml_format=False,
+        )
+        pv_names = [line.split("/")[-1] for line in out.split()]
+        if not pv_names:
+            return True
+        if time.time() > deadline:
+            raise AssertionError(
+                f"{constants.PV} {', '.join(pv_names)} is not deleted after PVC "
+                f"deletion"
+            )
+        logger.info(f"Waiting {delay} seconds for deletion of {pv_names}")
+        time.sleep(delay)
+        delay = min(delay * 2, max_delay)
 
 
-def create_pods(pvc_objs, pod_factory, interface, pods_for_rwx=1, status=""):
+def create_pods(
+    pvc_objs, pod_factory, interface, pods_for_rwx=1, status="", max_workers=10
+):
     """
     Create pods
 
+    Pods are created concurrently, at most max_workers creations are in
+    flight at the same time. If status is given, the pods are waited for
+    once all of them were created.
+
     Args:
         pvc_objs (list): List of ocs_ci.ocs.resources.pvc.PVC instances
         pod_factory (function): pod_factory function
         interface (int): Interface type
         pods_for_rwx (int): Number of pods to be created if access mode of
             PVC is RWX
-        status (str): If provided, wait for desired state of each pod before
-            creating next one
+        status (str): If provided, wait for desired state of each pod
+        max_workers (int): Maximum number of pods created concurrently
 
     Returns:
         list: list of Pod objects
     """
-    pod_objs = []
+    pod_kwargs = []
+
+    # Fetch volume mode of PVCs which don't carry it with one 'oc get' per
+    # namespace instead of one call per PVC
+    volume_modes = {}
+    for namespace in {
+        pvc_obj.namespace for pvc_obj in pvc_objs if not hasattr(pvc_obj, "volume_mode")
+    }:
+        pvc_items = ocp.OCP(kind=constants.PVC, namespace=namespace).get()["items"]
+        for item in pvc_items:
+            volume_modes[(namespace, item["metadata"]["name"])] = item["spec"].get(
+                "volumeMode"
+            )
 
     for pvc_obj in pvc_objs:
-        volume_mode = getattr(
-            pvc_obj, "volume_mode", pvc_obj.get()["spec"]["volumeMode"]
-        )
+        if hasattr(pvc_obj, "volume_mode"):
+            volume_mode = pvc_obj.volume_mode
+        else:
+            volume_mode = volume_modes[(pvc_obj.namespace, pvc_obj.name)]
         access_mode = getattr(pvc_obj, "access_mode", pvc_obj.get_pvc_access_mode)
         if volume_mode == "Block":
             pod_dict = constants.CSI_RBD_RAW_BLOCK_POD_YAML
@@ -1012,26 +1036,34 @@ def create_pods(pvc_objs, pod_factory, interface, pods_for_rwx=1, status=""):
         else:
             raw_block_pv = False
             pod_dict = ""
-        if access_mode == constants.ACCESS_MODE_RWX:
-            pod_obj_rwx = [
-                pod_factory(
-                    interface=interface,
-                    pvc=pvc_obj,
-                    status=status,
-                    pod_dict_path=pod_dict,
-                    raw_block_pv=raw_block_pv,
-                )
-                for _ in range(1, pods_for_rwx)
-            ]
-            pod_objs.extend(pod_obj_rwx)
-        pod_obj = pod_factory(
-            interface=interface,
-            pvc=pvc_obj,
-            status=status,
-            pod_dict_path=pod_dict,
-            raw_block_pv=raw_block_pv,
+        pods_for_pvc = (
+            max(pods_for_rwx, 1) if access_mode == constants.ACCESS_MODE_RWX else 1
+        )
+        pod_kwargs.extend(
+            dict(
+                interface=interface,
+                pvc=pvc_obj,
+                status="",
+                pod_dict_path=pod_dict,
+                raw_block_pv=raw_block_pv,
+            )
+            for _ in range(pods_for_pvc)
         )
-        pod_objs.append(pod_obj)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(pod_factory, **kwargs) for kwargs in pod_kwargs]
+    pod_objs = [future.result() for future in futures]
+
+    if status:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(wait_for_resource_state, pod_obj, status)
+                for pod_obj in pod_objs
+            ]
+        for future in futures:
+            future.result()
+        for pod_obj in pod_objs:
+            pod_obj.reload()
 
     return pod_objs
 
@@ -1081,16 +1113,16 @@ def create_build_from_docker_image(
 
     docker_file = f"FROM {base_image}\n " f" RUN {cmd}\n" f"CMD tail -f /dev/null"
 
-    command = f"new-build -D $'{docker_file}' --name={image_name}"
     kubeconfig = os.getenv("KUBECONFIG")
 
-    oc_cmd = f"oc -n {namespace} "
+    oc_cmd = ["oc", "-n", namespace]
 
     if kubeconfig:
-        oc_cmd += f"--kubeconfig {kubeconfig} "
-    oc_cmd += command
+        oc_cmd += ["--kubeconfig", kubeconfig]
+    # Docker file is passed as a single argument, no shell quoting is needed
+    oc_cmd += ["new-build", "-D", docker_file, f"--name={image_name}"]
     logger.info(f"Running command {oc_cmd}")
-    result = run(oc_cmd, stdout=PIPE, stderr=PIPE, timeout=15, shell=True)
+    result = run(oc_cmd, stdout=PIPE, stderr=PIPE, timeout=15)
     if result.stderr.decode():
         raise UnavailableBuildException(
             f"Build creation failed with error: {result.stderr.decode()}"
@@ -1236,6 +1268,59 @@ def measure_snapshot_creation_time(interface, snap_name, snap_con_name):
         return None
 
 
+def get_provisioner_logs(interface, pod_names=None):
+    """
+    Get the logs of the csi-provisioner containers of the provisioner pods
+
+    Args:
+        interface (str): The interface backed the PVC
+        pod_names (tuple): Names of the provisioner pods, looked up based on
+            the interface when not given
+
+    Returns:
+        list: Lines of the csi-provisioner logs of all the provisioner pods
+
+    """
+    if pod_names is None:
+        pod_names = pod.get_csi_provisioner_pod(interface)
+    # fetch the logs of the provisioner pods concurrently and split the logs
+    # of each pod on their own instead of concatenating them
+    with ThreadPoolExecutor(max_workers=len(pod_names)) as executor:
+        pod_logs = executor.map(
+            lambda pod_name: pod.get_pod_logs(pod_name, "csi-provisioner"), pod_names
+        )
+        return list(
+            itertools.chain.from_iterable(logs.splitlines() for logs in pod_logs)
+        )
+
+
+def _get_csi_event_time(logs, pattern, name, event):
+    """
+    Get the timestamp of the first event of a resource in the csi-provisioner logs
+
+    Args:
+        logs (list): Lines of the csi-provisioner logs
+        pattern (re.Pattern): Pattern capturing the resource name and the
+            event ('started' / 'succeeded') of a log line
+        name (str): Name of the resource
+        event (str): The event to look for - started / succeeded
+
+    Returns:
+        str: The timestamp of the event
+
+    Raises:
+        UnexpectedBehaviour: In case the event is not found in the logs
+
+    """
+    for line in logs:
+        if name not in line:
+            continue
+        match = pattern.search(line)
+        if match and match.groups() == (name, event):
+            return line.split(" ")[1]
+    raise UnexpectedBehaviour(f"No {event} event of {name} in csi-provisioner logs")
+
+
 def get_provision_time(interface, pvc_name, status="start"):
     """
     Get the starting/ending creation time of a PVC based on provisioner logs
@@ -1256,24 +1341,16 @@ def get_provision_time(interface, pvc_name, status="start"):
         operation = "succeeded"
 
     format = "%H:%M:%S.%f"
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-
-    logs = logs.split("\n")
+    logs = get_provisioner_logs(interface)
     # Extract the time for the one PVC provisioning
     if isinstance(pvc_name, str):
-        stat = [i for i in logs if re.search(f"provision.*{pvc_name}.*{operation}", i)]
-        stat = stat[0].split(" ")[1]
+        stat = _get_csi_event_time(logs, PROVISION_LOG_PATTERN, pvc_name, operation)
     # Extract the time for the list of PVCs provisioning
     if isinstance(pvc_name, list):
         all_stats = []
         for pv_name in pvc_name:
             name = pv_name.name
-            stat = [i for i in logs if re.search(f"provision.*{name}.*{operation}", i)]
-            stat = stat[0].split(" ")[1]
+            stat = _get_csi_event_time(logs, PROVISION_LOG_PATTERN, name, operation)
             all_stats.append(stat)
         all_stats = sorted(all_stats)
         if status.lower() == "end":
@@ -1283,55 +1360,47 @@ def get_provision_time(interface, pvc_name, status="start"):
     return datetime.datetime.strptime(stat, format)
 
 
-def get_start_creation_time(interface, pvc_name):
+def get_start_creation_time(interface, pvc_name, logs=None):
     """
     Get the starting creation time of a PVC based on provisioner logs
 
     Args:
         interface (str): The interface backed the PVC
         pvc_name (str): Name of the PVC for creation time measurement
+        logs (list): Lines of the csi-provisioner logs, fetched from the
+            provisioner pods when not given
 
     Returns:
         datetime object: Start time of PVC creation
 
     """
     format = "%H:%M:%S.%f"
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-
-    logs = logs.split("\n")
+    if logs is None:
+        logs = get_provisioner_logs(interface)
     # Extract the starting time for the PVC provisioning
-    start = [i for i in logs if re.search(f"provision.*{pvc_name}.*started", i)]
-    start = start[0].split(" ")[1]
+    start = _get_csi_event_time(logs, PROVISION_LOG_PATTERN, pvc_name, "started")
     return datetime.datetime.strptime(start, format)
 
 
-def get_end_creation_time(interface, pvc_name):
+def get_end_creation_time(interface, pvc_name, logs=None):
     """
     Get the ending creation time of a PVC based on provisioner logs
 
     Args:
         interface (str): The interface backed the PVC
         pvc_name (str): Name of the PVC for creation time measurement
+        logs (list): Lines of the csi-provisioner logs, fetched from the
+            provisioner pods when not given
 
     Returns:
         datetime object: End time of PVC creation
 
     """
     format = "%H:%M:%S.%f"
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-
-    logs = logs.split("\n")
+    if logs is None:
+        logs = get_provisioner_logs(interface)
     # Extract the starting time for the PVC provisioning
-    end = [i for i in logs if re.search(f"provision.*{pvc_name}.*succeeded", i)]
-    end = end[0].split(" ")[1]
+    end = _get_csi_event_time(logs, PROVISION_LOG_PATTERN, pvc_name, "succeeded")
     return datetime.datetime.strptime(end, format)
 
 
@@ -1347,12 +1416,58 @@ def measure_pvc_creation_time(interface, pvc_name):
         float: Creation time for the PVC
 
     """
-    start = get_start_creation_time(interface=interface, pvc_name=pvc_name)
-    end = get_end_creation_time(interface=interface, pvc_name=pvc_name)
+    logs = get_provisioner_logs(interface)
+    start = get_start_creation_time(interface=interface, pvc_name=pvc_name, logs=logs)
+    end = get_end_creation_time(interface=interface, pvc_name=pvc_name, logs=logs)
     total = end - start
     return total.total_seconds()
 
 
+def _get_csi_event_times(logs, pattern, names):
+    """
+    Collect the event timestamps of the given resources from the
+    csi-provisioner logs in a single pass over the log lines
+
+    Args:
+        logs (list): Lines of the csi-provisioner logs
+        pattern (re.Pattern): Pattern capturing the resource name and the
+            event ('started' / 'succeeded') of a log line
+        names (list): Names of the resources to collect the events for
+
+    Returns:
+        dict: Resource name as key, dict of event and timestamp as value.
+            The first occurrence of each event is kept
+
+    """
+    names = set(names)
+    events = dict()
+    for line in logs:
+        match = pattern.search(line)
+        if match and match.group(1) in names:
+            events.setdefault(match.group(1), dict()).setdefault(
+                match.group(2), line.split(" ")[1]
+            )
+    return events
+
+
+def _get_csi_log_time_usec(timestamp):
+    """
+    Convert a csi-provisioner log timestamp to microseconds since midnight,
+    without the overhead of datetime.strptime
+
+    Args:
+        timestamp (str): Timestamp of a log line, in HH:MM:SS.ffffff format
+
+    Returns:
+        int: Microseconds since midnight
+
+    """
+    hours, minutes, seconds = timestamp.split(":")
+    seconds, _, usec = seconds.partition(".")
+    total_seconds = int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+    return total_seconds * 1_000_000 + int(usec.ljust(6, "0")[:6])
+
+
 def measure_pvc_creation_time_bulk(interface, pvc_name_list, wait_time=60):
     """
     Measure PVC creation time of bulk PVC based on logs.
@@ -1371,27 +1486,22 @@ def measure_pvc_creation_time_bulk(interface, pvc_name_list, wait_time=60):
     # due to some delay in CSI log generation added wait
     time.sleep(wait_time)
     # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-    logs = logs.split("\n")
+    logs = get_provisioner_logs(interface, pod_name)
 
     loop_counter = 0
     while True:
-        no_data_list = list()
-        for name in pvc_name_list:
-            # check if PV data present in CSI logs
-            start = [i for i in logs if re.search(f"provision.*{name}.*started", i)]
-            if not start:
-                no_data_list.append(name)
+        events = _get_csi_event_times(logs, PROVISION_LOG_PATTERN, pvc_name_list)
+        # check if PV data present in CSI logs
+        no_data_list = [
+            name for name in pvc_name_list if "started" not in events.get(name, {})
+        ]
 
         if no_data_list:
             # Clear and get CSI logs after 60secs
             logging.info(f"PVC count without CSI create log data {len(no_data_list)}")
             logs.clear()
             time.sleep(wait_time)
-            logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-            logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-            logs = logs.split("\n")
+            logs = get_provisioner_logs(interface, pod_name)
             loop_counter += 1
             if loop_counter >= 3:
                 logging.info("Waited for more than 3mins still no data")
@@ -1403,18 +1513,11 @@ def measure_pvc_creation_time_bulk(interface, pvc_name_list, wait_time=60):
             break
 
     pvc_dict = dict()
-    format = "%H:%M:%S.%f"
     for pvc_name in pvc_name_list:
-        # Extract the starting time for the PVC provisioning
-        start = [i for i in logs if re.search(f"provision.*{pvc_name}.*started", i)]
-        start = start[0].split(" ")[1]
-        start_time = datetime.datetime.strptime(start, format)
-        # Extract the end time for the PVC provisioning
-        end = [i for i in logs if re.search(f"provision.*{pvc_name}.*succeeded", i)]
-        end = end[0].split(" ")[1]
-        end_time = datetime.datetime.strptime(end, format)
-        total = end_time - start_time
-        pvc_dict[pvc_name] = total.total_seconds()
+        # Extract the starting and end time for the PVC provisioning
+        start_time = _get_csi_log_time_usec(events[pvc_name]["started"])
+        end_time = _get_csi_log_time_usec(events[pvc_name]["succeeded"])
+        pvc_dict[pvc_name] = (end_time - start_time) / 1_000_000
 
     return pvc_dict
 
@@ -1437,27 +1540,22 @@ def measure_pv_deletion_time_bulk(interface, pv_name_list, wait_time=60):
     # due to some delay in CSI log generation added wait
     time.sleep(wait_time)
     # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-    logs = logs.split("\n")
+    logs = get_provisioner_logs(interface, pod_name)
 
     loop_counter = 0
     while True:
-        no_data_list = list()
-        for pv in pv_name_list:
-            # check if PV data present in CSI logs
-            start = [i for i in logs if re.search(f'delete "{pv}": started', i)]
-            if not start:
-                no_data_list.append(pv)
+        events = _get_csi_event_times(logs, DELETE_LOG_PATTERN, pv_name_list)
+        # check if PV data present in CSI logs
+        no_data_list = [
+            pv for pv in pv_name_list if "started" not in events.get(pv, {})
+        ]
 
         if no_data_list:
             # Clear and get CSI logs after 60secs
             logging.info(f"PV count without CSI delete log data {len(no_data_list)}")
             logs.clear()
             time.sleep(wait_time)
-            logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-            logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-            logs = logs.split("\n")
+            logs = get_provisioner_logs(interface, pod_name)
             loop_counter += 1
             if loop_counter >= 3:
                 logging.info("Waited for more than 3mins still no data")
@@ -1469,71 +1567,56 @@ def measure_pv_deletion_time_bulk(interface, pv_name_list, wait_time=60):
             break
 
     pv_dict = dict()
-    format = "%H:%M:%S.%f"
     for pv_name in pv_name_list:
-        # Extract the deletion start time for the PV
-        start = [i for i in logs if re.search(f'delete "{pv_name}": started', i)]
-        start = start[0].split(" ")[1]
-        start_time = datetime.datetime.strptime(start, format)
-        # Extract the deletion end time for the PV
-        end = [i for i in logs if re.search(f'delete "{pv_name}": succeeded', i)]
-        end = end[0].split(" ")[1]
-        end_time = datetime.datetime.strptime(end, format)
-        total = end_time - start_time
-        pv_dict[pv_name] = total.total_seconds()
+        # Extract the deletion start and end time for the PV
+        start_time = _get_csi_log_time_usec(events[pv_name]["started"])
+        end_time = _get_csi_log_time_usec(events[pv_name]["succeeded"])
+        pv_dict[pv_name] = (end_time - start_time) / 1_000_000
 
     return pv_dict
 
 
-def get_start_deletion_time(interface, pv_name):
+def get_start_deletion_time(interface, pv_name, logs=None):
     """
     Get the starting deletion time of a PVC based on provisioner logs
 
     Args:
         interface (str): The interface backed the PVC
         pvc_name (str): Name of the PVC for deletion time measurement
+        logs (list): Lines of the csi-provisioner logs, fetched from the
+            provisioner pods when not given
 
     Returns:
         datetime object: Start time of PVC deletion
 
     """
     format = "%H:%M:%S.%f"
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-
-    logs = logs.split("\n")
+    if logs is None:
+        logs = get_provisioner_logs(interface)
     # Extract the starting time for the PVC deletion
-    start = [i for i in logs if re.search(f'delete "{pv_name}": started', i)]
-    start = start[0].split(" ")[1]
+    start = _get_csi_event_time(logs, DELETE_LOG_PATTERN, pv_name, "started")
     return datetime.datetime.strptime(start, format)
 
 
-def get_end_deletion_time(interface, pv_name):
+def get_end_deletion_time(interface, pv_name, logs=None):
     """
     Get the ending deletion time of a PVC based on provisioner logs
 
     Args:
         interface (str): The interface backed the PVC
         pv_name (str): Name of the PVC for deletion time measurement
+        logs (list): Lines of the csi-provisioner logs, fetched from the
+            provisioner pods when not given
 
     Returns:
         datetime object: End time of PVC deletion
 
     """
     format = "%H:%M:%S.%f"
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-
-    logs = logs.split("\n")
+    if logs is None:
+        logs = get_provisioner_logs(interface)
     # Extract the starting time for the PV deletion
-    end = [i for i in logs if re.search(f'delete "{pv_name}": succeeded', i)]
-    end = end[0].split(" ")[1]
+    end = _get_csi_event_time(logs, DELETE_LOG_PATTERN, pv_name, "succeeded")
     return datetime.datetime.strptime(end, format)
 
 
@@ -1549,8 +1632,9 @@ def measure_pvc_deletion_time(interface, pv_name):
         float: Deletion time for the PVC
 
     """
-    start = get_start_deletion_time(interface=interface, pv_name=pv_name)
-    end = get_end_deletion_time(interface=interface, pv_name=pv_name)
+    logs = get_provisioner_logs(interface)
+    start = get_start_deletion_time(interface=interface, pv_name=pv_name, logs=logs)
+    end = get_end_deletion_time(interface=interface, pv_name=pv_name, logs=logs)
     total = end - start
     return total.total_seconds()
 
@@ -1574,15 +1658,12 @@ def pod_start_time(pod_obj):
     containers_start_time = {}
     start_time = pod_obj.data["status"]["startTime"]
     start_time = datetime.datetime.strptime(start_time, time_format)
-    for container in range(len(pod_obj.data["status"]["containerStatuses"])):
-        started_time = pod_obj.data["status"]["containerStatuses"][container]["state"][
-            "running"
-        ]["startedAt"]
+    for container_status in pod_obj.data["status"]["containerStatuses"]:
+        started_time = container_status["state"]["running"]["startedAt"]
         started_time = datetime.datetime.strptime(started_time, time_format)
-        container_name = pod_obj.data["status"]["containerStatuses"][container]["name"]
         container_start_time = (started_time - start_time).seconds
-        containers_start_time[container_name] = container_start_time
-        return containers_start_time
+        containers_start_time[container_status["name"]] = container_start_time
+    return containers_start_time
 
 
 def get_default_storage_class():
@@ -1594,18 +1675,13 @@ def get_default_storage_class():
 
     """
     default_sc_obj = ocp.OCP(kind="StorageClass")
-    storage_classes = default_sc_obj.get().get("items")
-    storage_classes = [
-        sc for sc in storage_classes if "annotations" in sc.get("metadata")
-    ]
-    return [
-        sc.get("metadata").get("name")
-        for sc in storage_classes
-        if sc.get("metadata")
-        .get("annotations")
-        .get("storageclass.kubernetes.io/is-default-class")
-        == "true"
-    ]
+    default_scs = []
+    for sc in default_sc_obj.get().get("items", []):
+        metadata = sc.get("metadata") or {}
+        annotations = metadata.get("annotations") or {}
+        if annotations.get("storageclass.kubernetes.io/is-default-class") == "true":
+            default_scs.append(metadata["name"])
+    return default_scs
 
 
 def change_default_storageclass(scname):
@@ -1619,15 +1695,14 @@ def change_default_storageclass(scname):
         bool: True on success
 
     """
-    default_sc = get_default_storage_class()
     ocp_obj = ocp.OCP(kind="StorageClass")
-    if default_sc:
-        # Change the existing default Storageclass annotation to false
-        patch = (
-            ' \'{"metadata": {"annotations":'
-            '{"storageclass.kubernetes.io/is-default-class"'
-            ':"false"}}}\' '
-        )
+    # Change the existing default Storageclass(es) annotation to false
+    patch = (
+        ' \'{"metadata": {"annotations":'
+        '{"storageclass.kubernetes.io/is-default-class"'
+        ':"false"}}}\' '
+    )
+    for default_sc in get_default_storage_class():
         patch_cmd = f"patch storageclass {default_sc} -p" + patch
         ocp_obj.exec_oc_cmd(command=patch_cmd)
 
@@ -1642,7 +1717,9 @@ def change_default_storageclass(scname):
     return True
 
 
-def is_volume_present_in_backend(interface, image_uuid, pool_name=None):
+def is_volume_present_in_backend(
+    interface, image_uuid, pool_name=None, ct_pod=None, backend_volumes=None
+):
     """
     Check whether Image/Subvolume is present in the backend.
 
@@ -1655,12 +1732,18 @@ def is_volume_present_in_backend(interface, image_uuid, pool_name=None):
           ``0001-000c-rook-cluster-0000000000000001-f301898c-a192-11e9-852a-1eeeb6975c91``
           where image_uuid is ``f301898c-a192-11e9-852a-1eeeb6975c91``
         pool_name (str): Name of the rbd-pool if interface is CephBlockPool
+        ct_pod (Pod): The ceph tools pod, looked up when not given
+        backend_volumes (set): Names of the volumes present in the backend,
+          as returned by get_backend_volumes. When given, it is used instead
+          of querying the backend for the volume
 
     Returns:
         bool: True if volume is present and False if volume is not present
 
     """
-    ct_pod = pod.get_ceph_tools_pod()
+    if backend_volumes is not None:
+        return f"csi-vol-{image_uuid}" in backend_volumes
+    ct_pod = ct_pod or pod.get_ceph_tools_pod()
     if interface == constants.CEPHBLOCKPOOL:
         valid_error = [f"error opening image csi-vol-{image_uuid}"]
         cmd = f"rbd info -p {pool_name} csi-vol-{image_uuid}"
@@ -1691,6 +1774,63 @@ def is_volume_present_in_backend(interface, image_uuid, pool_name=None):
         return False
 
 
+def get_backend_volumes(interface, pool_name=None, ct_pod=None):
+    """
+    List the names of the Images/Subvolumes present in the backend
+
+    Args:
+        interface (str): The interface backed the PVCs
+        pool_name (str): Name of the rbd-pool if interface is CephBlockPool
+        ct_pod (Pod): The ceph tools pod, looked up when not given
+
+    Returns:
+        set: Names of the images/subvolumes, e.g. csi-vol-<image_uuid>
+
+    Raises:
+        UnexpectedVolumeType: In case the interface is not supported
+
+    """
+    if interface not in (constants.CEPHBLOCKPOOL, constants.CEPHFILESYSTEM):
+        raise UnexpectedVolumeType(f"Interface {interface} is not supported")
+    ct_pod = ct_pod or pod.get_ceph_tools_pod()
+    if interface == constants.CEPHBLOCKPOOL:
+        volumes = ct_pod.exec_ceph_cmd(ceph_cmd=f"rbd ls -p {pool_name}", format="json")
+        return set(volumes or [])
+    volumes = ct_pod.exec_ceph_cmd(
+        ceph_cmd=f"ceph fs subvolume ls {get_cephfs_name()} csi", format="json"
+    )
+    return {volume["name"] for volume in volumes or []}
+
+
+def are_volumes_present_in_backend(interface, image_uuids, pool_name=None, ct_pod=None):
+    """
+    Check whether Images/Subvolumes are present in the backend, listing the
+    volumes of the backend once for all of them
+
+    Args:
+        interface (str): The interface backed the PVCs
+        image_uuids (list): Parts of VolIDs which represent the corresponding
+          images/subvolumes in backend, see is_volume_present_in_backend
+        pool_name (str): Name of the rbd-pool if interface is CephBlockPool
+        ct_pod (Pod): The ceph tools pod, looked up when not given
+
+    Returns:
+        dict: image_uuid as key, True if the volume is present else False
+            as value
+
+    Raises:
+        UnexpectedVolumeType: In case the interface is not supported
+
+    """
+    backend_volumes = get_backend_volumes(interface, pool_name, ct_pod)
+    return {
+        image_uuid: is_volume_present_in_backend(
+            interface, image_uuid, backend_volumes=backend_volumes
+        )
+        for image_uuid in image_uuids
+    }
+
+
 def verify_volume_deleted_in_backend(
     interface, image_uuid, pool_name=None, timeout=180
 ):
@@ -1712,6 +1852,8 @@ def verify_volume_deleted_in_backend(
         bool: True if volume is deleted before timeout.
             False if volume is not deleted.
     """
+    # Look up the ceph tools pod once instead of on every check
+    ct_pod = pod.get_ceph_tools_pod()
     try:
         for ret in TimeoutSampler(
             timeout,
@@ -1720,6 +1862,7 @@ def verify_volume_deleted_in_backend(
             interface=interface,
             image_uuid=image_uuid,
             pool_name=pool_name,
+            ct_pod=ct_pod,
         ):
             if not ret:
                 break
@@ -1733,7 +1876,6 @@ def verify_volume_deleted_in_backend(
             f"Volume corresponding to uuid {image_uuid} is not deleted " f"in backend"
         )
         # Log 'ceph progress' and 'ceph rbd task list' for debugging purpose
-        ct_pod = pod.get_ceph_tools_pod()
         ct_pod.exec_ceph_cmd("ceph progress json", format=None)
         ct_pod.exec_ceph_cmd("ceph rbd task list")
         return False
@@ -1794,11 +1936,8 @@ def validate_scc_policy(sa_name, namespace):
     logger.info(sa_name)
     ocp_scc_obj = ocp.OCP(kind=constants.SCC, namespace=namespace)
     scc_dict = ocp_scc_obj.get(resource_name=constants.PRIVILEGED)
-    scc_users_list = scc_dict.get("users")
-    for scc_user in scc_users_list:
-        if scc_user == sa_name:
-            return True
-    return False
+    scc_users_list = scc_dict.get("users") or []
+    return sa_name in scc_users_list
 
 
 def add_scc_policy(sa_name, namespace):
@@ -1927,14 +2066,19 @@ def verify_pv_mounted_on_node(node_pv_dict):
         dict: Node to existing PV list mapping
             eg: {'node1': ['pv1', 'pv3'], 'node2': ['pv5']}
     """
+    if not node_pv_dict:
+        return {}
+    # Each 'oc debug' starts a debug pod on the node, run them concurrently
+    with ThreadPoolExecutor(max_workers=min(16, len(node_pv_dict))) as executor:
+        df_futures = {
+            node_name: executor.submit(run_cmd, f"oc debug nodes/{node_name} -- df")
+            for node_name in node_pv_dict
+        }
     existing_pvs = {}
     for node_name, pvs in node_pv_dict.items():
-        cmd = f"oc debug nodes/{node_name} -- df"
-        df_on_node = run_cmd(cmd)
-        existing_pvs[node_name] = []
-        for pv_name in pvs:
-            if f"/pv/{pv_name}/" in df_on_node:
-                existing_pvs[node_name].append(pv_name)
+        df_on_node = df_futures[node_name].result()
+        mounted_pvs = set(re.findall(r"/pv/([^/\s]+)/", df_on_node))
+        existing_pvs[node_name] = [pv_name for pv_name in pvs if pv_name in mounted_pvs]
     return existing_pvs
 
 
@@ -1948,10 +2092,35 @@ def converge_lists(list_to_converge):
     Returns:
         list (list): return converged list eg: [1,2,3,4]
     """
-    return [item for sublist in list_to_converge for item in sublist]
+    return list(itertools.chain.from_iterable(list_to_converge))
 
 
-def create_multiple_pvc_parallel(sc_obj, namespace, number_of_pvc, size, access_modes):
+def get_futures_results(futures):
+    """
+    Wait for the futures to complete and get their results. Once one of the
+    futures fails, the futures which didn't start yet are cancelled and the
+    exception is raised without waiting for the rest of them
+
+    Args:
+        futures (list): List of concurrent.futures.Future objects
+
+    Returns:
+        list: Results of the futures, in the order of the futures
+
+    """
+    try:
+        for future in as_completed(futures):
+            future.result()
+    except Exception:
+        for future in futures:
+            future.cancel()
+        raise
+    return [future.result() for future in futures]
+
+
+def create_multiple_pvc_parallel(
+    sc_obj, namespace, number_of_pvc, size, access_modes, max_workers=32
+):
     """
     Funtion to create multiple PVC in parallel using threads
     Function will create PVCs based on the available access modes
@@ -1962,32 +2131,33 @@ def create_multiple_pvc_parallel(sc_obj, namespace, number_of_pvc, size, access_
         number_of_pvc (int): NUmber of pvc to be created
         size (str): size of the pvc eg: '10Gi'
         access_modes (list): List of access modes for PVC creation
+        max_workers (int): Max number of threads used for creating and
+            checking the pvcs
 
     Returns:
         pvc_objs_list (list): List of pvc objs created in function
     """
-    obj_status_list, result_lists = ([] for i in range(2))
-    with ThreadPoolExecutor() as executor:
-        for mode in access_modes:
-            result_lists.append(
-                executor.submit(
-                    create_multiple_pvcs,
-                    sc_name=sc_obj.name,
-                    namespace=namespace,
-                    number_of_pvc=number_of_pvc,
-                    access_mode=mode,
-                    size=size,
-                )
-            )
-    result_list = [result.result() for result in result_lists]
-    pvc_objs_list = converge_lists(result_list)
-    # Check for all the pvcs in Bound state
-    with ThreadPoolExecutor() as executor:
-        for objs in pvc_objs_list:
-            obj_status_list.append(
-                executor.submit(wait_for_resource_state, objs, "Bound", 90)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        result_lists = [
+            executor.submit(
+                create_multiple_pvcs,
+                sc_name=sc_obj.name,
+                namespace=namespace,
+                number_of_pvc=number_of_pvc,
+                access_mode=mode,
+                size=size,
             )
-    if False in [obj.result() for obj in obj_status_list]:
+            for mode in access_modes
+        ]
+        result_list = get_futures_results(result_lists)
+        pvc_objs_list = converge_lists(result_list)
+        # Check for all the pvcs in Bound state
+        obj_status_list = [
+            executor.submit(wait_for_resource_state, objs, "Bound", 90)
+            for objs in pvc_objs_list
+        ]
+        obj_status = get_futures_results(obj_status_list)
+    if False in obj_status:
         raise TimeoutExpiredError
     return pvc_objs_list
 
@@ -2001,6 +2171,7 @@ def create_pods_parallel(
     raw_block_pv=False,
     dc_deployment=False,
     node_selector=None,
+    max_workers=32,
 ):
     """
     Function to create pods in parallel
@@ -2015,83 +2186,166 @@ def create_pods_parallel(
         dc_deployment (bool): Either DC deployment or not
         node_selector (dict): dict of key-value pair to be used for nodeSelector field
             eg: {'nodetype': 'app-pod'}
+        max_workers (int): Max number of threads used for creating and
+            checking the pods
 
     Returns:
         pod_objs (list): Returns list of pods created
     """
-    future_pod_objs = []
     # Added 300 sec wait time since in scale test once the setup has more
     # PODs time taken for the pod to be up will be based on resource available
     wait_time = 300
     if raw_block_pv and not pod_dict_path:
         pod_dict_path = constants.CSI_RBD_RAW_BLOCK_POD_YAML
-    with ThreadPoolExecutor() as executor:
-        for pvc_obj in pvc_list:
-            future_pod_objs.append(
-                executor.submit(
-                    create_pod,
-                    interface_type=interface,
-                    pvc_name=pvc_obj.name,
-                    do_reload=False,
-                    namespace=namespace,
-                    raw_block_pv=raw_block_pv,
-                    pod_dict_path=pod_dict_path,
-                    sa_name=sa_name,
-                    dc_deployment=dc_deployment,
-                    node_selector=node_selector,
-                )
-            )
-    pod_objs = [pvc_obj.result() for pvc_obj in future_pod_objs]
-    # Check for all the pods are in Running state
-    # In above pod creation not waiting for the pod to be created because of threads usage
-    with ThreadPoolExecutor() as executor:
-        for obj in pod_objs:
-            future_pod_objs.append(
-                executor.submit(
-                    wait_for_resource_state, obj, "Running", timeout=wait_time
-                )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_pod_objs = [
+            executor.submit(
+                create_pod,
+                interface_type=interface,
+                pvc_name=pvc_obj.name,
+                do_reload=False,
+                namespace=namespace,
+                raw_block_pv=raw_block_pv,
+                pod_dict_path=pod_dict_path,
+                sa_name=sa_name,
+                dc_deployment=dc_deployment,
+                node_selector=node_selector,
             )
+            for pvc_obj in pvc_list
+        ]
+        pod_objs = get_futures_results(future_pod_objs)
+        # Check for all the pods are in Running state
+        # In above pod creation not waiting for the pod to be created because of threads usage
+        future_pod_status = [
+            executor.submit(wait_for_resource_state, obj, "Running", timeout=wait_time)
+            for obj in pod_objs
+        ]
+        pod_status = get_futures_results(future_pod_status)
     # If pods not up raise exception/failure
-    if False in [obj.result() for obj in future_pod_objs]:
+    if False in pod_status:
         raise TimeoutExpiredError
     return pod_objs
 
 
-def delete_objs_parallel(obj_list):
+def delete_objs_parallel(obj_list, max_workers=32):
     """
     Function to delete objs specified in list
     Args:
         obj_list(list): List can be obj of pod, pvc, etc
+        max_workers (int): Max number of objs deleted at the same time
 
     Returns:
-        bool: True if obj deleted else False
+        bool: True if all the objs deleted else False
 
     """
-    threads = list()
-    for obj in obj_list:
-        process = threading.Thread(target=obj.delete)
-        process.start()
-        threads.append(process)
-    for process in threads:
-        process.join()
-    return True
+    if not obj_list:
+        return True
+    deleted = True
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(obj_list))) as executor:
+        futures = {executor.submit(obj.delete): obj for obj in obj_list}
+        for future in as_completed(futures):
+            if future.exception():
+                logger.error(
+                    f"Failed to delete {futures[future].name}: {future.exception()}"
+                )
+                deleted = False
+    return deleted
+
+
+def convert_top_memory_to_kb(value):
+    """
+    Convert a memory value of top output to kb
+
+    Args:
+        value (str): Memory value, in kb unless it has a unit suffix,
+            eg: '102400', '512.5m', '1.2g'
+
+    Returns:
+        float: The memory value in kb
+
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    multiplier = {"k": 1, "m": 1024, "g": 1024 ** 2, "t": 1024 ** 3}.get(
+        value[-1:].lower()
+    )
+    if multiplier:
+        return float(value[:-1]) * multiplier
+    return float(value)
+
+
+def get_memory_leak_data(worker):
+    """
+    Get the "RES" values of the ceph-osd daemons captured so far on a worker by
+    the memory_leak_function fixture, i.e. the 8th field of each line, grouped
+    by daemon, as a worker can run several OSDs.
+
+    A daemon is identified by the OSD id of its command line, so it keeps the
+    same key when its pod is respinned and it gets a new PID. The PID (the 3rd
+    field) is used when the command line doesn't have the OSD id.
+
+    Args:
+        worker (str): Name of the worker node
+
+    Returns:
+        dict: Daemon (eg: 'osd.0') as a key and the list of its samples, as
+            tuples of the capture time and the memory value in kb, in the
+            order they were captured, as a value
+
+    Raises:
+        UnexpectedBehaviour: In case the memory leak file of the worker is
+            not found
+
+    """
+    if not os.path.exists(f"/tmp/{worker}-top-output.txt"):
+        logging.info(f"worker {worker} memory leak file not found")
+        raise UnexpectedBehaviour
+    memory_data = {}
+    with open(f"/tmp/{worker}-top-output.txt", "r") as f:
+        for line in f:
+            fields = line.split()
+            if not fields:
+                continue
+            osd_id = re.search(r"--id[= ](\d+)", line)
+            daemon = f"osd.{osd_id.group(1)}" if osd_id else fields[2]
+            captured_at = datetime.datetime.fromisoformat(f"{fields[0]} {fields[1]}")
+            memory_data.setdefault(daemon, []).append(
+                (captured_at, convert_top_memory_to_kb(fields[7]))
+            )
+    return memory_data
 
 
 def memory_leak_analysis(median_dict):
     """
     Function to analyse Memory leak after execution of test case Memory leak is
-    analyzed based on top output "RES" value of ceph-osd daemon, i.e.
-    ``list[7]`` in code.
+    analyzed based on top output "RES" value of ceph-osd daemon, i.e. the
+    8th field of the line.
 
     More Detail on Median value: For calculating memory leak require a constant
     value, which should not be start or end of test, so calculating it by
     getting memory for 180 sec before TC execution and take a median out of it.
-    Memory value could be different for each nodes, so identify constant value
-    for each node and update in median_dict
+    Memory value could be different for each ceph-osd daemon, so identify
+    constant value for each daemon of each node and update in median_dict
+
+    Only the samples captured after the median values were taken are used as
+    end values. A daemon with no such sample was not captured during the test
+    and is skipped, and a daemon which showed up during the test is compared
+    with the median of all the daemons of its worker.
+
+    Args:
+         median_dict (dict): dict of worker nodes and, for each of them, the
+         time the median values were taken at and the median values of their
+         ceph-osd daemons in kb
+         eg: median_dict = {
+             'worker_node_1': {
+                 'time': datetime.datetime(2021, 1, 1, 10, 0),
+                 'medians': {'osd.0': 102400, 'osd.3': 204800},
+             },
+             ...
+         }
 
-    Args:
-         median_dict (dict): dict of worker nodes and respective median value
-         eg: median_dict = {'worker_node_1':102400, 'worker_node_2':204800, ...}
+    Raises:
+        UnexpectedBehaviour: In case there is a memory leak
 
     Usage::
 
@@ -2104,76 +2358,100 @@ def memory_leak_analysis(median_dict):
             helpers.memory_leak_analysis(median_dict)
             ....
     """
-    # dict to store memory leak difference for each worker
+    # dict to store memory leak difference for each ceph-osd daemon of each worker
     diff = {}
     for worker in node.get_worker_nodes():
-        memory_leak_data = []
-        if os.path.exists(f"/tmp/{worker}-top-output.txt"):
-            with open(f"/tmp/{worker}-top-output.txt", "r") as f:
-                data = f.readline()
-                list = data.split(" ")
-                list = [i for i in list if i]
-                memory_leak_data.append(list[7])
-        else:
-            logging.info(f"worker {worker} memory leak file not found")
-            raise UnexpectedBehaviour
-        number_of_lines = len(memory_leak_data) - 1
-        # Get the start value form median_dict arg for respective worker
-        start_value = median_dict[f"{worker}"]
-        end_value = memory_leak_data[number_of_lines]
-        logging.info(f"Median value {start_value}")
-        logging.info(f"End value {end_value}")
-        # Convert the values to kb for calculations
-        if start_value.__contains__("g"):
-            start_value = float(1024 ** 2 * float(start_value[:-1]))
-        elif start_value.__contains__("m"):
-            start_value = float(1024 * float(start_value[:-1]))
-        else:
-            start_value = float(start_value)
-        if end_value.__contains__("g"):
-            end_value = float(1024 ** 2 * float(end_value[:-1]))
-        elif end_value.__contains__("m"):
-            end_value = float(1024 * float(end_value[:-1]))
-        else:
-            end_value = float(end_value)
-        # Calculate the percentage of diff between start and end value
-        # Based on value decide TC pass or fail
-        diff[worker] = ((end_value - start_value) / start_value) * 100
-        logging.info(f"Percentage diff in start and end value {diff[worker]}")
-        if diff[worker] <= 20:
-            logging.info(f"No memory leak in worker {worker} passing the test")
-        else:
-            logging.info(f"There is a memory leak in worker {worker}")
-            logging.info(f"Memory median value start of the test {start_value}")
-            logging.info(f"Memory value end of the test {end_value}")
-            raise UnexpectedBehaviour
+        medians = median_dict[f"{worker}"]["medians"]
+        median_time = median_dict[f"{worker}"]["time"]
+        test_data = {
+            daemon: [
+                value for captured_at, value in samples if captured_at > median_time
+            ]
+            for daemon, samples in get_memory_leak_data(worker).items()
+        }
+        diff[worker] = {}
+        for daemon in medians:
+            if not test_data.get(daemon):
+                logging.warning(
+                    f"ceph-osd {daemon} on worker {worker} was not captured "
+                    "during the test, skipped"
+                )
+        for daemon, values in test_data.items():
+            if not values:
+                continue
+            if daemon in medians:
+                start_value = medians[daemon]
+            elif not medians:
+                logging.warning(
+                    f"No median value for worker {worker}, ceph-osd {daemon} " "skipped"
+                )
+                continue
+            else:
+                # The daemon showed up during the test, e.g. with a new PID
+                # after a respin, so it has no median value of its own
+                start_value = statistics.median(medians.values())
+                logging.info(
+                    f"ceph-osd {daemon} of worker {worker} has no median value, "
+                    "using the median of the worker"
+                )
+            # The last captured value of the daemon is its memory at the end
+            # of the test
+            end_value = values[-1]
+            logging.info(f"Median value of ceph-osd {daemon} {start_value}")
+            logging.info(f"End value of ceph-osd {daemon} {end_value}")
+            # Calculate the percentage of diff between start and end value
+            # Based on value decide TC pass or fail
+            diff[worker][daemon] = ((end_value - start_value) / start_value) * 100
+            logging.info(
+                f"Percentage diff in start and end value {diff[worker][daemon]}"
+            )
+            if diff[worker][daemon] <= 20:
+                logging.info(
+                    f"No memory leak in ceph-osd {daemon} of worker {worker} "
+                    "passing the test"
+                )
+            else:
+                logging.info(
+                    f"There is a memory leak in ceph-osd {daemon} of worker {worker}"
+                )
+                logging.info(f"Memory median value start of the test {start_value}")
+                logging.info(f"Memory value end of the test {end_value}")
+                raise UnexpectedBehaviour
 
 
 def get_memory_leak_median_value():
     """
     Function to calculate memory leak Median value by collecting the data for 180 sec
     and find the median value which will be considered as starting point
-    to evaluate memory leak using "RES" value of ceph-osd daemon i.e. list[7] in code
+    to evaluate memory leak using "RES" value of ceph-osd daemon i.e. the 8th field
 
     Returns:
-        median_dict (dict): dict of worker nodes and respective median value
+        median_dict (dict): dict of worker nodes and, for each of them, the
+            time the median values were taken at and the median value in kb
+            of each of their ceph-osd daemons
     """
     median_dict = {}
     timeout = 180  # wait for 180 sec to evaluate  memory leak median data.
     logger.info(f"waiting for {timeout} sec to evaluate the median value")
     time.sleep(timeout)
     for worker in node.get_worker_nodes():
-        memory_leak_data = []
-        if os.path.exists(f"/tmp/{worker}-top-output.txt"):
-            with open(f"/tmp/{worker}-top-output.txt", "r") as f:
-                data = f.readline()
-                list = data.split(" ")
-                list = [i for i in list if i]
-                memory_leak_data.append(list[7])
-        else:
-            logging.info(f"worker {worker} memory leak file not found")
-            raise UnexpectedBehaviour
-        median_dict[f"{worker}"] = statistics.median(memory_leak_data)
+        # Samples captured after this time belong to the test execution
+        median_time = datetime.datetime.now()
+        median_samples = {}
+        for daemon, samples in get_memory_leak_data(worker).items():
+            values = [
+                value for captured_at, value in samples if captured_at <= median_time
+            ]
+            if values:
+                median_samples[daemon] = values
+        # Median of all the values captured while waiting for each daemon, in kb
+        median_dict[f"{worker}"] = {
+            "time": median_time,
+            "medians": {
+                daemon: statistics.median(values)
+                for daemon, values in median_samples.items()
+            },
+        }
     return median_dict
 
 
@@ -2206,23 +2484,19 @@ def rsync_kubeconf_to_node(node):
         node (str): OCP node to copy kubeconfig if not present
 
     """
-    # ocp_obj = ocp.OCP()
     filename = os.path.join(
         config.ENV_DATA["cluster_path"], config.RUN["kubeconfig_location"]
     )
     file_path = os.path.dirname(filename)
-    master_list = node.get_master_nodes()
     ocp_obj = ocp.OCP()
-    check_auth = "auth"
-    check_conf = "kubeconfig"
     node_path = "/home/core/"
-    if check_auth not in ocp_obj.exec_oc_debug_cmd(
-        node=master_list[0], cmd_list=[f"ls {node_path}"]
-    ):
-        ocp.rsync(src=file_path, dst=f"{node_path}", node=node, dst_node=True)
-    elif check_conf not in ocp_obj.exec_oc_debug_cmd(
-        node=master_list[0], cmd_list=[f"ls {node_path}auth"]
-    ):
+    # A single 'oc debug' covers both the auth directory and the kubeconfig
+    # file, ls fails if any of them is missing
+    try:
+        ocp_obj.exec_oc_debug_cmd(
+            node=node, cmd_list=[f"ls {node_path}auth/kubeconfig"]
+        )
+    except CommandFailed:
         ocp.rsync(src=file_path, dst=f"{node_path}", node=node, dst_node=True)
 
 
@@ -2259,7 +2533,7 @@ def create_dummy_osd(deployment):
         mode="w+", prefix=dummy_deployment, delete=False
     )
     with open(osd_file.name, "w") as temp:
-        yaml.dump(osd_data, temp)
+        yaml.dump(osd_data, temp, Dumper=templating.YAML_DUMPER)
     oc.create(osd_file.name)
 
     # downscale the original deployment and start dummy deployment instead
@@ -2298,11 +2572,13 @@ def get_failure_domin():
     ct_pod = pod.get_ceph_tools_pod()
     out = ct_pod.exec_ceph_cmd(ceph_cmd="ceph osd crush rule dump", format="json")
     assert out, "Failed to get cmd output"
+    rule_name = constants.CEPHBLOCKPOOL.lower()
     for crush_rule in out:
-        if constants.CEPHBLOCKPOOL.lower() in crush_rule.get("rule_name"):
-            for steps in crush_rule.get("steps"):
-                if "type" in steps:
-                    return steps.get("type")
+        if rule_name not in crush_rule.get("rule_name", ""):
+            continue
+        for step in crush_rule.get("steps", []):
+            if "type" in step:
+                return step["type"]
 
 
 def wait_for_ct_pod_recovery():
@@ -2315,7 +2591,8 @@ def wait_for_ct_pod_recovery():
 
     """
     try:
-        _ = get_admin_key()
+        # get_admin_key() is cached, run the command to check the pod
+        pod.get_ceph_tools_pod().exec_ceph_cmd("ceph auth get-key client.admin")
     except CommandFailed as ex:
         logger.info(str(ex))
         if "connection timed out" in str(ex):
@@ -2368,10 +2645,15 @@ def remove_label_from_worker_node(node_list, label_key):
     logger.info(out)
 
 
-def get_pods_nodes_logs():
+def get_pods_nodes_logs(log_filter=None):
     """
     Get logs from all pods and nodes
 
+    Args:
+        log_filter (callable): Called with the content of each log as soon as
+            it is fetched, only logs for which it returns a true value are
+            kept. All the logs are kept when not provided
+
     Returns:
         dict: node/pod name as key, logs content as value (string)
     """
@@ -2379,18 +2661,36 @@ def get_pods_nodes_logs():
     all_pods = pod.get_all_pods()
     all_nodes = node.get_node_objs()
 
-    for node_obj in all_nodes:
-        node_name = node_obj.name
-        log_content = node.get_node_logs(node_name)
-        all_logs.update({node_name: log_content})
-
-    for pod_obj in all_pods:
-        try:
-            pod_name = pod_obj.name
-            log_content = pod.get_pod_logs(pod_name)
-            all_logs.update({pod_name: log_content})
-        except CommandFailed:
-            pass
+    def fetch_log(get_logs, name):
+        # Drop filtered out logs in the worker, so they are not all held in
+        # memory until every fetch is done
+        log_content = get_logs(name)
+        if log_filter is None or log_filter(log_content):
+            return log_content
+
+    # Fetch the logs concurrently, each fetch is an 'oc' round trip
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        node_futures = {
+            node_obj.name: executor.submit(fetch_log, node.get_node_logs, node_obj.name)
+            for node_obj in all_nodes
+        }
+        pod_futures = {
+            pod_obj.name: executor.submit(fetch_log, pod.get_pod_logs, pod_obj.name)
+            for pod_obj in all_pods
+        }
+
+        for node_name, future in node_futures.items():
+            log_content = future.result()
+            if log_content is not None:
+                all_logs.update({node_name: log_content})
+
+        for pod_name, future in pod_futures.items():
+            try:
+                log_content = future.result()
+            except CommandFailed:
+                continue
+            if log_content is not None:
+                all_logs.update({pod_name: log_content})
 
     return all_logs
 
@@ -2406,7 +2706,6 @@ def get_logs_with_errors(errors=None):
     Returns:
         dict: node/pod name as key, logs content as value; may be empty
     """
-    all_logs = get_pods_nodes_logs()
     output_logs = {}
 
     errors_list = constants.CRITICAL_ERRORS
@@ -2414,15 +2713,26 @@ def get_logs_with_errors(errors=None):
     if errors:
         errors_list = errors_list + errors
 
-    for name, log_content in all_logs.items():
-        for error_msg in errors_list:
-            if error_msg in log_content:
+    # Look for all the errors in a single scan of each log, logs without
+    # errors are discarded as soon as they are fetched
+    errors_pattern = re.compile("|".join(re.escape(error) for error in errors_list))
+    all_logs = get_pods_nodes_logs(log_filter=errors_pattern.search)
+    log_dir = ocsci_log_path()
+
+    def write_log(name, log_content):
+        with open(f"{log_dir}/{name}.log", "w") as fh:
+            fh.write(log_content)
+
+    # Write the logs with errors in the background while scanning the rest
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        write_futures = []
+        for name, log_content in all_logs.items():
+            for error_msg in set(errors_pattern.findall(log_content)):
                 logger.debug(f"Found '{error_msg}' in log of {name}")
-                output_logs.update({name: log_content})
-
-                log_path = f"{ocsci_log_path()}/{name}.log"
-                with open(log_path, "w") as fh:
-                    fh.write(log_content)
+            output_logs.update({name: log_content})
+            write_futures.append(executor.submit(write_log, name, log_content))
+        for future in write_futures:
+            future.result()
 
     return output_logs
 
@@ -2469,47 +2779,37 @@ def collect_performance_stats(dir_name):
         logger.info(f"Creating directory {log_dir_path}")
         os.makedirs(log_dir_path)
 
-    performance_stats = {}
-    external = config.DEPLOYMENT["external_mode"]
-    if external:
-        # Skip collecting performance_stats for external mode RHCS cluster
-        logging.info("Skipping status collection for external mode")
-    else:
-        ceph_obj = CephCluster()
-
-        # Get iops and throughput percentage of cluster
-        iops_percentage = ceph_obj.get_iops_percentage()
-        throughput_percentage = ceph_obj.get_throughput_percentage()
-
-        performance_stats["iops_percentage"] = iops_percentage
-        performance_stats["throughput_percentage"] = throughput_percentage
+    # The stats are independent oc/ceph queries, collect them concurrently.
+    # Futures are submitted in the order of the keys in the dumped file.
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = {}
+        external = config.DEPLOYMENT["external_mode"]
+        if external:
+            # Skip collecting performance_stats for external mode RHCS cluster
+            logging.info("Skipping status collection for external mode")
+        else:
+            ceph_obj = CephCluster()
 
-    # ToDo: Get iops and throughput percentage of each nodes
+            # Get iops and throughput percentage of cluster
+            futures["iops_percentage"] = executor.submit(ceph_obj.get_iops_percentage)
+            futures["throughput_percentage"] = executor.submit(
+                ceph_obj.get_throughput_percentage
+            )
 
-    # Get the cpu and memory of each nodes from adm top
-    master_node_utilization_from_adm_top = (
-        node.get_node_resource_utilization_from_adm_top(node_type="master")
-    )
-    worker_node_utilization_from_adm_top = (
-        node.get_node_resource_utilization_from_adm_top(node_type="worker")
-    )
+        # ToDo: Get iops and throughput percentage of each nodes
 
-    # Get the cpu and memory from describe of nodes
-    master_node_utilization_from_oc_describe = (
-        node.get_node_resource_utilization_from_oc_describe(node_type="master")
-    )
-    worker_node_utilization_from_oc_describe = (
-        node.get_node_resource_utilization_from_oc_describe(node_type="worker")
-    )
+        # Get the cpu and memory of each nodes from adm top and from describe of nodes
+        for node_type in ("master", "worker"):
+            futures[f"{node_type}_node_utilization"] = executor.submit(
+                node.get_node_resource_utilization_from_adm_top, node_type=node_type
+            )
+        for node_type in ("master", "worker"):
+            futures[f"{node_type}_node_utilization_from_oc_describe"] = executor.submit(
+                node.get_node_resource_utilization_from_oc_describe,
+                node_type=node_type,
+            )
 
-    performance_stats["master_node_utilization"] = master_node_utilization_from_adm_top
-    performance_stats["worker_node_utilization"] = worker_node_utilization_from_adm_top
-    performance_stats[
-        "master_node_utilization_from_oc_describe"
-    ] = master_node_utilization_from_oc_describe
-    performance_stats[
-        "worker_node_utilization_from_oc_describe"
-    ] = worker_node_utilization_from_oc_describe
+        performance_stats = {key: future.result() for key, future in futures.items()}
 
     file_name = os.path.join(log_dir_path, "performance")
     with open(file_name, "w") as outfile:
@@ -2594,8 +2894,14 @@ def calc_local_file_md5_sum(path):
 
     """
     with open(path, "rb") as file_to_hash:
-        file_as_bytes = file_to_hash.read()
-    return hashlib.md5(file_as_bytes).hexdigest()
+        # hashlib.file_digest is available since python 3.11
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(file_to_hash, "md5").hexdigest()
+        md5_sum = hashlib.md5()
+        # Hash the file in chunks to keep the memory usage bounded for big files
+        for chunk in iter(lambda: file_to_hash.read(1024 * 1024), b""):
+            md5_sum.update(chunk)
+    return md5_sum.hexdigest()
 
 
 def retrieve_default_ingress_crt():
@@ -2603,6 +2909,31 @@ def retrieve_default_ingress_crt():
     Copy the default ingress certificate from the router-ca secret
     to the local code runner for usage with boto3.
 
+    The certificate is fetched once per cluster and the local file is only
+    rewritten when it is missing or its content differs.
+
+    """
+    crt = _get_default_ingress_crt(config.ENV_DATA["cluster_name"])
+    crt_path = constants.DEFAULT_INGRESS_CRT_LOCAL_PATH
+    if os.path.isfile(crt_path):
+        with open(crt_path, "rb") as crtfile:
+            if crtfile.read() == crt:
+                return
+
+    with open(crt_path, "wb") as crtfile:
+        crtfile.write(crt)
+
+
+@lru_cache(maxsize=None)
+def _get_default_ingress_crt(cluster_name):
+    """
+    Fetches the decoded default ingress certificate from the router-ca secret
+
+    Args:
+        cluster_name (str): Name of the cluster, used as the cache key
+
+    Returns:
+        bytes: The decoded certificate
     """
     default_ingress_crt_b64 = (
         OCP(
@@ -2614,11 +2945,7 @@ def retrieve_default_ingress_crt():
         .get("data")
         .get("tls.crt")
     )
-
-    decoded_crt = base64.b64decode(default_ingress_crt_b64).decode("utf-8")
-
-    with open(constants.DEFAULT_INGRESS_CRT_LOCAL_PATH, "w") as crtfile:
-        crtfile.write(decoded_crt)
+    return base64.b64decode(default_ingress_crt_b64)
 
 
 def storagecluster_independent_check():
@@ -2626,16 +2953,32 @@ def storagecluster_independent_check():
     Check whether the storagecluster is running in independent mode
     by checking the value of spec.externalStorage.enable
 
+    The mode is fetched once per cluster, the cached value is dropped by
+    clear_cluster_caches when the storagecluster is created or deleted.
+
     Returns:
         bool: True if storagecluster is running on external mode False otherwise
 
     """
-    storage_cluster = (
-        OCP(kind="StorageCluster", namespace=config.ENV_DATA["cluster_namespace"])
-        .get()
-        .get("items")[0]
+    return _storagecluster_independent_check(
+        config.ENV_DATA["cluster_name"], config.ENV_DATA["cluster_namespace"]
     )
 
+
+@lru_cache(maxsize=None)
+def _storagecluster_independent_check(cluster_name, namespace):
+    """
+    Fetches whether the storagecluster of the given cluster is running in
+    independent mode
+
+    Args:
+        cluster_name (str): Name of the cluster, used as the cache key
+        namespace (str): Namespace of the storagecluster
+
+    Returns:
+        bool: True if storagecluster is running on external mode False otherwise
+    """
+    storage_cluster = OCP(kind="StorageCluster", namespace=namespace).get()["items"][0]
     return bool(
         storage_cluster.get("spec", {}).get("externalStorage", {}).get("enable", False)
     )
@@ -0,0 +1,185 @@
+# -*- coding: utf8 -*-
+
+import datetime
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# pod has to be imported before helpers to avoid a circular import
+from ocs_ci.ocs.resources import pod  # noqa: F401
+from ocs_ci.helpers import helpers
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import UnexpectedBehaviour, UnexpectedVolumeType
+
+
+def test_are_volumes_present_in_backend_rbd():
+    """
+    Test that are_volumes_present_in_backend lists the rbd images once and
+    checks all the volumes against the listing.
+    """
+    ct_pod = MagicMock()
+    ct_pod.exec_ceph_cmd.return_value = ["csi-vol-aaa", "csi-vol-bbb"]
+    assert helpers.are_volumes_present_in_backend(
+        constants.CEPHBLOCKPOOL, ["aaa", "ccc"], pool_name="rbd", ct_pod=ct_pod
+    ) == {"aaa": True, "ccc": False}
+    ct_pod.exec_ceph_cmd.assert_called_once_with(
+        ceph_cmd="rbd ls -p rbd", format="json"
+    )
+
+
+def test_are_volumes_present_in_backend_cephfs():
+    """
+    Test that are_volumes_present_in_backend lists the CephFS subvolumes once
+    and checks all the volumes against the listing.
+    """
+    ct_pod = MagicMock()
+    ct_pod.exec_ceph_cmd.return_value = [{"name": "csi-vol-aaa"}]
+    with patch("ocs_ci.helpers.helpers.get_cephfs_name", return_value="fs"):
+        assert helpers.are_volumes_present_in_backend(
+            constants.CEPHFILESYSTEM, ["aaa", "bbb"], ct_pod=ct_pod
+        ) == {"aaa": True, "bbb": False}
+    ct_pod.exec_ceph_cmd.assert_called_once_with(
+        ceph_cmd="ceph fs subvolume ls fs csi", format="json"
+    )
+
+
+def test_are_volumes_present_in_backend_unsupported_interface():
+    """
+    Test that are_volumes_present_in_backend rejects unsupported interfaces.
+    """
+    ct_pod = MagicMock()
+    with pytest.raises(UnexpectedVolumeType):
+        helpers.are_volumes_present_in_backend("foo", ["aaa"], ct_pod=ct_pod)
+    ct_pod.exec_ceph_cmd.assert_not_called()
+
+
+def test_is_volume_present_in_backend_prefetched():
+    """
+    Test that is_volume_present_in_backend uses the given backend volumes
+    instead of querying the backend.
+    """
+    ct_pod = MagicMock()
+    backend_volumes = {"csi-vol-aaa"}
+    assert helpers.is_volume_present_in_backend(
+        constants.CEPHBLOCKPOOL, "aaa", ct_pod=ct_pod, backend_volumes=backend_volumes
+    )
+    assert not helpers.is_volume_present_in_backend(
+        constants.CEPHBLOCKPOOL, "bbb", ct_pod=ct_pod, backend_volumes=backend_volumes
+    )
+    ct_pod.exec_ceph_cmd.assert_not_called()
+
+
+def test_clear_cluster_caches_refetches_admin_key():
+    """
+    Test that the admin key is fetched once per cluster and fetched again
+    after clear_cluster_caches is called.
+    """
+    ct_pod = MagicMock()
+    ct_pod.exec_ceph_cmd.side_effect = [{"key": "old"}, {"key": "new"}]
+    helpers.clear_cluster_caches()
+    with patch("ocs_ci.helpers.helpers.pod.get_ceph_tools_pod", return_value=ct_pod):
+        assert helpers.get_admin_key() == "old"
+        assert helpers.get_admin_key() == "old"
+        helpers.clear_cluster_caches()
+        assert helpers.get_admin_key() == "new"
+    assert ct_pod.exec_ceph_cmd.call_count == 2
+    helpers.clear_cluster_caches()
+
+
+def test_clear_cluster_caches_refetches_independent_mode():
+    """
+    Test that the storagecluster independent mode is fetched again after
+    clear_cluster_caches is called.
+    """
+    storage_clusters = [
+        {"items": [{"spec": {}}]},
+        {"items": [{"spec": {"externalStorage": {"enable": True}}}]},
+    ]
+    helpers.clear_cluster_caches()
+    with patch("ocs_ci.helpers.helpers.OCP") as ocp_mock:
+        ocp_mock.return_value.get.side_effect = storage_clusters
+        assert not helpers.storagecluster_independent_check()
+        assert not helpers.storagecluster_independent_check()
+        helpers.clear_cluster_caches()
+        assert helpers.storagecluster_independent_check()
+    assert ocp_mock.return_value.get.call_count == 2
+    helpers.clear_cluster_caches()
+
+
+def write_top_output(worker, lines):
+    """
+    Write the memory leak file of a worker the way the memory_leak_function
+    fixture does, from (capture time, PID, RES, command) tuples
+    """
+    with open(f"/tmp/{worker}-top-output.txt", "w") as f:
+        for captured_at, pid, res, command in lines:
+            f.write(
+                f"{captured_at} {pid} ceph 20 0 2048m {res} 30m S 1.0 2.0 "
+                f"10:00.00 {command}\n"
+            )
+
+
+@pytest.fixture()
+def memory_leak_worker(request):
+    worker = f"test-worker-{request.node.name}"
+    yield worker
+    os.remove(f"/tmp/{worker}-top-output.txt")
+
+
+def test_memory_leak_analysis_respinned_osd(memory_leak_worker):
+    """
+    Test that a respinned OSD, with a new PID, is compared with the median of
+    the same OSD, and that only the samples of the test are analysed.
+    """
+    before = datetime.datetime(2021, 1, 1, 10, 0)
+    after = datetime.datetime(2021, 1, 1, 11, 0)
+    osd_0 = "ceph-osd --foreground --id 0 --fsid abc"
+    write_top_output(
+        memory_leak_worker,
+        [
+            (before, "100", "1g", osd_0),
+            (after, "100", "2g", osd_0),
+            (after, "200", "1.1g", osd_0),
+        ],
+    )
+    median_dict = {
+        memory_leak_worker: {
+            "time": datetime.datetime(2021, 1, 1, 10, 30),
+            "medians": {"osd.0": 1024.0 ** 2},
+        }
+    }
+    with patch(
+        "ocs_ci.helpers.helpers.node.get_worker_nodes",
+        return_value=[memory_leak_worker],
+    ):
+        helpers.memory_leak_analysis(median_dict)
+        write_top_output(
+            memory_leak_worker,
+            [(before, "100", "1g", osd_0), (after, "200", "2g", osd_0)],
+        )
+        with pytest.raises(UnexpectedBehaviour):
+            helpers.memory_leak_analysis(median_dict)
+
+
+def test_memory_leak_analysis_new_daemon(memory_leak_worker):
+    """
+    Test that a daemon which shows up during the test is compared with the
+    median of the worker.
+    """
+    write_top_output(
+        memory_leak_worker,
+        [(datetime.datetime(2021, 1, 1, 11, 0), "300", "2g", "ceph-osd")],
+    )
+    median_dict = {
+        memory_leak_worker: {
+            "time": datetime.datetime(2021, 1, 1, 10, 30),
+            "medians": {"osd.0": 1024.0 ** 2, "osd.1": 1024.0 ** 2},
+        }
+    }
+    with patch(
+        "ocs_ci.helpers.helpers.node.get_worker_nodes",
+        return_value=[memory_leak_worker],
+    ):
+        with pytest.raises(UnexpectedBehaviour):
+            helpers.memory_leak_analysis(median_dict)
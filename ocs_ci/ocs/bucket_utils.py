@@ -1,19 +1,18 @@
 """
 Helper functions file for working with object buckets
 """
+import itertools
 import logging
-import os
-import shlex
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from contextlib import closing
 from uuid import uuid4
 
-import boto3
-from botocore.handlers import disable_signing
-
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants
 from ocs_ci.ocs.exceptions import TimeoutExpiredError
+from ocs_ci.ocs.ocp import OCP
 from ocs_ci.utility import templating
-from ocs_ci.utility.utils import TimeoutSampler, run_cmd
+from ocs_ci.utility.utils import TimeoutSampler
 from ocs_ci.helpers.helpers import create_resource
 
 logger = logging.getLogger(__name__)
@@ -74,12 +73,12 @@ def verify_s3_object_integrity(original_object_path, result_object_path, awscli_
         bool: True if checksum matches, False otherwise
 
     """
-    md5sum = shlex.split(
-        awscli_pod.exec_cmd_on_pod(
-            command=f"md5sum {original_object_path} {result_object_path}"
-        )
+    output = awscli_pod.exec_cmd_on_pod(
+        command=f"md5sum {original_object_path} {result_object_path}",
+        out_yaml_format=False,
     )
-    if md5sum[0] == md5sum[2]:
+    md5sum = [line.split()[0] for line in output.strip().splitlines()]
+    if md5sum[0] == md5sum[1]:
         logger.info(
             f"Passed: MD5 comparison for {original_object_path} and {result_object_path}"
         )
@@ -87,7 +86,7 @@ def verify_s3_object_integrity(original_object_path, result_object_path, awscli_
     else:
         logger.error(
             f"Failed: MD5 comparison of {original_object_path} and {result_object_path} - "
-            f"{md5sum[0]} ≠ {md5sum[2]}"
+            f"{md5sum[0]} ≠ {md5sum[1]}"
         )
         return False
 
@@ -112,21 +111,18 @@ def retrieve_test_objects_to_pod(podobj, target_dir):
 
 def retrieve_anon_s3_resource():
     """
-    Returns an anonymous boto3 S3 resource by creating one and disabling signing
-
-    Disabling signing isn't documented anywhere, and this solution is based on
-    a comment by an AWS developer:
-    https://github.com/boto/boto3/issues/134#issuecomment-116766812
+    Returns an anonymous boto3 S3 resource that sends unsigned requests
 
     Returns:
         boto3.resource(): An anonymous S3 resource
 
     """
-    anon_s3_resource = boto3.resource("s3")
-    anon_s3_resource.meta.client.meta.events.register(
-        "choose-signer.s3.*", disable_signing
-    )
-    return anon_s3_resource
+    # boto3 is only needed here, import it lazily to keep module import cheap
+    import boto3
+    from botocore import UNSIGNED
+    from botocore.config import Config
+
+    return boto3.resource("s3", config=Config(signature_version=UNSIGNED))
 
 
 def sync_object_directory(podobj, src, target, s3_obj=None, signed_request_creds=None):
@@ -208,7 +204,8 @@ def write_individual_s3_objects(
     mcg_obj, awscli_pod, bucket_factory, downloaded_files, target_dir, bucket_name=None
 ):
     """
-    Writes objects one by one to an s3 bucket
+    Writes objects to an s3 bucket, uploading all of them with a single
+    recursive AWS CLI copy limited to the given object keys
 
     Args:
         mcg_obj (obj): An MCG object containing the MCG S3 connection credentials
@@ -222,22 +219,34 @@ def write_individual_s3_objects(
     """
     bucketname = bucket_name or bucket_factory(1)[0].name
     logger.info("Writing objects to bucket")
+    includes = " ".join(f"--include '{obj_name}'" for obj_name in downloaded_files)
+    copycommand = (
+        f"cp {target_dir} s3://{bucketname}/ --recursive --exclude '*' {includes}"
+    )
+    output = awscli_pod.exec_cmd_on_pod(
+        command=craft_s3_command(copycommand, mcg_obj),
+        out_yaml_format=False,
+        secrets=[
+            mcg_obj.access_key_id,
+            mcg_obj.access_key,
+            mcg_obj.s3_internal_endpoint,
+        ],
+    )
     for obj_name in downloaded_files:
-        full_object_path = f"s3://{bucketname}/{obj_name}"
-        copycommand = f"cp {target_dir}{obj_name} {full_object_path}"
-        assert "Completed" in awscli_pod.exec_cmd_on_pod(
-            command=craft_s3_command(copycommand, mcg_obj),
-            out_yaml_format=False,
-            secrets=[
-                mcg_obj.access_key_id,
-                mcg_obj.access_key,
-                mcg_obj.s3_internal_endpoint,
-            ],
-        )
+        assert (
+            f"s3://{bucketname}/{obj_name}" in output
+        ), f"Object {obj_name} was not written to bucket {bucketname}"
 
 
 def upload_parts(
-    mcg_obj, awscli_pod, bucketname, object_key, body_path, upload_id, uploaded_parts
+    mcg_obj,
+    awscli_pod,
+    bucketname,
+    object_key,
+    body_path,
+    upload_id,
+    uploaded_parts,
+    max_workers=8,
 ):
     """
     Uploads individual parts to a bucket
@@ -250,21 +259,22 @@ def upload_parts(
         body_path (str): Path of the directory on the aws pod which contains the parts to be uploaded
         upload_id (str): Multipart Upload-ID
         uploaded_parts (list): list containing the name of the parts to be uploaded
+        max_workers (int): Maximum number of parts uploaded concurrently
 
     Returns:
         list: List containing the ETag of the parts
 
     """
-    parts = []
     secrets = [mcg_obj.access_key_id, mcg_obj.access_key, mcg_obj.s3_internal_endpoint]
-    for count, part in enumerate(uploaded_parts, 1):
+
+    def _upload_part(count, part):
         upload_cmd = (
             f"upload-part --bucket {bucketname} --key {object_key}"
             f" --part-number {count} --body {body_path}/{part}"
             f" --upload-id {upload_id}"
         )
         # upload_cmd will return ETag, upload_id etc which is then split to get just the ETag
-        part = (
+        etag = (
             awscli_pod.exec_cmd_on_pod(
                 command=craft_s3_command(upload_cmd, mcg_obj, api=True),
                 out_yaml_format=False,
@@ -273,8 +283,17 @@ def upload_parts(
             .split('"')[-3]
             .split("\\")[0]
         )
-        parts.append({"PartNumber": count, "ETag": f'"{part}"'})
-    return parts
+        return {"PartNumber": count, "ETag": f'"{etag}"'}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # map keeps the results ordered by part number
+        return list(
+            executor.map(
+                _upload_part,
+                range(1, len(uploaded_parts) + 1),
+                uploaded_parts,
+            )
+        )
 
 
 def oc_create_aws_backingstore(cld_mgr, backingstore_name, uls_name, region):
@@ -547,23 +566,22 @@ def check_pv_backingstore_status(
     Args:
         backingstore_name (str): backingstore name
         namespace (str): backing store's namespace
-        desired_status (str): desired state for the backing store, if None is given then desired
-        is the Healthy status
+        desired_status (str / list): desired state(s) for the backing store, if None is given
+        then desired is the Healthy status
 
     Returns:
         bool: True if backing store is in the desired state
 
     """
-    kubeconfig = os.getenv("KUBECONFIG")
-    kubeconfig = f"--kubeconfig {kubeconfig}" if kubeconfig else ""
     namespace = namespace or config.ENV_DATA["cluster_namespace"]
+    if isinstance(desired_status, str):
+        desired_status = [desired_status]
 
-    cmd = (
-        f"oc get backingstore -n {namespace} {kubeconfig} {backingstore_name} "
-        "-o=jsonpath=`{.status.mode.modeCode}`"
+    bs_data = OCP(kind="backingstore", namespace=namespace).get(
+        resource_name=backingstore_name
     )
-    res = run_cmd(cmd=cmd)
-    return True if res in desired_status else False
+    mode_code = bs_data.get("status", {}).get("mode", {}).get("modeCode")
+    return mode_code in desired_status
 
 
 def create_multipart_upload(s3_obj, bucketname, object_key):
@@ -642,6 +660,87 @@ def complete_multipart_upload(s3_obj, bucketname, object_key, upload_id, parts):
     return result
 
 
+def complete_multipart_upload_when_ready(
+    s3_obj, bucketname, object_key, upload_id, parts_futures
+):
+    """
+    Completes the Multipart Upload once all its parts are uploaded
+
+    The parts are collected as their uploads finish, in any order, so no
+    part waits for a slower one uploaded before it.
+
+    Args:
+        s3_obj (obj): MCG or OBC object
+        bucketname (str): Name of the bucket
+        object_key (str): Unique object Identifier
+        upload_id (str): Multipart Upload-ID
+        parts_futures (list): Futures of the part uploads, each resolving to a
+            dict with the ETag and part number of the uploaded part
+
+    Returns:
+        dict : Dictionary containing the completed multipart upload details
+
+    """
+    parts = [future.result() for future in as_completed(parts_futures)]
+    parts.sort(key=lambda part: part["PartNumber"])
+    return complete_multipart_upload(s3_obj, bucketname, object_key, upload_id, parts)
+
+
+def stream_upload_parts(
+    s3_obj, bucketname, object_key, upload_id, part_iter, max_in_flight=10
+):
+    """
+    Uploads the parts of a Multipart Upload keeping up to max_in_flight part
+    uploads outstanding, the next part is read from part_iter and started as
+    soon as any outstanding upload finishes
+
+    Args:
+        s3_obj (obj): MCG or OBC object
+        bucketname (str): Name of the bucket
+        object_key (str): Unique object Identifier
+        upload_id (str): Multipart Upload-ID
+        part_iter (iterable): The content of the parts in order, it is only
+            consumed as upload slots free up so it can be a lazy reader
+        max_in_flight (int): Maximum number of parts uploaded concurrently
+
+    Returns:
+        list: List containing the ETag and part number of the uploaded parts,
+            ordered by part number
+
+    """
+
+    def _upload_part(part_number, body):
+        response = s3_obj.s3_client.upload_part(
+            Bucket=bucketname,
+            Key=object_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    parts = []
+    parts_bodies = enumerate(part_iter, 1)
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        in_flight = {
+            executor.submit(_upload_part, part_number, body)
+            for part_number, body in itertools.islice(parts_bodies, max_in_flight)
+        }
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    parts.append(future.result())
+                except Exception:
+                    for pending in in_flight:
+                        pending.cancel()
+                    raise
+            for part_number, body in itertools.islice(parts_bodies, len(done)):
+                in_flight.add(executor.submit(_upload_part, part_number, body))
+    parts.sort(key=lambda part: part["PartNumber"])
+    return parts
+
+
 def abort_all_multipart_upload(s3_obj, bucketname, object_key):
     """
     Abort all Multipart Uploads for this Bucket
@@ -649,23 +748,31 @@ def abort_all_multipart_upload(s3_obj, bucketname, object_key):
     Args:
         s3_obj (obj): MCG or OBC object
         bucketname (str): Name of the bucket
-        object_key (str): Unique object Identifier
+        object_key (str): Unique object Identifier. Kept for backward
+            compatibility, every upload is aborted using its own key
 
     Returns:
         list : List of aborted upload ids
 
     """
-    multipart_list = s3_obj.s3_client.list_multipart_uploads(Bucket=bucketname)
-    logger.info(f"Aborting{len(multipart_list)} uploads")
-    if "Uploads" in multipart_list:
-        return [
-            s3_obj.s3_client.abort_multipart_upload(
-                Bucket=bucketname, Key=object_key, UploadId=upload["UploadId"]
+    paginator = s3_obj.s3_client.get_paginator("list_multipart_uploads")
+    # boto3 clients are thread safe, abort the uploads concurrently while
+    # the next pages of the listing are fetched
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        futures = [
+            executor.submit(
+                s3_obj.s3_client.abort_multipart_upload,
+                Bucket=bucketname,
+                Key=upload["Key"],
+                UploadId=upload["UploadId"],
             )
-            for upload in multipart_list["Uploads"]
+            for page in paginator.paginate(Bucket=bucketname)
+            for upload in page.get("Uploads", [])
         ]
-    else:
-        return None
+        if not futures:
+            return None
+        logger.info(f"Aborting {len(futures)} uploads")
+        return [future.result() for future in futures]
 
 
 def abort_multipart(s3_obj, bucketname, object_key, upload_id):
@@ -738,6 +845,9 @@ def s3_put_object(s3_obj, bucketname, object_key, data, content_type=""):
     """
     Simple Boto3 client based Put object
 
+    Bodies of at least constants.S3_MULTIPART_CHUNKSIZE bytes are uploaded
+    as a multipart upload with the parts sent concurrently.
+
     Args:
         s3_obj (obj): MCG or OBC object
         bucketname (str): Name of the bucket
@@ -746,14 +856,72 @@ def s3_put_object(s3_obj, bucketname, object_key, data, content_type=""):
         content_type (str): Type of object data. eg: html, txt etc,
 
     Returns:
-        dict : Put object response
+        dict : Put object response (Complete multipart upload response for
+            large bodies)
 
     """
+    if (
+        isinstance(data, (bytes, bytearray))
+        and len(data) >= constants.S3_MULTIPART_CHUNKSIZE
+    ):
+        return s3_put_object_multipart(
+            s3_obj, bucketname, object_key, data, content_type
+        )
     return s3_obj.s3_client.put_object(
         Bucket=bucketname, Key=object_key, Body=data, ContentType=content_type
     )
 
 
+def s3_put_object_multipart(
+    s3_obj, bucketname, object_key, data, content_type="", max_workers=10
+):
+    """
+    Puts an object using a multipart upload, uploading the parts concurrently
+
+    Args:
+        s3_obj (obj): MCG or OBC object
+        bucketname (str): Name of the bucket
+        object_key (str): Unique object Identifier
+        data (bytes): content to write to a new S3 object
+        content_type (str): Type of object data. eg: html, txt etc,
+        max_workers (int): Maximum number of parts uploaded concurrently
+
+    Returns:
+        dict : Complete multipart upload response
+
+    """
+    part_size = constants.S3_MULTIPART_CHUNKSIZE
+    upload_id = s3_obj.s3_client.create_multipart_upload(
+        Bucket=bucketname, Key=object_key, ContentType=content_type
+    )["UploadId"]
+
+    def _upload_part(offset):
+        part_number = offset // part_size + 1
+        response = s3_obj.s3_client.upload_part(
+            Bucket=bucketname,
+            Key=object_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data[offset : offset + part_size],
+        )
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        parts_futures = [
+            executor.submit(_upload_part, offset)
+            for offset in range(0, len(data), part_size)
+        ]
+        try:
+            return complete_multipart_upload_when_ready(
+                s3_obj, bucketname, object_key, upload_id, parts_futures
+            )
+        except Exception:
+            for future in parts_futures:
+                future.cancel()
+            abort_multipart(s3_obj, bucketname, object_key, upload_id)
+            raise
+
+
 def s3_get_object(s3_obj, bucketname, object_key, versionid=""):
     """
     Simple Boto3 client based Get object
@@ -773,6 +941,71 @@ def s3_get_object(s3_obj, bucketname, object_key, versionid=""):
     )
 
 
+def s3_get_object_stream(
+    s3_obj,
+    bucketname,
+    object_key,
+    versionid="",
+    chunk_size=constants.S3_MULTIPART_CHUNKSIZE,
+):
+    """
+    Boto3 client based Get object which yields the object content in chunks,
+    so large objects can be processed without holding them in memory
+
+    Args:
+        s3_obj (obj): MCG or OBC object
+        bucketname (str): Name of the bucket
+        object_key (str): Unique object Identifier
+        versionid (str): Unique version number of an object
+        chunk_size (int): Maximum size of each yielded chunk in bytes
+
+    Yields:
+        bytes: The next chunk of the object content
+
+    """
+    response = s3_get_object(s3_obj, bucketname, object_key, versionid)
+    with closing(response["Body"]) as body:
+        yield from body.iter_chunks(chunk_size)
+
+
+def s3_get_object_parallel(
+    s3_obj,
+    bucketname,
+    object_key,
+    chunk_size=constants.S3_MULTIPART_CHUNKSIZE,
+    max_workers=10,
+):
+    """
+    Downloads an object by fetching byte ranges of it concurrently
+
+    Args:
+        s3_obj (obj): MCG or OBC object
+        bucketname (str): Name of the bucket
+        object_key (str): Unique object Identifier
+        chunk_size (int): Size of each requested byte range
+        max_workers (int): Maximum number of ranges fetched concurrently
+
+    Returns:
+        bytearray: The object content
+
+    """
+    size = s3_head_object(s3_obj, bucketname, object_key)["ContentLength"]
+    content = bytearray(size)
+
+    def _get_range(offset):
+        end = min(offset + chunk_size, size) - 1
+        response = s3_obj.s3_client.get_object(
+            Bucket=bucketname, Key=object_key, Range=f"bytes={offset}-{end}"
+        )
+        with closing(response["Body"]) as body:
+            content[offset : end + 1] = body.read()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results to re-raise any failure
+        list(executor.map(_get_range, range(0, size, chunk_size)))
+    return content
+
+
 def s3_delete_object(s3_obj, bucketname, object_key, versionid=""):
     """
     Simple Boto3 client based Delete object
@@ -888,11 +1121,31 @@ def s3_list_object_versions(s3_obj, bucketname, prefix=""):
         prefix (str): Object key prefix
 
     Returns:
-        dict : List object version response
+        dict : List object version response, holding a single page of up to
+            1000 versions; use s3_iter_object_versions to list all of them
     """
     return s3_obj.s3_client.list_object_versions(Bucket=bucketname, Prefix=prefix)
 
 
+def s3_iter_object_versions(s3_obj, bucketname, prefix=""):
+    """
+    Boto3 client based generator of all the object versions of a bucket,
+    fetching the listing lazily page by page
+
+    Args:
+        s3_obj (obj): MCG or OBC object
+        bucketname (str): Name of the bucket
+        prefix (str): Object key prefix
+
+    Yields:
+        dict : The next object version of the listing
+
+    """
+    paginator = s3_obj.s3_client.get_paginator("list_object_versions")
+    for page in paginator.paginate(Bucket=bucketname, Prefix=prefix):
+        yield from page.get("Versions", [])
+
+
 def s3_io_create_delete(mcg_obj, awscli_pod, bucket_factory):
     """
     Running IOs on s3 bucket
@@ -984,6 +1237,25 @@ def retrieve_verification_mode():
     return verify
 
 
+def retrieve_s3_client_config():
+    """
+    Returns the botocore configuration used for the MCG and OBC S3 clients
+
+    The connection pool is larger than the botocore default of 10 so helpers
+    issuing requests from several threads keep reusing connections, and
+    throttling errors are retried.
+
+    Returns:
+        botocore.config.Config: The S3 client configuration
+
+    """
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=50, retries={"max_attempts": 10, "mode": "standard"}
+    )
+
+
 def namespace_bucket_update(mcg_obj, bucket_name, read_resource, write_resource):
     """
     Edits MCG namespace bucket resources
@@ -1192,15 +1464,37 @@ def s3_delete_objects(s3_obj, bucketname, object_keys):
     """
     Boto3 client based delete objects
 
+    The objects are deleted in batches of up to 1000 keys, the maximum
+    accepted by a single DeleteObjects request.
+
     Args:
         s3_obj (obj): MCG or OBC object
         bucketname (str): Name of the bucket
-        object_keys (list): The objects to delete. Format: {'Key': 'object_key', 'VersionId': ''}
+        object_keys (list): The objects to delete. Format: {'Key': 'object_key', 'VersionId': ''},
+            plain object keys or (object key, version id) tuples are accepted as well
 
     Returns:
-        dict : delete objects response
-
-    """
-    return s3_obj.s3_client.delete_objects(
-        Bucket=bucketname, Delete={"Objects": object_keys}
-    )
+        dict : delete objects response, with the Deleted and Errors entries of
+            all the batches
+
+    """
+    objects = []
+    for obj in object_keys:
+        if isinstance(obj, str):
+            obj = {"Key": obj}
+        elif isinstance(obj, tuple):
+            obj = {"Key": obj[0], "VersionId": obj[1]}
+        objects.append(obj)
+
+    response = None
+    for i in range(0, len(objects), 1000):
+        batch_response = s3_obj.s3_client.delete_objects(
+            Bucket=bucketname, Delete={"Objects": objects[i : i + 1000]}
+        )
+        if response is None:
+            response = batch_response
+            continue
+        for entry in ("Deleted", "Errors"):
+            if entry in batch_response:
+                response.setdefault(entry, []).extend(batch_response[entry])
+    return response
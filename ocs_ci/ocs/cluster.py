@@ -589,11 +589,11 @@ class CephCluster(object):
                 # Converting all B/s and KiB/s to MiB/s
                 throughput = 0
                 for val in throughput_data:
-                    throughput += [
-                        float(re.findall(r"\d+", val)[0]) * constants.TP_CONVERSION[key]
-                        for key in constants.TP_CONVERSION.keys()
-                        if key in val
-                    ][0]
+                    throughput += next(
+                        float(re.findall(r"\d+(?:\.\d+)?", val)[0]) * multiplier
+                        for unit, multiplier in constants.TP_CONVERSION.items()
+                        if unit in val
+                    )
                     logger.info(
                         f"The {val[-2:].upper()} throughput is {throughput} MiB/s"
                     )
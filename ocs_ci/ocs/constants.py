@@ -87,7 +87,7 @@ HEALTHY_OB = "OPTIMAL"
 HEALTHY_OBC = STATUS_BOUND
 HEALTHY_OBC_CLI_PHASE = "Phase:Bound"
 HEALTHY_OB_CLI_MODE = "Mode:OPTIMAL"
-HEALTHY_PV_BS = ["`OPTIMAL`", "`LOW_CAPACITY`"]
+HEALTHY_PV_BS = ["OPTIMAL", "LOW_CAPACITY"]
 
 # Resources / Kinds
 CEPHFILESYSTEM = "CephFileSystem"
@@ -110,7 +110,6 @@ STORAGECLUSTER = "storagecluster"
 CLUSTER_OPERATOR = "ClusterOperator"
 MONITORING = "monitoring"
 CLUSTER_SERVICE_VERSION = "csv"
-JOB = "job"
 OAUTH = "OAuth"
 LOCAL_VOLUME = "localvolume"
 PROXY = "Proxy"
@@ -130,7 +129,6 @@ OPERATOR_GROUP = "OperatorGroup"
 SERVICE_ACCOUNT = "Serviceaccount"
 SCC = "SecurityContextConstraints"
 PRIVILEGED = "privileged"
-CLUSTER_SERVICE_VERSION = "csv"
 
 # Other
 SECRET = "Secret"
@@ -139,6 +137,8 @@ NAMESPACE = "Namespace"
 IGNORE_SC_GP2 = "gp2"
 IGNORE_SC_FLEX = "rook-ceph-block"
 TEST_FILES_BUCKET = "ocsci-test-files"
+# Bodies of at least this size are uploaded in parts of this size
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
 ROOK_REPOSITORY = "https://github.com/rook/rook.git"
 OPENSHIFT_MACHINE_API_NAMESPACE = "openshift-machine-api"
 OPENSHIFT_LOGGING_NAMESPACE = "openshift-logging"
@@ -659,7 +659,7 @@ config_keys_patterns_to_censor = ["passw", "token", "secret"]
 # packages
 RHEL_POD_PACKAGES = ["openssh-clients", "openshift-ansible", "openshift-clients", "jq"]
 
-# common locations
+# common locations on pods and RHEL nodes, join them with posixpath
 POD_UPLOADPATH = RHEL_TMP_PATH = "/tmp/"
 YUM_REPOS_PATH = "/etc/yum.repos.d/"
 PEM_PATH = "/etc/pki/ca-trust/source/anchors/"
@@ -693,7 +693,7 @@ HTPASSWD_SECRET_NAME = "htpass-secret"
 HTPASSWD_SECRET_YAML = "frontend/integration-tests/data/htpasswd-secret.yaml"
 HTPASSWD_PATCH_YAML = "frontend/integration-tests/data/patch-htpasswd.yaml"
 CHROME_BROWSER = "chrome"
-SUPPORTED_BROWSERS = CHROME_BROWSER
+SUPPORTED_BROWSERS = (CHROME_BROWSER,)
 
 # Inventory
 INVENTORY_TEMPLATE = "inventory.yaml.j2"
@@ -738,58 +738,37 @@ CEPHFS_NODE_SECRET = "rook-csi-cephfs-node"
 NOOBAA_OBJECTSTOREUSER_SECRET = "rook-ceph-object-user-ocs-storagecluster-cephobjectstore-noobaa-ceph-objectstore-user"
 
 # JSON Schema
+# Schema fragments shared by the OSD_TREE_* schemas, the schemas are only read
+# by jsonschema validation
+OSD_TREE_ID_SCHEMA = {"type": "integer"}
+OSD_TREE_NAME_SCHEMA = {"type": "string"}
+OSD_TREE_POOL_WEIGHTS_SCHEMA = {"type": "object"}
+OSD_TREE_CHILDREN_SCHEMA = {"type": "array", "items": OSD_TREE_ID_SCHEMA}
+
 OSD_TREE_ROOT = {
     "type": "object",
     "properties": {
-        "id": {"type": "integer"},
+        "id": OSD_TREE_ID_SCHEMA,
         "name": {"const": "default"},
         "type": {"const": "root"},
         "type_id": {"const": 11},
-        "children": {"type": "array", "items": {"type": "integer"}},
+        "children": OSD_TREE_CHILDREN_SCHEMA,
     },
     "required": ["children", "id", "name", "type", "type_id"],
     "additionalProperties": False,
 }
 
-OSD_TREE_RACK = {
-    "type": "object",
-    "properties": {
-        "id": {"type": "integer"},
-        "name": {"type": "string"},
-        "type": {"const": "rack"},
-        "type_id": {"const": 3},
-        "pool_weights": {"type": "object"},
-        "children": {"type": "array", "items": {"type": "integer"}},
-    },
-    "required": ["children", "id", "name", "pool_weights", "type", "type_id"],
-    "additionalProperties": False,
-}
-
-OSD_TREE_HOST = {
-    "type": "object",
-    "properties": {
-        "id": {"type": "integer"},
-        "name": {"type": "string"},
-        "type": {"const": "host"},
-        "type_id": {"const": 1},
-        "pool_weights": {"type": "object"},
-        "children": {"type": "array", "items": {"type": "integer"}},
-    },
-    "required": ["children", "id", "name", "pool_weights", "type", "type_id"],
-    "additionalProperties": False,
-}
-
 OSD_TREE_OSD = {
     "type": "object",
     "properties": {
-        "id": {"type": "integer"},
+        "id": OSD_TREE_ID_SCHEMA,
         "device_class": {"type": "string"},
         "name": {"pattern": "osd[.][0-9]+"},
         "type": {"const": "osd"},
         "type_id": {"const": 0},
         "crush_weight": {"type": "number"},
         "depth": {"type": "integer"},
-        "pool_weights": {"type": "object"},
+        "pool_weights": OSD_TREE_POOL_WEIGHTS_SCHEMA,
         "exists": {"type": "integer"},
         "status": {"const": "up"},
         "reweight": {"type": "integer"},
@@ -812,39 +791,44 @@ OSD_TREE_OSD = {
     "additionalProperties": False,
 }
 
-OSD_TREE_REGION = {
-    "type": "object",
-    "properties": {
-        "id": {"type": "integer"},
-        "name": {"type": "string"},
-        "type": {"const": "region"},
-        "type_id": {"const": 10},
-        "pool_weights": {"type": "object"},
-        "children": {"type": "array", "items": {"type": "integer"}},
-    },
-    "required": ["children", "id", "name", "pool_weights", "type", "type_id"],
-    "additionalProperties": False,
-}
 
-OSD_TREE_ZONE = {
-    "type": "object",
-    "properties": {
-        "id": {"type": "integer"},
-        "name": {"type": "string"},
-        "type": {"const": "zone"},
-        "type_id": {"const": 9},
-        "pool_weights": {"type": "object"},
-        "children": {"type": "array", "items": {"type": "integer"}},
-    },
-    "required": ["children", "id", "name", "pool_weights", "type", "type_id"],
-    "additionalProperties": False,
-}
+def _osd_tree_bucket_schema(bucket_type, type_id):
+    """
+    Build the schema of a CRUSH bucket (rack, host, ...) in the osd tree
+
+    Args:
+        bucket_type (str): CRUSH bucket type name
+        type_id (int): CRUSH bucket type id
+
+    Returns:
+        dict: JSON schema of the bucket
+
+    """
+    return {
+        "type": "object",
+        "properties": {
+            "id": OSD_TREE_ID_SCHEMA,
+            "name": OSD_TREE_NAME_SCHEMA,
+            "type": {"const": bucket_type},
+            "type_id": {"const": type_id},
+            "pool_weights": OSD_TREE_POOL_WEIGHTS_SCHEMA,
+            "children": OSD_TREE_CHILDREN_SCHEMA,
+        },
+        "required": ["children", "id", "name", "pool_weights", "type", "type_id"],
+        "additionalProperties": False,
+    }
+
+
+OSD_TREE_RACK = _osd_tree_bucket_schema("rack", 3)
+OSD_TREE_HOST = _osd_tree_bucket_schema("host", 1)
+OSD_TREE_REGION = _osd_tree_bucket_schema("region", 10)
+OSD_TREE_ZONE = _osd_tree_bucket_schema("zone", 9)
 
 # gather bootstrap
 GATHER_BOOTSTRAP_PATTERN = "openshift-install gather bootstrap --help"
 
 # must-gather commands output files
-MUST_GATHER_COMMANDS = [
+MUST_GATHER_COMMANDS = (
     "ceph_versions",
     "ceph_status",
     "ceph_report",
@@ -864,9 +848,9 @@ MUST_GATHER_COMMANDS = [
     "ceph_fs_dump",
     "ceph_df",
     "ceph_auth_list",
-]
+)
 
-MUST_GATHER_COMMANDS_JSON = [
+MUST_GATHER_COMMANDS_JSON = (
     "ceph_versions_--format_json-pretty",
     "ceph_status_--format_json-pretty",
     "ceph_report_--format_json-pretty",
@@ -886,7 +870,7 @@ MUST_GATHER_COMMANDS_JSON = [
     "ceph_fs_dump_--format_json-pretty",
     "ceph_df_--format_json-pretty",
     "ceph_auth_list_--format_json-pretty",
-]
+)
 
 # local storage
 LOCAL_STORAGE_OPERATOR = os.path.join(
@@ -919,23 +903,25 @@ RGW_SERVICE_EXTERNAL_MODE = "rook-ceph-rgw-ocs-external-storagecluster-cephobjec
 NOOBAA_OPERATOR_POD_CLI_PATH = "/usr/local/bin/noobaa-operator"
 NOOBAA_OPERATOR_LOCAL_CLI_PATH = os.path.join(DATA_DIR, "mcg-cli")
 DEFAULT_INGRESS_CRT = "router-ca.crt"
-DEFAULT_INGRESS_CRT_LOCAL_PATH = f"{DATA_DIR}/mcg-{DEFAULT_INGRESS_CRT}"
+DEFAULT_INGRESS_CRT_LOCAL_PATH = os.path.join(DATA_DIR, f"mcg-{DEFAULT_INGRESS_CRT}")
 SERVICE_CA_CRT = "service-ca.crt"
 SERVICE_CA_CRT_AWSCLI_PATH = f"/cert/{SERVICE_CA_CRT}"
 AWSCLI_RELAY_POD_NAME = "awscli-relay-pod"
 AWSCLI_SERVICE_CA_CONFIGMAP_NAME = "awscli-service-ca"
 
 # Storage classes provisioners
-OCS_PROVISIONERS = [
-    "openshift-storage.rbd.csi.ceph.com",
-    "openshift-storage.cephfs.csi.ceph.com",
-    "openshift-storage.noobaa.io/obc",
-]
+OCS_PROVISIONERS = frozenset(
+    (
+        "openshift-storage.rbd.csi.ceph.com",
+        "openshift-storage.cephfs.csi.ceph.com",
+        "openshift-storage.noobaa.io/obc",
+    )
+)
 
 # Bucket Policy action lists
-bucket_website_action_list = ["PutBucketWebsite", "GetBucketWebsite", "PutObject"]
-bucket_version_action_list = ["PutBucketVersioning", "GetBucketVersioning"]
-object_version_action_list = ["PutObject", "GetObjectVersion", "DeleteObjectVersion"]
+bucket_website_action_list = ("PutBucketWebsite", "GetBucketWebsite", "PutObject")
+bucket_version_action_list = ("PutBucketVersioning", "GetBucketVersioning")
+object_version_action_list = ("PutObject", "GetObjectVersion", "DeleteObjectVersion")
 
 # Flexy config constants
 FLEXY_MNT_CONTAINER_DIR = "/mnt"
@@ -971,7 +957,7 @@ AUTH_CONFIG_DOCS = (
 )
 
 # Conversions
-TP_CONVERSION = {" B/s": 0.000000976562, " KiB/s": 0.000976562, " MiB/s": 1}
+TP_CONVERSION = {" B/s": 1 / 1024 ** 2, " KiB/s": 1 / 1024, " MiB/s": 1}
 
 # LSO
 ROOT_DISK_NAME = "sda"
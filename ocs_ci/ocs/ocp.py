@@ -5,7 +5,9 @@ import logging
 import os
 import re
 import shlex
+import subprocess
 import tempfile
+import threading
 import time
 import yaml
 import json
@@ -22,7 +24,11 @@ from ocs_ci.ocs.exceptions import (
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import TimeoutSampler
 from ocs_ci.utility.utils import exec_cmd, run_cmd, update_container_with_mirrored_image
-from ocs_ci.utility.templating import dump_data_to_temp_yaml, load_yaml
+from ocs_ci.utility.templating import (
+    dump_data_to_temp_yaml,
+    load_yaml,
+    YAML_SAFE_LOADER,
+)
 from ocs_ci.ocs import defaults, constants
 from ocs_ci.framework import config
 
@@ -123,19 +129,7 @@ class OCP(object):
             str: If out_yaml_format is False.
 
         """
-        oc_cmd = "oc "
-        env_kubeconfig = os.getenv("KUBECONFIG")
-        if not env_kubeconfig or not os.path.exists(env_kubeconfig):
-            cluster_dir_kubeconfig = os.path.join(
-                config.ENV_DATA["cluster_path"], config.RUN.get("kubeconfig_location")
-            )
-            if os.path.exists(cluster_dir_kubeconfig):
-                oc_cmd += f"--kubeconfig {cluster_dir_kubeconfig} "
-
-        if self.namespace:
-            oc_cmd += f"-n {self.namespace} "
-
-        oc_cmd += command
+        oc_cmd = self._get_oc_cmd_prefix() + command
         out = run_cmd(
             cmd=oc_cmd,
             secrets=secrets,
@@ -151,9 +145,66 @@ class OCP(object):
             pass
 
         if out_yaml_format:
-            return yaml.safe_load(out)
+            return yaml.load(out, Loader=YAML_SAFE_LOADER)
         return out
 
+    def _get_oc_cmd_prefix(self):
+        """
+        Get the beginning of 'oc' command with kubeconfig and namespace
+        parameters
+
+        Returns:
+            str: 'oc' command prefix (e.g. 'oc --kubeconfig path -n namespace ')
+
+        """
+        oc_cmd = "oc "
+        env_kubeconfig = os.getenv("KUBECONFIG")
+        if not env_kubeconfig or not os.path.exists(env_kubeconfig):
+            cluster_dir_kubeconfig = os.path.join(
+                config.ENV_DATA["cluster_path"], config.RUN.get("kubeconfig_location")
+            )
+            if os.path.exists(cluster_dir_kubeconfig):
+                oc_cmd += f"--kubeconfig {cluster_dir_kubeconfig} "
+
+        if self.namespace:
+            oc_cmd += f"-n {self.namespace} "
+        return oc_cmd
+
+    def exec_oc_watch(self, command, timeout=600):
+        """
+        Executing 'oc' command with --watch parameter and yield its output
+        line by line as soon as the change is reported by the API server.
+        The command is terminated once the timeout expires or the generator
+        is closed.
+
+        Args:
+            command (str): The command to execute (e.g. get csv my-csv)
+                without the initial 'oc' at the beginning and without --watch
+            timeout (int): Time in seconds after which the watch is terminated
+
+        Yields:
+            str: One line of the command output
+
+        """
+        oc_cmd = self._get_oc_cmd_prefix() + command + " --watch"
+        log.info(f"Executing command: {oc_cmd}")
+        proc = subprocess.Popen(
+            shlex.split(oc_cmd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="utf-8",
+        )
+        timer = threading.Timer(timeout, proc.kill)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                yield line.strip()
+        finally:
+            timer.cancel()
+            proc.kill()
+            proc.wait()
+            log.debug(f"Watch command terminated with return code: {proc.returncode}")
+
     def exec_oc_debug_cmd(self, node, cmd_list, timeout=300):
         """
         Function to execute "oc debug" command on OCP node
@@ -852,7 +903,26 @@ class OCP(object):
         """
         self.check_function_supported(self._has_phase)
         self.check_name_is_specified()
-        sampler = TimeoutSampler(timeout, sleep, self.check_phase, phase=phase)
+        start_time = time.time()
+        # watch the phase changes first, it ends prematurely only when the
+        # resource doesn't exist yet or the watch fails, then fall back to
+        # sampling for the rest of the timeout
+        watch_cmd = (
+            f"get {self.kind} {self.resource_name} "
+            "-o jsonpath='{.status.phase}{\"\\n\"}'"
+        )
+        for current_phase in self.exec_oc_watch(watch_cmd, timeout=timeout):
+            log.info(f"Resource {self.resource_name} is in phase: {current_phase}!")
+            if current_phase == phase:
+                return
+        remaining_timeout = timeout - (time.time() - start_time)
+        if remaining_timeout <= 0:
+            raise ResourceInUnexpectedState(
+                f"Resource: {self.resource_name} is not in expected phase: " f"{phase}"
+            )
+        sampler = TimeoutSampler(
+            remaining_timeout, sleep, self.check_phase, phase=phase
+        )
         if not sampler.wait_for_func_status(True):
             raise ResourceInUnexpectedState(
                 f"Resource: {self.resource_name} is not in expected phase: " f"{phase}"
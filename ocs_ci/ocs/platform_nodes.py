@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import posixpath
 import re
 import shutil
 import time
@@ -886,26 +887,26 @@ class AWSNodes(NodesBase):
             rhel_pod_obj.copy_to_server(
                 host,
                 pem_dst_path,
-                os.path.join(repo_dst_path, repo_file),
-                os.path.join("/tmp", repo_file),
+                posixpath.join(repo_dst_path, repo_file),
+                posixpath.join("/tmp", repo_file),
                 user=constants.EC2_USER,
             )
             rhel_pod_obj.exec_cmd_on_node(
                 host,
                 pem_dst_path,
-                f'sudo mv {os.path.join("/tmp", repo_file)} {repo_dst_path}',
+                f'sudo mv {posixpath.join("/tmp", repo_file)} {repo_dst_path}',
                 user=constants.EC2_USER,
             )
             rhel_pod_obj.copy_to_server(
                 host,
                 pem_dst_path,
-                os.path.join(dst, constants.INTERNAL_MIRROR_PEM_FILE),
-                os.path.join("/tmp", constants.INTERNAL_MIRROR_PEM_FILE),
+                posixpath.join(dst, constants.INTERNAL_MIRROR_PEM_FILE),
+                posixpath.join("/tmp", constants.INTERNAL_MIRROR_PEM_FILE),
                 user=constants.EC2_USER,
             )
             cmd = (
                 f"sudo mv "
-                f'{os.path.join("/tmp/", constants.INTERNAL_MIRROR_PEM_FILE)} '
+                f'{posixpath.join("/tmp/", constants.INTERNAL_MIRROR_PEM_FILE)} '
                 f"{dst}"
             )
             rhel_pod_obj.exec_cmd_on_node(
@@ -4,7 +4,10 @@ import logging
 import boto3
 
 from ocs_ci.ocs import constants
-from ocs_ci.ocs.bucket_utils import retrieve_verification_mode
+from ocs_ci.ocs.bucket_utils import (
+    retrieve_s3_client_config,
+    retrieve_verification_mode,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +105,7 @@ class NoobaaAccount(object):
             "s3",
             verify=retrieve_verification_mode(),
             endpoint_url=self.s3_endpoint,
+            config=retrieve_s3_client_config(),
             aws_access_key_id=self.access_key_id,
             aws_secret_access_key=self.access_key,
         )
@@ -110,6 +114,7 @@ class NoobaaAccount(object):
             "s3",
             verify=retrieve_verification_mode(),
             endpoint_url=self.s3_endpoint,
+            config=retrieve_s3_client_config(),
             aws_access_key_id=self.access_key_id,
             aws_secret_access_key=self.access_key,
         )
@@ -2,6 +2,7 @@
 CatalogSource related functionalities
 """
 import logging
+import time
 
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.exceptions import CommandFailed, ResourceInUnexpectedState
@@ -100,7 +101,7 @@ class CatalogSource(OCP):
         return False
 
     @retry(ResourceInUnexpectedState, tries=4, delay=5, backoff=1)
-    def wait_for_state(self, state, timeout=480, sleep=5):
+    def wait_for_state(self, state, timeout=480, sleep=5, watch=False):
         """
         Wait till state of catalog source resource is the same as required one
         passed in the state parameter.
@@ -109,6 +110,9 @@ class CatalogSource(OCP):
             state (str): Desired state of catalog source object
             timeout (int): Timeout in seconds to wait for desired state
             sleep (int): Time in seconds to sleep between attempts
+            watch (bool): If True, the state changes are watched and the
+                sampling is used only for the rest of the timeout once the
+                watch ends prematurely
 
         Raises:
             ResourceInUnexpectedState: In case the catalog source is not in
@@ -116,6 +120,25 @@ class CatalogSource(OCP):
 
         """
         self.check_name_is_specified()
+        if watch:
+            start_time = time.time()
+            watch_cmd = (
+                f"get {self.kind} {self.resource_name} -o jsonpath="
+                "'{.status.connectionState.lastObservedState}{\"\\n\"}'"
+            )
+            for current_state in self.exec_oc_watch(watch_cmd, timeout=timeout):
+                logger.info(
+                    f"Catalog source {self.resource_name} is in state: "
+                    f"{current_state}!"
+                )
+                if current_state == state:
+                    return
+            timeout = timeout - (time.time() - start_time)
+            if timeout <= 0:
+                raise ResourceInUnexpectedState(
+                    f"Catalog source: {self.resource_name} is not in expected "
+                    f"state: {state}"
+                )
         sampler = TimeoutSampler(timeout, sleep, self.check_state, state=state)
         if not sampler.wait_for_func_status(True):
             raise ResourceInUnexpectedState(
@@ -10,7 +10,10 @@ from botocore.client import ClientError
 
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants
-from ocs_ci.ocs.bucket_utils import retrieve_verification_mode
+from ocs_ci.ocs.bucket_utils import (
+    retrieve_s3_client_config,
+    retrieve_verification_mode,
+)
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
     CredReqSecretNotFound,
@@ -136,6 +139,7 @@ class MCG:
             "s3",
             verify=retrieve_verification_mode(),
             endpoint_url=self.s3_endpoint,
+            config=retrieve_s3_client_config(),
             aws_access_key_id=self.access_key_id,
             aws_secret_access_key=self.access_key,
         )
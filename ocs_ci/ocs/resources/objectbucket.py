@@ -13,7 +13,10 @@ from ocs_ci.framework import config
 from ocs_ci.ocs import constants
 from ocs_ci.ocs.exceptions import CommandFailed, TimeoutExpiredError
 from ocs_ci.ocs.ocp import OCP
-from ocs_ci.ocs.bucket_utils import retrieve_verification_mode
+from ocs_ci.ocs.bucket_utils import (
+    retrieve_s3_client_config,
+    retrieve_verification_mode,
+)
 from ocs_ci.ocs.utils import oc_get_all_obc_names
 from ocs_ci.utility import templating
 from ocs_ci.utility.utils import TimeoutSampler
@@ -100,6 +103,7 @@ class OBC(object):
                 "s3",
                 verify=retrieve_verification_mode(),
                 endpoint_url=self.s3_external_endpoint,
+                config=retrieve_s3_client_config(),
                 aws_access_key_id=self.access_key_id,
                 aws_secret_access_key=self.access_key,
             )
@@ -2,6 +2,7 @@
 Package manifest related functionalities
 """
 import logging
+import time
 
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants
@@ -11,6 +12,7 @@ from ocs_ci.ocs.exceptions import (
     ChannelNotFound,
     NoInstallPlanForApproveFoundException,
     ResourceNotFoundError,
+    TimeoutExpiredError,
 )
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.resources.catalog_source import CatalogSource
@@ -251,8 +253,24 @@ class PackageManifest(OCP):
         resource_name = resource_name if resource_name else self.resource_name
         selector = selector if selector else self.selector
         self.check_name_is_specified(resource_name)
+        start_time = time.time()
+
+        # watch for the package manifest first, fall back to sampling for the
+        # rest of the timeout in case the watch ends prematurely
+        watch_cmd = f"get {self.kind} "
+        watch_cmd += f"--selector={selector} " if selector else f"{resource_name} "
+        watch_cmd += "-o jsonpath='{.metadata.name}{\"\\n\"}'"
+        for name in self.exec_oc_watch(watch_cmd, timeout=timeout):
+            if name == resource_name:
+                log.info(f"package manifest {resource_name} found!")
+                return
+        remaining_timeout = timeout - (time.time() - start_time)
+        if remaining_timeout <= 0:
+            raise TimeoutExpiredError(timeout)
 
-        for sample in TimeoutSampler(timeout=timeout, sleep=sleep, func=self.get):
+        for sample in TimeoutSampler(
+            timeout=remaining_timeout, sleep=sleep, func=self.get
+        ):
             if sample.get("metadata", {}).get("name") == resource_name:
                 log.info(f"package manifest {resource_name} found!")
                 return
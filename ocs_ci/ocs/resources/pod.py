@@ -1151,6 +1151,108 @@ def validate_pods_are_respinned_and_running_state(pod_objs_list):
     return True
 
 
+def wait_for_pods_to_be_respinned(
+    pod_objs_list, selector_label="app", timeout=300, sleep=5
+):
+    """
+    Wait for the pods to be respinned and in running state. The pods are
+    watched by a single 'oc get --watch' command on their labels, so the wait
+    ends as soon as the last of them is recreated and running. A pod is
+    running once its phase is Running and all its containers are ready, the
+    phase alone stays Running while a container is crash looping.
+
+    Args:
+        pod_objs_list (list): List of the pods obj taken before the respin
+        selector_label (str): Label of the pods to watch (default: app)
+        timeout (int): Time in seconds to wait
+        sleep (int): Sampling time in seconds, used only when the watch ends
+            prematurely
+
+    Raises:
+        TimeoutExpiredError: In case the pods weren't respinned or didn't
+            reach the Running state in the given timeout
+
+    """
+    namespace = pod_objs_list[0].namespace
+    old_uids = {pod.pod_data["metadata"]["uid"] for pod in pod_objs_list}
+    label_values = sorted({pod.labels.get(selector_label) for pod in pod_objs_list})
+    selector = f"{selector_label} in ({','.join(label_values)})"
+    pod_ocp = OCP(kind=constants.POD, namespace=namespace)
+    # name of the pod -> (uid, running), pods being deleted are not included
+    current_pods = {}
+
+    def is_running(phase, containers_ready):
+        return (
+            phase == constants.STATUS_RUNNING
+            and bool(containers_ready)
+            and all(ready == "true" for ready in containers_ready)
+        )
+
+    def respinned():
+        uids = {uid for uid, _ in current_pods.values()}
+        running = [uid for uid, running in current_pods.values() if running]
+        return not uids & old_uids and len(running) >= len(old_uids)
+
+    logger.info(f"Waiting for pods with selector '{selector}' to be respinned")
+    start_time = time.time()
+    watch_cmd = (
+        f"get {constants.POD} --selector='{selector}' -o jsonpath='{{.metadata.name}} "
+        f"{{.metadata.uid}} {{.status.phase}} "
+        f"ready={{range .status.containerStatuses[*]}}{{.ready}},{{end}} "
+        f'{{.metadata.deletionTimestamp}}{{"\\n"}}\''
+    )
+    for line in pod_ocp.exec_oc_watch(watch_cmd, timeout=timeout):
+        try:
+            name, uid, phase, ready, *deletion_timestamp = line.split()
+        except ValueError:
+            continue
+        if deletion_timestamp:
+            current_pods.pop(name, None)
+        else:
+            containers_ready = ready[len("ready=") :].rstrip(",").split(",")
+            current_pods[name] = (uid, is_running(phase, containers_ready))
+        if respinned():
+            logger.info(f"Pods with selector '{selector}' are respinned and running")
+            return
+
+    # the watch ends prematurely only when it fails, sample the pods for the
+    # rest of the timeout then
+    remaining_timeout = timeout - (time.time() - start_time)
+    if remaining_timeout > 0:
+        try:
+            for sample in TimeoutSampler(
+                remaining_timeout, sleep, pod_ocp.get, selector=selector
+            ):
+                current_pods = {
+                    pod["metadata"]["name"]: (
+                        pod["metadata"]["uid"],
+                        is_running(
+                            pod.get("status", {}).get("phase"),
+                            [
+                                str(container.get("ready")).lower()
+                                for container in pod.get("status", {}).get(
+                                    "containerStatuses", []
+                                )
+                            ],
+                        ),
+                    )
+                    for pod in sample.get("items", [])
+                    if not pod["metadata"].get("deletionTimestamp")
+                }
+                if respinned():
+                    logger.info(
+                        f"Pods with selector '{selector}' are respinned and running"
+                    )
+                    return
+        except TimeoutExpiredError:
+            pass
+    logger.error(
+        f"Pods with selector '{selector}' were not respinned, "
+        f"current pods: {current_pods}"
+    )
+    raise TimeoutExpiredError(timeout, f"Waiting for respin of pods {selector}")
+
+
 def verify_node_name(pod_obj, node_name):
     """
     Verifies that the pod is running on a particular node
@@ -0,0 +1,178 @@
+# -*- coding: utf8 -*-
+
+import io
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.response import StreamingBody
+
+# pod has to be imported before bucket_utils to avoid a circular import
+from ocs_ci.ocs.resources import pod  # noqa: F401
+from ocs_ci.ocs import bucket_utils
+
+
+class FakeUploadClient:
+    """
+    Fake S3 client recording the uploaded parts and the number of part
+    uploads running at the same time.
+    """
+
+    def __init__(self, delays=None, failing_part=None):
+        self.delays = delays or {}
+        self.failing_part = failing_part
+        self.uploaded = []
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(self.delays.get(PartNumber, 0.01))
+            if PartNumber == self.failing_part:
+                raise ValueError(f"Failed to upload part {PartNumber}")
+            with self.lock:
+                self.uploaded.append(PartNumber)
+            return {"ETag": f'"{Body}"'}
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def test_stream_upload_parts_order_and_in_flight_bound():
+    """
+    Test that stream_upload_parts returns the parts ordered by part number
+    even when they finish out of order, and never runs more than
+    max_in_flight uploads at the same time.
+    """
+    s3_obj = MagicMock()
+    # the first parts are the slowest, so the later ones finish first
+    s3_obj.s3_client = FakeUploadClient(delays={1: 0.1, 2: 0.05})
+    parts = bucket_utils.stream_upload_parts(
+        s3_obj,
+        "bucket",
+        "key",
+        "upload-id",
+        (f"body-{i}" for i in range(1, 11)),
+        max_in_flight=3,
+    )
+    assert parts == [{"PartNumber": i, "ETag": f'"body-{i}"'} for i in range(1, 11)]
+    assert s3_obj.s3_client.uploaded[:2] != [1, 2]
+    assert s3_obj.s3_client.max_running <= 3
+
+
+def test_stream_upload_parts_stops_on_failure():
+    """
+    Test that stream_upload_parts raises the error of a failed part and
+    doesn't start uploading the remaining parts.
+    """
+    s3_obj = MagicMock()
+    s3_obj.s3_client = FakeUploadClient(delays={1: 0, 2: 0.05}, failing_part=1)
+    consumed = []
+
+    def part_iter():
+        for i in range(1, 11):
+            consumed.append(i)
+            yield f"body-{i}"
+
+    with pytest.raises(ValueError):
+        bucket_utils.stream_upload_parts(
+            s3_obj, "bucket", "key", "upload-id", part_iter(), max_in_flight=2
+        )
+    assert consumed == [1, 2]
+    assert 1 not in s3_obj.s3_client.uploaded
+
+
+class FakeDownloadClient:
+    """
+    Fake S3 client serving a single object, supporting byte ranges.
+    """
+
+    def __init__(self, content, failing_range=None):
+        self.content = content
+        self.failing_range = failing_range
+        self.ranges = []
+        self.lock = threading.Lock()
+
+    def head_object(self, Bucket, Key):
+        return {"ContentLength": len(self.content)}
+
+    def get_object(self, Bucket, Key, Range=None, VersionId=""):
+        content = self.content
+        if Range:
+            with self.lock:
+                self.ranges.append(Range)
+            if Range == self.failing_range:
+                raise ValueError(f"Failed to get {Range}")
+            start, end = Range[len("bytes=") :].split("-")
+            content = content[int(start) : int(end) + 1]
+        return {"Body": StreamingBody(io.BytesIO(content), len(content))}
+
+
+@pytest.mark.parametrize("size", [25, 30])
+def test_s3_get_object_parallel_ranges(size):
+    """
+    Test that s3_get_object_parallel requests non overlapping ranges covering
+    the whole object and assembles them, whether or not the object size is a
+    multiple of the chunk size.
+    """
+    content = bytes(range(size))
+    s3_obj = MagicMock()
+    s3_obj.s3_client = FakeDownloadClient(content)
+    assert (
+        bucket_utils.s3_get_object_parallel(s3_obj, "bucket", "key", chunk_size=10)
+        == content
+    )
+    expected_ranges = [
+        f"bytes={start}-{min(start + 10, size) - 1}" for start in range(0, size, 10)
+    ]
+    assert sorted(s3_obj.s3_client.ranges) == sorted(expected_ranges)
+
+
+def test_s3_get_object_parallel_empty_object():
+    """
+    Test that s3_get_object_parallel returns empty content for a zero size
+    object without requesting any range.
+    """
+    s3_obj = MagicMock()
+    s3_obj.s3_client = FakeDownloadClient(b"")
+    assert bucket_utils.s3_get_object_parallel(s3_obj, "bucket", "key") == b""
+    assert s3_obj.s3_client.ranges == []
+
+
+def test_s3_get_object_parallel_failed_range():
+    """
+    Test that s3_get_object_parallel raises the error of a failed range.
+    """
+    s3_obj = MagicMock()
+    s3_obj.s3_client = FakeDownloadClient(bytes(30), failing_range="bytes=10-19")
+    with pytest.raises(ValueError):
+        bucket_utils.s3_get_object_parallel(s3_obj, "bucket", "key", chunk_size=10)
+
+
+def test_s3_get_object_stream():
+    """
+    Test that s3_get_object_stream yields the object content in chunks of at
+    most chunk_size bytes.
+    """
+    content = bytes(range(25))
+    s3_obj = MagicMock()
+    s3_obj.s3_client = FakeDownloadClient(content)
+    chunks = list(
+        bucket_utils.s3_get_object_stream(s3_obj, "bucket", "key", chunk_size=10)
+    )
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert b"".join(chunks) == content
+
+
+def test_s3_get_object_stream_empty_object():
+    """
+    Test that s3_get_object_stream yields nothing for a zero size object.
+    """
+    s3_obj = MagicMock()
+    s3_obj.s3_client = FakeDownloadClient(b"")
+    assert list(bucket_utils.s3_get_object_stream(s3_obj, "bucket", "key")) == []
@@ -0,0 +1,32 @@
+# -*- coding: utf8 -*-
+
+from unittest.mock import patch
+
+from ocs_ci.ocs.resources.csv import CSV
+
+
+def test_wait_for_phase_watch():
+    """
+    Test that wait_for_phase returns as soon as the watch reports the
+    desired phase, without sampling the resource.
+    """
+    csv = CSV(resource_name="foo", namespace="bar")
+    with patch(
+        "ocs_ci.ocs.ocp.OCP.exec_oc_watch",
+        return_value=iter(["Pending", "Installing", "Succeeded"]),
+    ), patch("ocs_ci.ocs.ocp.OCP.check_phase") as check_phase:
+        csv.wait_for_phase("Succeeded", timeout=10)
+    check_phase.assert_not_called()
+
+
+def test_wait_for_phase_watch_fallback():
+    """
+    Test that wait_for_phase falls back to sampling the phase when the watch
+    ends prematurely, e.g. because the resource doesn't exist yet.
+    """
+    csv = CSV(resource_name="foo", namespace="bar")
+    with patch("ocs_ci.ocs.ocp.OCP.exec_oc_watch", return_value=iter([])), patch(
+        "ocs_ci.ocs.ocp.OCP.check_phase", return_value=True
+    ) as check_phase:
+        csv.wait_for_phase("Succeeded", timeout=10)
+    check_phase.assert_called_once_with(phase="Succeeded")
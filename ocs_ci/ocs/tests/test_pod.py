@@ -0,0 +1,78 @@
+# -*- coding: utf8 -*-
+
+from unittest.mock import patch
+
+import pytest
+
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
+from ocs_ci.ocs.resources.pod import Pod, wait_for_pods_to_be_respinned
+
+
+def get_prometheus_pods():
+    """
+    Get the pod objects of the prometheus pods taken before the respin
+    """
+    return [
+        Pod(
+            metadata={
+                "name": f"prometheus-k8s-{i}",
+                "namespace": "openshift-monitoring",
+                "uid": f"old-{i}",
+                "labels": {"app": "prometheus"},
+            }
+        )
+        for i in range(2)
+    ]
+
+
+def test_wait_for_pods_to_be_respinned_watch():
+    """
+    Test that wait_for_pods_to_be_respinned returns once the watch reports
+    all the pods recreated with a new uid and running.
+    """
+    pods = get_prometheus_pods()
+    watch_output = [
+        "prometheus-k8s-0 old-0 Running ready=true,true,",
+        "prometheus-k8s-1 old-1 Running ready=true,true,",
+        "prometheus-k8s-0 old-0 Running ready=true,true, 2021-01-01T00:00:00Z",
+        "prometheus-k8s-0 new-0 Pending ready=",
+        "prometheus-k8s-0 new-0 Running ready=true,true,",
+        "prometheus-k8s-1 old-1 Running ready=true,true, 2021-01-01T00:00:00Z",
+        "prometheus-k8s-1 new-1 Running ready=false,true,",
+        "prometheus-k8s-1 new-1 Running ready=true,true,",
+    ]
+    with patch(
+        "ocs_ci.ocs.ocp.OCP.exec_oc_watch", return_value=iter(watch_output)
+    ) as exec_oc_watch, patch("ocs_ci.ocs.ocp.OCP.get") as get:
+        wait_for_pods_to_be_respinned(pods, timeout=10)
+    assert "--selector='app in (prometheus)'" in exec_oc_watch.call_args[0][0]
+    get.assert_not_called()
+
+
+def test_wait_for_pods_to_be_respinned_containers_not_ready():
+    """
+    Test that wait_for_pods_to_be_respinned doesn't consider a respinned pod
+    running while one of its containers isn't ready, e.g. crash looping.
+    """
+    pods = get_prometheus_pods()
+    watch_output = [
+        "prometheus-k8s-0 new-0 Running ready=true,true,",
+        "prometheus-k8s-1 new-1 Running ready=true,false,",
+    ]
+    sample = {
+        "items": [
+            {
+                "metadata": {"name": f"prometheus-k8s-{i}", "uid": f"new-{i}"},
+                "status": {
+                    "phase": "Running",
+                    "containerStatuses": [{"ready": True}, {"ready": i == 0}],
+                },
+            }
+            for i in range(2)
+        ]
+    }
+    with patch(
+        "ocs_ci.ocs.ocp.OCP.exec_oc_watch", return_value=iter(watch_output)
+    ), patch("ocs_ci.ocs.ocp.OCP.get", return_value=sample):
+        with pytest.raises(TimeoutExpiredError):
+            wait_for_pods_to_be_respinned(pods, timeout=1, sleep=0.1)
@@ -8,6 +8,7 @@ from ocs_ci.ocs.ocp import switch_to_project
 from ocs_ci.ocs.resources.pvc import get_all_pvcs_in_storageclass, get_all_pvcs
 from ocs_ci.ocs.resources.storage_cluster import get_all_storageclass
 from ocs_ci.utility.localstorage import check_local_volume
+from ocs_ci.helpers.helpers import clear_cluster_caches
 
 log = logging.getLogger(__name__)
 
@@ -214,6 +215,7 @@ def uninstall_ocs():
 
     log.info("Deleting storageCluster object")
     storage_cluster.delete(resource_name=constants.DEFAULT_CLUSTERNAME)
+    clear_cluster_caches()
 
     log.info("Removing CRDs")
     crd_list = [
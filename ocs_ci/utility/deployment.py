@@ -2,15 +2,18 @@
 Utility functions that are used as a part of OCP or OCS deployments
 """
 import logging
+from functools import lru_cache
 
 import requests
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
 def get_ocp_ga_version(channel):
     """
-    Retrieve the latest GA version for
+    Retrieve the latest GA version for the given channel. The result is
+    cached per channel for the whole run.
 
     Args:
         channel (str): the OCP version channel to retrieve GA version for
@@ -1,5 +1,8 @@
 import json
 import logging
+import os
+import tempfile
+from functools import lru_cache
 from jinja2 import Environment, FileSystemLoader, Template
 import yaml
 
@@ -10,6 +13,11 @@ from ocs_ci.utility.utils import censor_values, get_url_content
 
 logger = logging.getLogger(__name__)
 
+# Use libyaml based C implementation of loader and dumper when PyYAML is built
+# with it, pure python implementation is used as fallback.
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
 
 def load_config_data(data_path):
     """
@@ -42,7 +50,7 @@ def to_nice_yaml(a, indent=2, *args, **kw):
     """
     transformed = yaml.dump(
         a,
-        Dumper=yaml.Dumper,
+        Dumper=YAML_DUMPER,
         indent=indent,
         allow_unicode=True,
         default_flow_style=False,
@@ -121,7 +129,7 @@ def generate_yaml_from_jinja2_template_with_data(file_, **kwargs):
         data = stream.read()
     template = Template(data)
     out = template.render(**kwargs)
-    return yaml.safe_load(out)
+    return yaml.load(out, Loader=YAML_SAFE_LOADER)
 
 
 def dump_to_temp_yaml(src_file, dst_file, **kwargs):
@@ -133,7 +141,7 @@ def dump_to_temp_yaml(src_file, dst_file, **kwargs):
     """
     data = generate_yaml_from_jinja2_template_with_data(src_file, **kwargs)
     with open(dst_file, "w") as yaml_file:
-        yaml.dump(data, yaml_file)
+        yaml.dump(data, yaml_file, Dumper=YAML_DUMPER)
 
 
 def load_yaml(file, multi_document=False):
@@ -151,12 +159,40 @@ def load_yaml(file, multi_document=False):
             iteration returns dict from one loaded document from a file.
 
     """
-    loader = yaml.safe_load_all if multi_document else yaml.safe_load
     if file.startswith("http"):
-        return loader(get_url_content(file))
-    else:
-        with open(file, "r") as fs:
-            return loader(fs.read())
+        loader = yaml.load_all if multi_document else yaml.load
+        return loader(get_url_content(file), Loader=YAML_SAFE_LOADER)
+    stat = os.stat(file)
+    data = _load_yaml_file(file, stat.st_mtime_ns, stat.st_size, multi_document)
+    if multi_document:
+        return (deepcopy(document) for document in data)
+    return deepcopy(data)
+
+
+@lru_cache(maxsize=256)
+def _load_yaml_file(file, mtime_ns, size, multi_document=False):
+    """
+    Load and cache parsed data of local yaml file. The cache is keyed by the
+    file modification time and size, so the file is parsed again once it's
+    changed, and is bounded so data of the temporary yaml files generated
+    during the run are not kept forever. Returned data are shared between
+    callers and must not be modified, use load_yaml to get a private copy.
+
+    Args:
+        file (str): Path to the file
+        mtime_ns (int): Modification time of the file in nanoseconds
+        size (int): Size of the file in bytes
+        multi_document (bool): True if yaml contains more documents
+
+    Returns:
+        dict: Loaded data from yaml file with one document.
+        tuple: Loaded documents if multi_document == True.
+
+    """
+    with open(file, "r") as fs:
+        if multi_document:
+            return tuple(yaml.load_all(fs.read(), Loader=YAML_SAFE_LOADER))
+        return yaml.load(fs.read(), Loader=YAML_SAFE_LOADER)
 
 
 def get_n_document_from_yaml(yaml_generator, index=0):
@@ -194,14 +230,58 @@ def dump_data_to_temp_yaml(data, temp_yaml):
         str: dumped yaml data
 
     """
-    dumper = yaml.dump if isinstance(data, dict) else yaml.dump_all
-    yaml_data = dumper(data)
+    yaml_data = _dump_yaml_data(data)
     with open(temp_yaml, "w") as yaml_file:
         yaml_file.write(yaml_data)
+    return yaml_data
+
+
+def dump_data_to_new_temp_yaml(data, prefix):
+    """
+    Dump data to newly created temporary yaml file. The file is written via
+    the descriptor returned when it's created, and it's not deleted
+    afterwards.
+
+    Args:
+        data (dict or list): dict or list (in case of multi_document) with
+            data to dump to the yaml file.
+        prefix (str): prefix of the temporary file name
+
+    Returns:
+        str: file path of created yaml file
+
+    """
+    yaml_data = _dump_yaml_data(data)
+    fd, temp_yaml = tempfile.mkstemp(prefix=prefix, suffix=".yaml")
+    with os.fdopen(fd, "w") as yaml_file:
+        yaml_file.write(yaml_data)
+    return temp_yaml
+
+
+def _dump_yaml_data(data):
+    """
+    Dump data to yaml string and log its censored version
+
+    Args:
+        data (dict or list): dict or list (in case of multi_document) with
+            data to dump.
+
+    Returns:
+        str: dumped yaml data
+
+    """
     if isinstance(data, dict):
-        yaml_data_censored = dumper(censor_values(deepcopy(data)))
+        yaml_data = yaml.dump(data, Dumper=YAML_DUMPER)
+        yaml_data_censored = yaml.dump(
+            censor_values(deepcopy(data)), Dumper=YAML_DUMPER
+        )
     else:
-        yaml_data_censored = [dumper(censor_values(deepcopy(doc))) for doc in data]
+        # data could be a generator returned by load_yaml(multi_document=True)
+        data = list(data)
+        yaml_data = yaml.dump_all(data, Dumper=YAML_DUMPER)
+        yaml_data_censored = [
+            yaml.dump(censor_values(deepcopy(doc)), Dumper=YAML_DUMPER) for doc in data
+        ]
     logger.info(yaml_data_censored)
     return yaml_data
 
@@ -0,0 +1,72 @@
+# -*- coding: utf8 -*-
+
+import os
+
+from ocs_ci.utility import templating
+
+
+def test_load_yaml_returns_private_copy(tmpdir):
+    """
+    Checking that modification of data returned by load_yaml doesn't affect
+    data returned by the next call for the same file.
+    """
+    yaml_file = tmpdir.join("data.yaml")
+    yaml_file.write("metadata:\n  name: foo\n")
+    data = templating.load_yaml(str(yaml_file))
+    data["metadata"]["name"] = "bar"
+    assert templating.load_yaml(str(yaml_file))["metadata"]["name"] == "foo"
+
+
+def test_load_yaml_reloads_changed_file(tmpdir):
+    """
+    Checking that load_yaml parses the file again once it's modified.
+    """
+    yaml_file = tmpdir.join("data.yaml")
+    yaml_file.write("metadata:\n  name: foo\n")
+    assert templating.load_yaml(str(yaml_file))["metadata"]["name"] == "foo"
+    yaml_file.write("metadata:\n  name: bar\n")
+    mtime = os.stat(str(yaml_file)).st_mtime
+    os.utime(str(yaml_file), (mtime + 1, mtime + 1))
+    assert templating.load_yaml(str(yaml_file))["metadata"]["name"] == "bar"
+
+
+def test_load_yaml_reloads_file_rewritten_with_same_mtime(tmpdir):
+    """
+    Checking that load_yaml parses the file again when it's rewritten within
+    the same modification time, as long as its size changed.
+    """
+    yaml_file = tmpdir.join("data.yaml")
+    yaml_file.write("metadata:\n  name: foo\n")
+    stat = os.stat(str(yaml_file))
+    assert templating.load_yaml(str(yaml_file))["metadata"]["name"] == "foo"
+    yaml_file.write("metadata:\n  name: foobar\n")
+    os.utime(str(yaml_file), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert templating.load_yaml(str(yaml_file))["metadata"]["name"] == "foobar"
+
+
+def test_load_yaml_multi_document(tmpdir):
+    """
+    Checking that load_yaml returns private copies of all documents when
+    multi_document is used.
+    """
+    yaml_file = tmpdir.join("data.yaml")
+    yaml_file.write("kind: Namespace\n---\nkind: Subscription\n")
+    docs = list(templating.load_yaml(str(yaml_file), multi_document=True))
+    assert [doc["kind"] for doc in docs] == ["Namespace", "Subscription"]
+    docs[0]["kind"] = "OperatorGroup"
+    docs = templating.load_yaml(str(yaml_file), multi_document=True)
+    assert templating.get_n_document_from_yaml(docs, 0)["kind"] == "Namespace"
+
+
+def test_dump_data_to_new_temp_yaml():
+    """
+    Checking that dump_data_to_new_temp_yaml creates a yaml file with given
+    prefix and data.
+    """
+    data = [{"kind": "Namespace"}, {"kind": "Subscription"}]
+    temp_yaml = templating.dump_data_to_new_temp_yaml(data, "test_manifest")
+    try:
+        assert os.path.basename(temp_yaml).startswith("test_manifest")
+        assert list(templating.load_yaml(temp_yaml, multi_document=True)) == data
+    finally:
+        os.remove(temp_yaml)
@@ -2,6 +2,7 @@
 
 import logging
 from sys import platform
+from unittest.mock import patch
 
 import pytest
 
@@ -136,3 +137,50 @@ def test_run_cmd_simple_negative_ignoreerror(caplog):
     assert caplog.records[3].levelname == "DEBUG"
     return_code = 1 if platform == "darwin" else 2
     assert caplog.records[3].message == f"Command return code: {return_code}"
+
+
+def test_censor_values():
+    """
+    Checking that values of keys matching any of the censor patterns are
+    censored regardless of the case of the key, also in nested dictionaries.
+    """
+    data = {
+        "password": "foo",
+        "AWS_SECRET_ACCESS_KEY": "bar",
+        "auth": {"pull_secret_token": 123, "user": "admin"},
+        "platform": "aws",
+    }
+    assert utils.censor_values(data) == {
+        "password": "*****",
+        "AWS_SECRET_ACCESS_KEY": "*****",
+        "auth": {"pull_secret_token": "*****", "user": "admin"},
+        "platform": "aws",
+    }
+
+
+def test_wait_for_machineconfigpool_update_start_watch_fails():
+    """
+    Checking that wait_for_machineconfigpool_update_start samples the
+    machineconfigpools for the rest of the timeout when the watch fails.
+    """
+    pools = {
+        "items": [
+            {
+                "metadata": {"name": "worker"},
+                "status": {"conditions": [{"type": "Updating", "status": "True"}]},
+            }
+        ]
+    }
+    not_updating = {
+        "items": [
+            {
+                "metadata": {"name": "worker"},
+                "status": {"conditions": [{"type": "Updating", "status": "False"}]},
+            }
+        ]
+    }
+    with patch("ocs_ci.ocs.ocp.OCP.exec_oc_watch", return_value=iter([])), patch(
+        "ocs_ci.ocs.ocp.OCP.get", side_effect=[not_updating, pools]
+    ) as get:
+        assert utils.wait_for_machineconfigpool_update_start(timeout=5, sleep=0.1)
+    assert get.call_count == 2
@@ -60,6 +60,14 @@ failure = {}
 output = []
 unique_test_names = []
 
+# single regex matching any of the patterns of keys to censor
+CENSOR_KEYS_PATTERN = re.compile(
+    "|".join(
+        re.escape(pattern) for pattern in constants.config_keys_patterns_to_censor
+    ),
+    re.IGNORECASE,
+)
+
 
 # function for getting the clients
 def get_client_info(ceph_nodes, clients):
@@ -1565,17 +1573,17 @@ def ceph_health_check_base(namespace=None):
 
     """
     namespace = namespace or config.ENV_DATA["cluster_namespace"]
-    run_cmd(
+    # oc wait prints the names of the ready pods (pod/<name>), so no other oc
+    # command is needed to get the name of the tools pod
+    tools_pods = run_cmd(
         f"oc wait --for condition=ready pod "
         f"-l app=rook-ceph-tools "
         f"-n {namespace} "
-        f"--timeout=120s"
-    )
-    tools_pod = run_cmd(
-        f"oc -n {namespace} get pod -l 'app=rook-ceph-tools' "
-        f"-o jsonpath='{{.items[0].metadata.name}}'",
-        timeout=60,
+        f"--timeout=120s -o name"
     )
+    if not tools_pods:
+        raise CommandFailed(f"No ceph tools pod found in namespace {namespace}")
+    tools_pod = tools_pods.split()[0]
     health = run_cmd(f"oc -n {namespace} exec {tools_pod} -- ceph health")
     if health.strip() == "HEALTH_OK":
         log.info("Ceph cluster health is HEALTH_OK.")
@@ -1932,9 +1940,8 @@ def censor_values(data_to_censor):
         if isinstance(data_to_censor[key], dict):
             censor_values(data_to_censor[key])
         elif isinstance(data_to_censor[key], (str, int, float)):
-            for pattern in constants.config_keys_patterns_to_censor:
-                if pattern in key.lower():
-                    data_to_censor[key] = "*" * 5
+            if CENSOR_KEYS_PATTERN.search(key):
+                data_to_censor[key] = "*" * 5
     return data_to_censor
 
 
@@ -2699,6 +2706,58 @@ def wait_for_machineconfigpool_status(node_type, timeout=900):
         )
 
 
+def wait_for_machineconfigpool_update_start(timeout=60, sleep=5):
+    """
+    Wait for any machineconfigpool to start updating, e.g. after a change
+    which requires machineconfig update is applied.
+
+    Args:
+        timeout (int): Time in seconds to wait
+        sleep (int): Sampling time in seconds, used only when the watch ends
+            prematurely
+
+    Returns:
+        bool: True if some machineconfigpool started updating, False if the
+            timeout expired
+
+    """
+    # importing here to avoid dependencies
+    from ocs_ci.ocs import ocp
+
+    def get_updating_pool():
+        for pool in ocp_obj.get().get("items", []):
+            for condition in pool.get("status", {}).get("conditions", []):
+                if condition["type"] == "Updating" and condition["status"] == "True":
+                    return pool["metadata"]["name"]
+
+    log.info("Waiting for machineconfigpool to start updating")
+    ocp_obj = ocp.OCP(kind=constants.MACHINECONFIGPOOL)
+    start_time = time.time()
+    watch_cmd = (
+        "get machineconfigpool -o jsonpath='{.metadata.name} "
+        '{.status.conditions[?(@.type=="Updating")].status}{"\\n"}\''
+    )
+    for line in ocp_obj.exec_oc_watch(watch_cmd, timeout=timeout):
+        if line.endswith(" True"):
+            log.info(f"Machineconfigpool {line.split()[0]} started updating")
+            return True
+    # the watch ends prematurely only when it fails, sample the pools for the
+    # rest of the timeout then
+    remaining_timeout = timeout - (time.time() - start_time)
+    if remaining_timeout > 0:
+        try:
+            for pool_name in TimeoutSampler(
+                remaining_timeout, sleep, get_updating_pool
+            ):
+                if pool_name:
+                    log.info(f"Machineconfigpool {pool_name} started updating")
+                    return True
+        except TimeoutExpiredError:
+            pass
+    log.info(f"No machineconfigpool started updating in {timeout} seconds")
+    return False
+
+
 def configure_chrony_and_wait_for_machineconfig_status(
     node_type=constants.WORKER_MACHINE, timeout=900
 ):
@@ -1526,7 +1526,9 @@ def memory_leak_function(request):
         while get_flag_status() == "running":
             for worker in node.get_worker_nodes():
                 filename = f"/tmp/{worker}-top-output.txt"
-                top_cmd = f"debug nodes/{worker} -- chroot /host top -n 2 b"
+                # Full command lines, to identify the ceph-osd daemons by
+                # their OSD id
+                top_cmd = f"debug nodes/{worker} -- chroot /host top -n 2 -b -c -w 512"
                 with open("/tmp/file.txt", "w+") as temp:
                     temp.write(
                         str(oc.exec_oc_cmd(command=top_cmd, out_yaml_format=False))
@@ -225,13 +225,14 @@ def create_pvcs(request):
         Delete multiple PVCs
         """
         if hasattr(class_instance, "pvc_objs"):
+            backed_pv_names = []
             for pvc_obj in class_instance.pvc_objs:
                 pvc_obj.reload()
-                backed_pv_name = pvc_obj.backed_pv
+                backed_pv_names.append(pvc_obj.backed_pv)
                 pvc_obj.delete()
             for pvc_obj in class_instance.pvc_objs:
                 pvc_obj.ocp.wait_for_delete(pvc_obj.name)
-                helpers.validate_pv_delete(backed_pv_name)
+            helpers.validate_pv_delete(backed_pv_names)
 
     request.addfinalizer(finalizer)
 
@@ -61,7 +61,7 @@ class TestPvPool:
                 assert check_pv_backingstore_status(
                     bucketclass.backingstores[0],
                     config.ENV_DATA["cluster_namespace"],
-                    "`NO_CAPACITY`",
+                    "NO_CAPACITY",
                 ), "Failed to fill the bucket"
             awscli_pod_session.exec_cmd_on_pod("rm -f /tmp/testfile")
         try:
@@ -84,7 +84,7 @@ class TestPvPool:
             assert not check_pv_backingstore_status(
                 bucketclass.backingstores[0],
                 config.ENV_DATA["cluster_namespace"],
-                "`NO_CAPACITY`",
+                "NO_CAPACITY",
             ), "Failed to re-upload the removed file file"
 
     @pytest.mark.polarion_id("OCS-2333")